@@ -16,13 +16,13 @@ def update_advanced_graphs(figure, canvas, data):
     """Обновление продвинутых графиков"""
     figure.clear()
     
-    if not data.get('time') or len(data['time']) < FFT_MIN_POINTS:
+    if not len(data.get('time', ())) or len(data['time']) < FFT_MIN_POINTS:
         canvas.draw()
         return
     
     # 1. Спектральный анализ давления
     ax1 = figure.add_subplot(231)
-    if data.get('pressure'):
+    if len(data.get('pressure', ())):
         pressure = data['pressure']
         n = len(pressure)
         
@@ -53,7 +53,7 @@ def update_advanced_graphs(figure, canvas, data):
     
     # 2. Вейвлет-преобразование (упрощенное)
     ax2 = figure.add_subplot(232)
-    if data.get('pressure') and len(data['pressure']) > 20:
+    if len(data.get('pressure', ())) and len(data['pressure']) > 20:
         pressure = data['pressure']
         n = len(pressure)
         
@@ -90,7 +90,7 @@ def update_advanced_graphs(figure, canvas, data):
     
     # 3. График Пуанкаре
     ax3 = figure.add_subplot(233)
-    if data.get('pressure') and len(data['pressure']) > 100:
+    if len(data.get('pressure', ())) and len(data['pressure']) > 100:
         pressure = data['pressure']
         # Сечение Пуанкаре
         ax3.scatter(pressure[:-1], pressure[1:], alpha=0.5, s=10)
@@ -112,7 +112,7 @@ def update_advanced_graphs(figure, canvas, data):
     
     # 4. Фрактальная размерность (упрощенно)
     ax4 = figure.add_subplot(234)
-    if data.get('pressure') and len(data['pressure']) > 50:
+    if len(data.get('pressure', ())) and len(data['pressure']) > 50:
         # Упрощенный анализ фрактальной размерности
         pressure = data['pressure']
         n = len(pressure)
@@ -148,7 +148,7 @@ def update_advanced_graphs(figure, canvas, data):
     
     # 5. Анализ Херста (R/S анализ)
     ax5 = figure.add_subplot(235)
-    if data.get('pressure') and len(data['pressure']) > 100:
+    if len(data.get('pressure', ())) and len(data['pressure']) > 100:
         pressure = data['pressure']
         n = len(pressure)
         
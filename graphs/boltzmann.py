@@ -118,7 +118,7 @@ def update_boltzmann_graphs(figure, canvas, data):
     gravity_enabled = gravity_config.get('enabled', False)
     
     # Температура из симуляции (значение уже передаётся из симуляции)
-    T_sim = temperature_data[-1] if temperature_data else 1.0
+    T_sim = temperature_data[-1] if len(temperature_data) else 1.0
     
     # Извлекаем высоты (y координата, но инвертируем: h = max_y - y)
     heights = []
@@ -235,7 +235,7 @@ def update_boltzmann_graphs(figure, canvas, data):
     T_history = data.get('boltzmann_T_history', [])
     time_data = data.get('time', [])
     
-    if T_history and time_data and len(T_history) == len(time_data):
+    if T_history and len(time_data) and len(T_history) == len(time_data):
         ax4.plot(time_data, data.get('temperature', []), 
                  'b-', linewidth=2, label='T (симуляция)')
         ax4.plot(time_data, T_history, 'r--', linewidth=2, label='T (из Больцмана)')
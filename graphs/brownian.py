@@ -104,7 +104,7 @@ def update_brownian_graphs(figure, canvas, data):
     time_data = data.get('time', [])
     msd_data = data.get('msd', [])
     brownian_config = data.get('brownian_config', {})
-    temperature = data.get('temperature', [0])[-1] if data.get('temperature') else 1.0
+    temperature = data.get('temperature', [0])[-1] if len(data.get('temperature', ())) else 1.0
     
     # Параметры из конфигурации
     time_step = data.get('time_step', 0.1)
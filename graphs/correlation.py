@@ -12,13 +12,13 @@ def update_correlation_graphs(figure, canvas, data):
     """Обновление корреляционных графиков"""
     figure.clear()
     
-    if not data.get('pressure') or len(data['pressure']) < MIN_CORRELATION_POINTS:
+    if not len(data.get('pressure', ())) or len(data['pressure']) < MIN_CORRELATION_POINTS:
         canvas.draw()
         return
     
     # 1. Корреляция P и V
     ax1 = figure.add_subplot(231)
-    if data.get('volume') and data.get('pressure'):
+    if len(data.get('volume', ())) and len(data.get('pressure', ())):
         ax1.scatter(data['volume'], data['pressure'], alpha=0.6, s=20)
         
         # Линейная регрессия
@@ -47,7 +47,7 @@ def update_correlation_graphs(figure, canvas, data):
     
     # 2. Корреляция P и T
     ax2 = figure.add_subplot(232)
-    if data.get('temperature') and data.get('pressure'):
+    if len(data.get('temperature', ())) and len(data.get('pressure', ())):
         ax2.scatter(data['temperature'], data['pressure'], alpha=0.6, s=20, color='green')
     ax2.set_xlabel('Температура')
     ax2.set_ylabel('Давление')
@@ -56,7 +56,7 @@ def update_correlation_graphs(figure, canvas, data):
     
     # 3. Корреляция V и T
     ax3 = figure.add_subplot(233)
-    if data.get('temperature') and data.get('volume'):
+    if len(data.get('temperature', ())) and len(data.get('volume', ())):
         ax3.scatter(data['temperature'], data['volume'], alpha=0.6, s=20, color='red')
     ax3.set_xlabel('Температура')
     ax3.set_ylabel('Объем')
@@ -76,7 +76,7 @@ def update_correlation_graphs(figure, canvas, data):
     
     # 5. Взаимная корреляция P и V
     ax5 = figure.add_subplot(235)
-    if data.get('pressure') and data.get('volume') and len(data['pressure']) == len(data['volume']):
+    if len(data.get('pressure', ())) and len(data.get('volume', ())) and len(data['pressure']) == len(data['volume']):
         cross_corr = np.correlate(data['pressure'], data['volume'], mode='full')
         lags = np.arange(-len(data['pressure']) + 1, len(data['pressure']))
         ax5.plot(lags, cross_corr, 'orange', linewidth=2)
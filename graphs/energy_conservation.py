@@ -23,7 +23,7 @@ def update_energy_conservation_graphs(figure, canvas, data):
         potentials_config.get('dlvo', {}).get('enabled', False)
     )
     
-    if not kinetic_energy or not time:
+    if len(kinetic_energy) == 0 or len(time) == 0:
         canvas.draw()
         return
     
@@ -31,7 +31,7 @@ def update_energy_conservation_graphs(figure, canvas, data):
     time = np.array(time)
     
     # Обработка потенциальной энергии
-    if potential_energy_history and len(potential_energy_history) == len(kinetic_energy):
+    if len(potential_energy_history) and len(potential_energy_history) == len(kinetic_energy):
         potential_energy = np.array(potential_energy_history)
         total_energy = kinetic_energy + potential_energy
     else:
@@ -129,7 +129,7 @@ def update_entropy_graphs(figure, canvas, data):
     mass = data.get('particle_mass', 1.0)
     corner_start = data.get('corner_start', False)
     
-    T = temperature[-1] * 100 if temperature else 1.0
+    T = temperature[-1] * 100 if len(temperature) else 1.0
     volume = container_width * container_height
     
     # Текущая энтропия
@@ -74,11 +74,11 @@ def mixing_time_estimate(correlations, time_data, threshold=0.1):
     if len(correlations) < 5 or len(time_data) != len(correlations):
         return None
     
-    correlations = np.array(correlations)
+    correlations = np.asarray(correlations, dtype=float)
     
-    # Ищем момент, когда |корреляция| < threshold
+    # Ищем момент, когда |корреляция| < threshold (NaN — нет данных)
     for i, corr in enumerate(correlations):
-        if corr is not None and abs(corr) < threshold:
+        if np.isfinite(corr) and abs(corr) < threshold:
             return time_data[i]
     
     return None  # Ещё не достигнуто
@@ -96,7 +96,7 @@ def update_ergodic_graphs(figure, canvas, data):
     ensemble_averages_history = data.get('ensemble_averages_history', [])
     initial_velocities = data.get('initial_velocities', [])
     correlations_history = data.get('correlations_history', [])
-    particle_velocity_histories = data.get('particle_velocity_histories', {})
+    particle_velocity_histories = data.get('particle_velocity_histories')
     
     n_particles = data.get('n_particles', len(velocities) if velocities else 100)
     
@@ -130,14 +130,15 @@ def update_ergodic_graphs(figure, canvas, data):
     ax2 = figure.add_subplot(232)
     
     if len(correlations_history) > 1:
-        time_plot = time_data[:len(correlations_history)]
+        corr_arr = np.asarray(correlations_history, dtype=float)
+        time_plot = np.asarray(time_data)[:len(corr_arr)]
         
-        # Фильтруем None
-        valid_mask = [c is not None for c in correlations_history]
-        valid_time = [t for t, v in zip(time_plot, valid_mask) if v]
-        valid_corr = [c for c in correlations_history if c is not None]
+        # Фильтруем NaN (точки без определённой корреляции)
+        valid_mask = np.isfinite(corr_arr)
+        valid_time = time_plot[valid_mask]
+        valid_corr = corr_arr[valid_mask]
         
-        if valid_corr:
+        if len(valid_corr):
             ax2.plot(valid_time, valid_corr, 'b-', linewidth=2, label='Корреляция')
             ax2.axhline(y=0, color='r', linestyle='--', linewidth=1.5, alpha=0.7)
             ax2.axhline(y=0.1, color='g', linestyle=':', linewidth=1, label='Порог (0.1)')
@@ -169,14 +170,14 @@ def update_ergodic_graphs(figure, canvas, data):
     # 3. Распределение временных средних по частицам
     ax3 = figure.add_subplot(233)
     
-    if particle_velocity_histories:
-        # Вычисляем временное среднее для каждой частицы
-        time_avgs = []
-        for particle_id, history in particle_velocity_histories.items():
-            if len(history) > 10:
-                time_avgs.append(np.mean(history))
+    if particle_velocity_histories is not None and particle_velocity_histories.size:
+        # Временное среднее каждой частицы — одна редукция по строкам
+        if particle_velocity_histories.shape[1] > 10:
+            time_avgs = particle_velocity_histories.mean(axis=1)
+        else:
+            time_avgs = np.empty(0)
         
-        if time_avgs:
+        if len(time_avgs):
             ax3.hist(time_avgs, bins=20, density=True, alpha=0.7, 
                      color='blue', edgecolor='black', label='⟨v⟩_t по частицам')
             
@@ -253,12 +254,14 @@ def update_ergodic_graphs(figure, canvas, data):
         rel_diff = np.abs(recent_time - recent_ens) / (recent_ens + 1e-10)
         convergence_achieved = np.mean(rel_diff) < 0.1  # 10% точность
     
-    if correlations_history:
+    if len(correlations_history):
         mixing_time = mixing_time_estimate(correlations_history, time_data[:len(correlations_history)])
     
-    current_time_avg = time_averages_history[-1] if time_averages_history else None
-    current_ens_avg = ensemble_averages_history[-1] if ensemble_averages_history else None
-    current_corr = correlations_history[-1] if correlations_history else None
+    current_time_avg = time_averages_history[-1] if len(time_averages_history) else None
+    current_ens_avg = ensemble_averages_history[-1] if len(ensemble_averages_history) else None
+    current_corr = correlations_history[-1] if len(correlations_history) else None
+    if current_corr is not None and not np.isfinite(current_corr):
+        current_corr = None
     
     stats_text = f"""ЭРГОДИЧЕСКАЯ ГИПОТЕЗА
 
@@ -500,6 +500,13 @@ class GraphWindow(QDialog):
                 f"Сохранено файлов: {len(saved_files)}\nПапка: {self._save_folder}"
             )
 
+    def showEvent(self, event):
+        """Обработка показа окна - переподключаем сигнал после закрытия"""
+        if not self._connected:
+            self.simulation.data_updated.connect(self.on_data_updated)
+            self._connected = True
+        super().showEvent(event)
+
     def closeEvent(self, event):
         """Обработка закрытия окна - отключаем сигнал для предотвращения лагов"""
         if self._connected:
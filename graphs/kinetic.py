@@ -9,13 +9,13 @@ def update_kinetic_graphs(figure, canvas, data):
     """Обновление кинетических графиков"""
     figure.clear()
     
-    if not data.get('time'):
+    if not len(data.get('time', ())):
         canvas.draw()
         return
     
     # 1. Средняя скорость от времени
     ax1 = figure.add_subplot(221)
-    if data.get('time') and data.get('avg_velocity'):
+    if len(data.get('time', ())) and len(data.get('avg_velocity', ())):
         try:
             t = data['time']
             v = data['avg_velocity']
@@ -31,13 +31,11 @@ def update_kinetic_graphs(figure, canvas, data):
     
     # 2. Средняя длина свободного пробега
     ax2 = figure.add_subplot(222)
-    if data.get('time'):
+    if len(data.get('time', ())):
         has_plotted = False
         times = data['time']
         # helper to safely plot series matching the time axis length
         def safe_plot(x, y, *args, **kwargs):
-            if not x or not y:
-                return False
             lx = len(x)
             ly = len(y)
             if lx == 0 or ly == 0:
@@ -50,19 +48,19 @@ def update_kinetic_graphs(figure, canvas, data):
                 return False
 
         # plot available series (use safe_plot to avoid shape mismatches)
-        if data.get('mean_free_path'):
+        if len(data.get('mean_free_path', ())):
             series = data['mean_free_path']
             if safe_plot(times, series, 'r-', linewidth=2, label='Эмпирическое'):
                 has_plotted = True
-        if data.get('mean_free_path_theoretical'):
+        if len(data.get('mean_free_path_theoretical', ())):
             series_t = data['mean_free_path_theoretical']
             if safe_plot(times, series_t, 'k--', linewidth=1.5, label='Теоретическое'):
                 has_plotted = True
         # По умолчанию не рисуем эффект. линию — рисуем только если ошибка эмпирич. vs теор. > 10%
         draw_eff = False
         try:
-            last_emp = data['mean_free_path'][-1] if data.get('mean_free_path') else None
-            last_pp = data['mean_free_path_theoretical'][-1] if data.get('mean_free_path_theoretical') else None
+            last_emp = data['mean_free_path'][-1] if len(data.get('mean_free_path', ())) else None
+            last_pp = data['mean_free_path_theoretical'][-1] if len(data.get('mean_free_path_theoretical', ())) else None
             if last_emp is not None and last_pp and last_pp != 0 and math.isfinite(last_emp) and math.isfinite(last_pp):
                 rel_pp = abs(last_emp - last_pp) / last_pp
                 if rel_pp > 0.10:
@@ -70,11 +68,11 @@ def update_kinetic_graphs(figure, canvas, data):
         except Exception:
             draw_eff = False
 
-        if draw_eff and data.get('mean_free_path_eff'):
+        if draw_eff and len(data.get('mean_free_path_eff', ())):
             series_eff = data['mean_free_path_eff']
             if safe_plot(times, series_eff, color='tab:green', linewidth=1.8, linestyle='-.', label='Эфф. mfp'):
                 has_plotted = True
-        if data.get('mean_free_path_roll100'):
+        if len(data.get('mean_free_path_roll100', ())):
             series_r = data['mean_free_path_roll100']
             if safe_plot(times, series_r, color='tab:blue', linewidth=1.8, label='Скольз.100'):
                 has_plotted = True
@@ -87,24 +85,24 @@ def update_kinetic_graphs(figure, canvas, data):
         wall = None
         eff = None
         try:
-            if data.get('mean_free_path'):
+            if len(data.get('mean_free_path', ())):
                 emp = data['mean_free_path'][-1]
                 info_lines.append(f"Эмпирич.: {emp:.3g}")
         except Exception:
             pass
         try:
-            if data.get('mean_free_path_theoretical'):
+            if len(data.get('mean_free_path_theoretical', ())):
                 pp = data['mean_free_path_theoretical'][-1]
                 info_lines.append(f"По формуле: {pp:.3g}")
         except Exception:
             pass
         try:
-            if data.get('mean_free_path_wall'):
+            if len(data.get('mean_free_path_wall', ())):
                 wall = data['mean_free_path_wall'][-1]
         except Exception:
             wall = None
         try:
-            if data.get('mean_free_path_eff'):
+            if len(data.get('mean_free_path_eff', ())):
                 eff = data['mean_free_path_eff'][-1]
         except Exception:
             eff = None
@@ -152,7 +150,7 @@ def update_kinetic_graphs(figure, canvas, data):
     
     # 3. Частота столкновений
     ax3 = figure.add_subplot(223)
-    if data.get('time') and data.get('collision_rate'):
+    if len(data.get('time', ())) and len(data.get('collision_rate', ())):
         try:
             t = data['time']
             s = data['collision_rate']
@@ -168,7 +166,7 @@ def update_kinetic_graphs(figure, canvas, data):
     
     # 4. Скорость наиболее вероятной частицы
     ax4 = figure.add_subplot(224)
-    if data.get('time') and data.get('avg_velocity'):
+    if len(data.get('time', ())) and len(data.get('avg_velocity', ())):
         try:
             t = data['time']
             avg_arr = np.array(data['avg_velocity'])
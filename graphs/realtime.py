@@ -21,13 +21,13 @@ def update_realtime_graphs(figure, canvas, data):
     """Обновление графиков реального времени"""
     figure.clear()
     
-    if not data.get('time'):
+    if not len(data.get('time', ())):
         canvas.draw()
         return
     
     # 1. График реального времени давления
     ax1 = figure.add_subplot(231)
-    if data.get('time') and data.get('pressure'):
+    if len(data.get('time', ())) and len(data.get('pressure', ())):
         ax1.plot(data['time'][-REALTIME_POINTS_LIMIT:], data['pressure'][-REALTIME_POINTS_LIMIT:], 'b-', linewidth=2)
         ax1.set_xlabel('Время')
         ax1.set_ylabel('Давление')
@@ -36,7 +36,7 @@ def update_realtime_graphs(figure, canvas, data):
     
     # 2. График реального времени температуры
     ax2 = figure.add_subplot(232)
-    if data.get('time') and data.get('temperature'):
+    if len(data.get('time', ())) and len(data.get('temperature', ())):
         ax2.plot(data['time'][-REALTIME_POINTS_LIMIT:], data['temperature'][-REALTIME_POINTS_LIMIT:], 'r-', linewidth=2)
         ax2.set_xlabel('Время')
         ax2.set_ylabel('Температура')
@@ -45,7 +45,7 @@ def update_realtime_graphs(figure, canvas, data):
     
     # 3. График реального времени объема
     ax3 = figure.add_subplot(233)
-    if data.get('time') and data.get('volume'):
+    if len(data.get('time', ())) and len(data.get('volume', ())):
         ax3.plot(data['time'][-REALTIME_POINTS_LIMIT:], data['volume'][-REALTIME_POINTS_LIMIT:], 'g-', linewidth=2)
         ax3.set_xlabel('Время')
         ax3.set_ylabel('Объем')
@@ -54,7 +54,7 @@ def update_realtime_graphs(figure, canvas, data):
     
     # 4. График реального времени средней скорости
     ax4 = figure.add_subplot(234)
-    if data.get('time') and data.get('avg_velocity'):
+    if len(data.get('time', ())) and len(data.get('avg_velocity', ())):
         ax4.plot(data['time'][-REALTIME_POINTS_LIMIT:], data['avg_velocity'][-REALTIME_POINTS_LIMIT:], 'orange', linewidth=2)
         ax4.set_xlabel('Время')
         ax4.set_ylabel('Средняя скорость')
@@ -63,8 +63,8 @@ def update_realtime_graphs(figure, canvas, data):
     
     # 5. Комбинированный график
     ax5 = figure.add_subplot(235)
-    if (data.get('time') and data.get('pressure') and 
-        data.get('temperature') and data.get('volume')):
+    if (len(data.get('time', ())) and len(data.get('pressure', ())) and 
+        len(data.get('temperature', ())) and len(data.get('volume', ()))):
         
         time_short = data['time'][-COMBINED_GRAPH_POINTS:]
         
@@ -102,7 +102,7 @@ def update_realtime_graphs(figure, canvas, data):
     ax6.set_title('Текущий режим')
     
     # Добавляем текст с последними значениями
-    if data.get('pressure') and data.get('temperature') and data.get('volume'):
+    if len(data.get('pressure', ())) and len(data.get('temperature', ())) and len(data.get('volume', ())):
         info_text = f"""
         Последние значения:
         Давление: {data['pressure'][-1]:.3f}
@@ -10,13 +10,13 @@ def update_thermodynamic_graphs(figure, canvas, data):
     """Обновление термодинамических графиков"""
     figure.clear()
     
-    if not data.get('time'):
+    if not len(data.get('time', ())):
         canvas.draw()
         return
     
     # 1. P-T диаграмма
     ax1 = figure.add_subplot(331)
-    if data.get('temperature') and data.get('pressure'):
+    if len(data.get('temperature', ())) and len(data.get('pressure', ())):
         ax1.plot(data['temperature'], data['pressure'], 'b-', linewidth=2)
         ax1.scatter(data['temperature'][-1:], data['pressure'][-1:], color='red', s=50)
     ax1.set_xlabel('Температура (E)')
@@ -26,7 +26,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 2. P-V диаграмма
     ax2 = figure.add_subplot(332)
-    if data.get('volume') and data.get('pressure'):
+    if len(data.get('volume', ())) and len(data.get('pressure', ())):
         ax2.plot(data['volume'], data['pressure'], 'g-', linewidth=2)
         ax2.scatter(data['volume'][-1:], data['pressure'][-1:], color='red', s=50)
     ax2.set_xlabel('Объем')
@@ -36,7 +36,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 3. V-T диаграмма
     ax3 = figure.add_subplot(333)
-    if data.get('temperature') and data.get('volume'):
+    if len(data.get('temperature', ())) and len(data.get('volume', ())):
         ax3.plot(data['temperature'], data['volume'], 'r-', linewidth=2)
         ax3.scatter(data['temperature'][-1:], data['volume'][-1:], color='red', s=50)
     ax3.set_xlabel('Температура (E)')
@@ -46,7 +46,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 4. P(t)
     ax4 = figure.add_subplot(334)
-    if data.get('time') and data.get('pressure'):
+    if len(data.get('time', ())) and len(data.get('pressure', ())):
         ax4.plot(data['time'], data['pressure'], 'purple', linewidth=2)
     ax4.set_xlabel('Время')
     ax4.set_ylabel('Давление')
@@ -55,7 +55,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 5. V(t)
     ax5 = figure.add_subplot(335)
-    if data.get('time') and data.get('volume'):
+    if len(data.get('time', ())) and len(data.get('volume', ())):
         ax5.plot(data['time'], data['volume'], 'orange', linewidth=2)
     ax5.set_xlabel('Время')
     ax5.set_ylabel('Объем')
@@ -64,7 +64,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 6. T(t)
     ax6 = figure.add_subplot(336)
-    if data.get('time') and data.get('temperature'):
+    if len(data.get('time', ())) and len(data.get('temperature', ())):
         ax6.plot(data['time'], data['temperature'], 'brown', linewidth=2)
     ax6.set_xlabel('Время')
     ax6.set_ylabel('Температура (E)')
@@ -73,7 +73,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 7. Параметрический график (цвет = время)
     ax7 = figure.add_subplot(337)
-    if data.get('time') and data.get('pressure') and data.get('volume'):
+    if len(data.get('time', ())) and len(data.get('pressure', ())) and len(data.get('volume', ())):
         n = min(len(data['time']), len(data['pressure']), len(data['volume']))
         scatter = ax7.scatter(data['volume'][:n], data['pressure'][:n], 
                             c=data['time'][:n], cmap='viridis', alpha=0.6, s=20)
@@ -85,7 +85,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 8. Энергия от времени
     ax8 = figure.add_subplot(338)
-    if data.get('time') and data.get('kinetic_energy'):
+    if len(data.get('time', ())) and len(data.get('kinetic_energy', ())):
         ax8.plot(data['time'], data['kinetic_energy'], 'magenta', linewidth=2)
     ax8.set_xlabel('Время')
     ax8.set_ylabel('Кинетическая энергия')
@@ -94,7 +94,7 @@ def update_thermodynamic_graphs(figure, canvas, data):
     
     # 9. Проверка уравнения состояния PV = NkT (для 2D: PV = E_kin)
     ax9 = figure.add_subplot(339)
-    if data.get('time') and data.get('pressure') and data.get('volume') and data.get('kinetic_energy'):
+    if len(data.get('time', ())) and len(data.get('pressure', ())) and len(data.get('volume', ())) and len(data.get('kinetic_energy', ())):
         # В 2D идеальном газе: PV = NkT (т.к. 2 степени свободы)
         # Давление и объём уже в согласованных единицах симуляции
         
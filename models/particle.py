@@ -3,10 +3,11 @@
 """
 import math
 import random
-from collections import deque
 from PyQt5.QtGui import QColor
 from typing import TYPE_CHECKING, Optional
 
+from schemas import MoleculeType
+
 if TYPE_CHECKING:
     from schemas import AppConfig
 
@@ -36,7 +37,7 @@ class GasParticle:
         self.I = 1.0  # Момент инерции
         
         # Параметры молекулярной структуры
-        self.molecule_type = "monatomic"
+        self.molecule_type = MoleculeType.MONATOMIC
         self.geometry = "linear"
         self.atom_count = 1
         self.bond_length = 0.5
@@ -46,7 +47,6 @@ class GasParticle:
         # Получаем параметры из конфигурации
         if config is not None:
             default_color = config.particle_colors.default_color
-            trajectory_length = config.particles.trajectory_max_length
             
             # Загружаем параметры молекулы
             if hasattr(config, 'molecule'):
@@ -60,7 +60,7 @@ class GasParticle:
                 self.show_orientation = mol.show_orientation
                 
                 # Инициализация угловой скорости
-                if self.rotation_enabled and self.molecule_type != "monatomic":
+                if self.rotation_enabled and self.molecule_type != MoleculeType.MONATOMIC:
                     if mol.initial_angular_velocity > 0:
                         # Случайное направление вращения
                         self.omega = mol.initial_angular_velocity * random.choice([-1, 1])
@@ -73,11 +73,8 @@ class GasParticle:
                         self.omega = random.gauss(0, sigma_omega)
         else:
             default_color = (255, 0, 0)  # Красный по умолчанию
-            trajectory_length = 100
         
         self.color = QColor(*default_color)
-        self.trajectory = deque(maxlen=trajectory_length)  # Для траектории
-        self.trajectory.append((x, y))
     
     @property
     def vx(self) -> float:
@@ -99,7 +96,7 @@ class GasParticle:
         
         Возвращает 0 для моноатомных молекул или если вращение отключено.
         """
-        if not self.rotation_enabled or self.molecule_type == "monatomic":
+        if not self.rotation_enabled or self.molecule_type == MoleculeType.MONATOMIC:
             return 0.0
         return 0.5 * self.I * self.omega ** 2
     
@@ -116,13 +113,10 @@ class GasParticle:
         Обновление угла ориентации за шаг времени dt.
         theta += omega * dt
         """
-        if self.rotation_enabled and self.molecule_type != "monatomic":
-            self.theta += self.omega * dt
-            # Нормализация угла в диапазон [-π, π]
-            while self.theta > math.pi:
-                self.theta -= 2 * math.pi
-            while self.theta < -math.pi:
-                self.theta += 2 * math.pi
+        if self.rotation_enabled and self.molecule_type != MoleculeType.MONATOMIC:
+            # Нормализация в [-π, π] одним вызовом libm вместо
+            # цикла с переменным числом итераций
+            self.theta = math.remainder(self.theta + self.omega * dt, math.tau)
     
     def get_atom_positions(self) -> list:
         """
@@ -197,6 +191,6 @@ class GasParticle:
         - Моноатомные или без вращения: 2 (x, y)
         - С вращением: 3 (x, y, theta)
         """
-        if self.rotation_enabled and self.molecule_type != "monatomic":
+        if self.rotation_enabled and self.molecule_type != MoleculeType.MONATOMIC:
             return 3
         return 2
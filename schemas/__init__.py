@@ -4,206 +4,66 @@ Pydantic-схемы конфигурации для симуляции газа.
 Структура:
 - AppConfig - главная конфигурация, агрегирует все секции
 - Каждая секция в отдельном модуле для чистоты кода
+
+Подмодули импортируются лениво (PEP 562): построение pydantic-моделей
+доминирует во времени импорта, поэтому каждый класс загружается только
+при первом обращении к нему.
 """
-from pydantic import Field
-from pathlib import Path
-from typing import Optional
+import importlib
+
+# Имя -> подмодуль, в котором оно определено
+_LAZY = {
+    'ConfigSection': 'schemas.base',
+    'FrozenConfigSection': 'schemas.base',
+    'RGBColor': 'schemas.base',
+    'save_config_to_file': 'schemas.base',
+    'load_config_from_file': 'schemas.base',
+    'SimulationWindowConfig': 'schemas.simulation',
+    'TimeConfig': 'schemas.simulation',
+    'StateChangeConfig': 'schemas.simulation',
+    'CollisionConfig': 'schemas.simulation',
+    'GravityConfig': 'schemas.physics',
+    'BrownianConfig': 'schemas.physics',
+    'BrownianMode': 'schemas.physics',
+    'ExperimentConfig': 'schemas.physics',
+    'LennardJonesConfig': 'schemas.physics',
+    'MorseConfig': 'schemas.physics',
+    'DLVOConfig': 'schemas.physics',
+    'InteractionPotentialsConfig': 'schemas.physics',
+    'ParticlesConfig': 'schemas.particles',
+    'MoleculeConfig': 'schemas.particles',
+    'MoleculeType': 'schemas.particles',
+    'MoleculePreset': 'schemas.particles',
+    'MainWindowConfig': 'schemas.ui',
+    'GraphWindowConfig': 'schemas.ui',
+    'LoggingConfig': 'schemas.ui',
+    'GraphUpdateConfig': 'schemas.graphs',
+    'StatisticalConfig': 'schemas.graphs',
+    'SpectralConfig': 'schemas.graphs',
+    'FractalConfig': 'schemas.graphs',
+    'CorrelationConfig': 'schemas.graphs',
+    'ParticleColorsConfig': 'schemas.colors',
+    'BorderColorsConfig': 'schemas.colors',
+    'UIColorsConfig': 'schemas.colors',
+    'ModeColorsConfig': 'schemas.colors',
+    'ModeIndicatorColorsConfig': 'schemas.colors',
+    'AppConfig': 'schemas.app',
+}
 
-from .base import ConfigSection, save_config_to_file, load_config_from_file
-from .simulation import SimulationWindowConfig, TimeConfig, StateChangeConfig, CollisionConfig
-from .particles import ParticlesConfig, MoleculeConfig
-from .physics import (
-    GravityConfig, 
-    BrownianConfig, 
-    ExperimentConfig,
-    LennardJonesConfig,
-    MorseConfig,
-    DLVOConfig,
-    InteractionPotentialsConfig
-)
-from .ui import MainWindowConfig, GraphWindowConfig, LoggingConfig
-from .graphs import (
-    GraphUpdateConfig, 
-    StatisticalConfig, 
-    SpectralConfig, 
-    FractalConfig, 
-    CorrelationConfig
-)
-from .colors import (
-    ParticleColorsConfig,
-    BorderColorsConfig,
-    UIColorsConfig,
-    ModeColorsConfig,
-    ModeIndicatorColorsConfig
-)
+__all__ = list(_LAZY)
 
 
-class AppConfig(ConfigSection):
-    """
-    Главная конфигурация приложения.
-    Агрегирует все секции конфигурации.
-    """
-    
-    # Симуляция
-    simulation_window: SimulationWindowConfig = Field(
-        default_factory=SimulationWindowConfig,
-        title="Окно симуляции"
-    )
-    time: TimeConfig = Field(
-        default_factory=TimeConfig,
-        title="Время"
-    )
-    state_change: StateChangeConfig = Field(
-        default_factory=StateChangeConfig,
-        title="Изменение состояния"
-    )
-    collision: CollisionConfig = Field(
-        default_factory=CollisionConfig,
-        title="Столкновения"
-    )
-    
-    # Физика
-    gravity: GravityConfig = Field(
-        default_factory=GravityConfig,
-        title="Гравитация"
-    )
-    brownian: BrownianConfig = Field(
-        default_factory=BrownianConfig,
-        title="Броуновское движение"
-    )
-    experiment: ExperimentConfig = Field(
-        default_factory=ExperimentConfig,
-        title="Экспериментальные режимы"
-    )
-    
-    # Потенциалы взаимодействия
-    interaction_potentials: InteractionPotentialsConfig = Field(
-        default_factory=InteractionPotentialsConfig,
-        title="Потенциалы взаимодействия",
-        description="Леннард-Джонс, Морзе, ДЛФО"
-    )
-    
-    # Частицы
-    particles: ParticlesConfig = Field(
-        default_factory=ParticlesConfig,
-        title="Частицы"
-    )
-    
-    # Молекулярная структура
-    molecule: MoleculeConfig = Field(
-        default_factory=MoleculeConfig,
-        title="Структура молекулы"
-    )
-    
-    # UI
-    main_window: MainWindowConfig = Field(
-        default_factory=MainWindowConfig,
-        title="Главное окно"
-    )
-    graph_window: GraphWindowConfig = Field(
-        default_factory=GraphWindowConfig,
-        title="Окно графиков"
-    )
-    logging: LoggingConfig = Field(
-        default_factory=LoggingConfig,
-        title="Логирование"
-    )
-    
-    # Графики
-    graph_update: GraphUpdateConfig = Field(
-        default_factory=GraphUpdateConfig,
-        title="Обновление графиков"
-    )
-    statistical: StatisticalConfig = Field(
-        default_factory=StatisticalConfig,
-        title="Статистика"
-    )
-    spectral: SpectralConfig = Field(
-        default_factory=SpectralConfig,
-        title="Спектральный анализ"
-    )
-    fractal: FractalConfig = Field(
-        default_factory=FractalConfig,
-        title="Фрактальный анализ"
-    )
-    correlation: CorrelationConfig = Field(
-        default_factory=CorrelationConfig,
-        title="Корреляции"
-    )
-    
-    # Цвета
-    particle_colors: ParticleColorsConfig = Field(
-        default_factory=ParticleColorsConfig,
-        title="Цвета частиц"
-    )
-    border_colors: BorderColorsConfig = Field(
-        default_factory=BorderColorsConfig,
-        title="Цвета границ"
-    )
-    ui_colors: UIColorsConfig = Field(
-        default_factory=UIColorsConfig,
-        title="Цвета UI"
-    )
-    mode_colors: ModeColorsConfig = Field(
-        default_factory=ModeColorsConfig,
-        title="Цвета режимов"
-    )
-    mode_indicator_colors: ModeIndicatorColorsConfig = Field(
-        default_factory=ModeIndicatorColorsConfig,
-        title="Цвета индикаторов"
-    )
-    
-    def save(self, filepath: Optional[Path] = None) -> None:
-        """Сохранить конфигурацию в файл."""
-        if filepath is None:
-            filepath = Path(__file__).parent.parent / "saved_config.json"
-        save_config_to_file(self, filepath)
-    
-    @classmethod
-    def load(cls, filepath: Optional[Path] = None) -> 'AppConfig':
-        """Загрузить конфигурацию из файла."""
-        if filepath is None:
-            filepath = Path(__file__).parent.parent / "saved_config.json"
-        if not filepath.exists():
-            return cls()  # Возвращаем дефолтную конфигурацию
-        return load_config_from_file(cls, filepath)
-    
-    @classmethod
-    def get_default(cls) -> 'AppConfig':
-        """Получить конфигурацию с дефолтными значениями."""
-        return cls()
+def __getattr__(name):
+    """Ленивая загрузка классов конфигурации при первом обращении."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    obj = getattr(module, name)
+    globals()[name] = obj  # Кэшируем для последующих обращений
+    return obj
 
 
-# Экспортируем все классы
-__all__ = [
-    'AppConfig',
-    'ConfigSection',
-    'SimulationWindowConfig',
-    'TimeConfig', 
-    'StateChangeConfig',
-    'CollisionConfig',
-    'GravityConfig',
-    'BrownianConfig',
-    'ExperimentConfig',
-    'LennardJonesConfig',
-    'MorseConfig',
-    'DLVOConfig',
-    'InteractionPotentialsConfig',
-    'ParticlesConfig',
-    'MoleculeConfig',
-    'MainWindowConfig',
-    'GraphWindowConfig',
-    'LoggingConfig',
-    'GraphUpdateConfig',
-    'StatisticalConfig',
-    'SpectralConfig',
-    'FractalConfig',
-    'CorrelationConfig',
-    'ParticleColorsConfig',
-    'BorderColorsConfig',
-    'UIColorsConfig',
-    'ModeColorsConfig',
-    'ModeIndicatorColorsConfig',
-    'save_config_to_file',
-    'load_config_from_file',
-]
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
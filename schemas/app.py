@@ -0,0 +1,181 @@
+"""
+Главная конфигурация приложения.
+"""
+from pathlib import Path
+from typing import Optional
+
+from .base import ConfigSection, F, save_config_to_file, load_config_from_file
+from .simulation import SimulationWindowConfig, TimeConfig, StateChangeConfig, CollisionConfig
+from .particles import ParticlesConfig, MoleculeConfig
+from .physics import (
+    GravityConfig,
+    BrownianConfig,
+    ExperimentConfig,
+    InteractionPotentialsConfig
+)
+from .ui import MainWindowConfig, GraphWindowConfig, LoggingConfig
+from .graphs import (
+    GraphUpdateConfig,
+    StatisticalConfig,
+    SpectralConfig,
+    FractalConfig,
+    CorrelationConfig
+)
+from .colors import (
+    ParticleColorsConfig,
+    BorderColorsConfig,
+    UIColorsConfig,
+    ModeColorsConfig,
+    ModeIndicatorColorsConfig
+)
+
+
+# Кэш дефолтной конфигурации: полная сборка дерева моделей дорогая,
+# выполняем её не чаще одного раза на процесс (см. get_default)
+_DEFAULT_CONFIG = None
+
+
+class AppConfig(ConfigSection):
+    """
+    Главная конфигурация приложения.
+    Агрегирует все секции конфигурации.
+    """
+
+    # Симуляция
+    simulation_window: SimulationWindowConfig = F(
+        default_factory=SimulationWindowConfig,
+        title="Окно симуляции"
+    )
+    time: TimeConfig = F(
+        default_factory=TimeConfig,
+        title="Время"
+    )
+    state_change: StateChangeConfig = F(
+        default_factory=StateChangeConfig,
+        title="Изменение состояния"
+    )
+    collision: CollisionConfig = F(
+        default_factory=CollisionConfig,
+        title="Столкновения"
+    )
+
+    # Физика
+    gravity: GravityConfig = F(
+        default_factory=GravityConfig,
+        title="Гравитация"
+    )
+    brownian: BrownianConfig = F(
+        default_factory=BrownianConfig,
+        title="Броуновское движение"
+    )
+    experiment: ExperimentConfig = F(
+        default_factory=ExperimentConfig,
+        title="Экспериментальные режимы"
+    )
+
+    # Потенциалы взаимодействия
+    interaction_potentials: InteractionPotentialsConfig = F(
+        default_factory=InteractionPotentialsConfig,
+        title="Потенциалы взаимодействия",
+        description="Леннард-Джонс, Морзе, ДЛФО"
+    )
+
+    # Частицы
+    particles: ParticlesConfig = F(
+        default_factory=ParticlesConfig,
+        title="Частицы"
+    )
+
+    # Молекулярная структура
+    molecule: MoleculeConfig = F(
+        default_factory=MoleculeConfig,
+        title="Структура молекулы"
+    )
+
+    # UI
+    main_window: MainWindowConfig = F(
+        default_factory=MainWindowConfig,
+        title="Главное окно"
+    )
+    graph_window: GraphWindowConfig = F(
+        default_factory=GraphWindowConfig,
+        title="Окно графиков"
+    )
+    logging: LoggingConfig = F(
+        default_factory=LoggingConfig,
+        title="Логирование"
+    )
+
+    # Графики
+    graph_update: GraphUpdateConfig = F(
+        default_factory=GraphUpdateConfig,
+        title="Обновление графиков"
+    )
+    statistical: StatisticalConfig = F(
+        default_factory=StatisticalConfig,
+        title="Статистика"
+    )
+    spectral: SpectralConfig = F(
+        default_factory=SpectralConfig,
+        title="Спектральный анализ"
+    )
+    fractal: FractalConfig = F(
+        default_factory=FractalConfig,
+        title="Фрактальный анализ"
+    )
+    correlation: CorrelationConfig = F(
+        default_factory=CorrelationConfig,
+        title="Корреляции"
+    )
+
+    # Цвета
+    particle_colors: ParticleColorsConfig = F(
+        default_factory=ParticleColorsConfig,
+        title="Цвета частиц"
+    )
+    border_colors: BorderColorsConfig = F(
+        default_factory=BorderColorsConfig,
+        title="Цвета границ"
+    )
+    ui_colors: UIColorsConfig = F(
+        default_factory=UIColorsConfig,
+        title="Цвета UI"
+    )
+    mode_colors: ModeColorsConfig = F(
+        default_factory=ModeColorsConfig,
+        title="Цвета режимов"
+    )
+    mode_indicator_colors: ModeIndicatorColorsConfig = F(
+        default_factory=ModeIndicatorColorsConfig,
+        title="Цвета индикаторов"
+    )
+
+    def save(self, filepath: Optional[Path] = None) -> None:
+        """Сохранить конфигурацию в файл."""
+        if filepath is None:
+            filepath = Path(__file__).parent.parent / "saved_config.json"
+        save_config_to_file(self, filepath)
+
+    @classmethod
+    def load(cls, filepath: Optional[Path] = None) -> 'AppConfig':
+        """Загрузить конфигурацию из файла."""
+        if filepath is None:
+            filepath = Path(__file__).parent.parent / "saved_config.json"
+        if not filepath.exists():
+            return cls()  # Возвращаем дефолтную конфигурацию
+        return load_config_from_file(cls, filepath)
+
+    @classmethod
+    def get_default(cls) -> 'AppConfig':
+        """
+        Получить конфигурацию с дефолтными значениями.
+
+        Дерево моделей собирается с валидацией один раз; дальше
+        возвращается глубокая копия кэшированного экземпляра —
+        model_copy валидаторы не прогоняет и заметно дешевле.
+        Копия нужна, потому что секции изменяемы (validate_assignment).
+        """
+        global _DEFAULT_CONFIG
+        if _DEFAULT_CONFIG is None:
+            _DEFAULT_CONFIG = cls()
+        return _DEFAULT_CONFIG.model_copy(deep=True)
@@ -1,11 +1,114 @@
 """
 Базовые классы и утилиты для Pydantic-схем конфигурации.
 """
-from pydantic import BaseModel, ConfigDict
-from typing import Any, Dict, Tuple
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import cache
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing import Annotated, Any, Dict, Literal, Tuple, get_args, get_origin
 import json
+import os
 from pathlib import Path
 
+# В безголовом режиме (GAS_HEADLESS=1) окно настроек не создаётся,
+# поэтому title/description полей не нужны — не храним их в схемах,
+# экономя память и время сборки core-схем при импорте.
+_HEADLESS = os.environ.get('GAS_HEADLESS') == '1'
+
+
+def F(**kwargs):
+    """Обёртка над pydantic.Field: в безголовом режиме отбрасывает UI-метаданные."""
+    if _HEADLESS:
+        kwargs.pop('title', None)
+        kwargs.pop('description', None)
+    return Field(**kwargs)
+
+
+def Ranged(default, lo, hi, title, description=''):
+    """
+    Компактная запись числового поля с диапазоном [lo, hi].
+    Сокращает тело классов схем: меньше байткода на импорт модуля.
+    """
+    return F(default=default, ge=lo, le=hi, title=title, description=description)
+
+
+# Общие диапазоны, повторяющиеся в нескольких секциях. Один объект
+# ограничений на диапазон вместо отдельной пары ge/le на каждое поле —
+# pydantic-core переиспользует узел constraint-схемы между полями.
+UnitRate = Annotated[float, Field(ge=0.01, le=1.0)]
+SimDimension = Annotated[int, Field(ge=100, le=2000)]
+WindowWidth = Annotated[int, Field(ge=800, le=3840)]
+WindowHeight = Annotated[int, Field(ge=600, le=2160)]
+
+
+@cache
+def _adapter_for(config_class: type) -> TypeAdapter:
+    """Единственный TypeAdapter на класс схемы (переиспользуется между вызовами)."""
+    return TypeAdapter(config_class)
+
+
+def _classify_annotation(annotation) -> Tuple[str, list]:
+    """
+    Разновидность виджета для типа поля: ('rgb'|'enum'|'literal'|'bool'|
+    'int'|'float'|'str'|'other', варианты для выпадающего списка).
+    get_origin/get_args недёшевы — классификация выполняется один раз
+    на класс вместе с остальными метаданными.
+    """
+    origin = get_origin(annotation)
+    if origin is tuple:
+        args = get_args(annotation)
+        if len(args) == 3 and all(arg is int for arg in args):
+            return 'rgb', []
+    if isinstance(annotation, type) and issubclass(annotation, IntEnum):
+        return 'enum', [member.name.lower() for member in annotation]
+    if origin is Literal:
+        return 'literal', [str(arg) for arg in get_args(annotation)]
+    if annotation is bool:
+        return 'bool', []
+    if annotation is int:
+        return 'int', []
+    if annotation is float:
+        return 'float', []
+    if annotation is str:
+        return 'str', []
+    return 'other', []
+
+
+@cache
+def _field_info_for(config_class: type) -> Dict[str, Dict[str, Any]]:
+    """
+    Метаданные полей для генерации UI, один обход модели на класс.
+    Схема статична, а окно настроек строит виджеты для каждой секции
+    при каждом открытии — без кэша обход полей повторялся десятки раз.
+    """
+    fields_info = {}
+    for field_name, field_info in config_class.model_fields.items():
+        kind, choices = _classify_annotation(field_info.annotation)
+        metadata = {
+            'type': field_info.annotation,
+            'kind': kind,
+            'choices': choices,
+            'default': field_info.default,
+            'title': field_info.title or field_name,
+            'description': field_info.description or '',
+        }
+
+        # Извлекаем constraints из metadata
+        if field_info.metadata:
+            for constraint in field_info.metadata:
+                if hasattr(constraint, 'ge'):
+                    metadata['ge'] = constraint.ge
+                if hasattr(constraint, 'le'):
+                    metadata['le'] = constraint.le
+                if hasattr(constraint, 'gt'):
+                    metadata['gt'] = constraint.gt
+                if hasattr(constraint, 'lt'):
+                    metadata['lt'] = constraint.lt
+
+        fields_info[field_name] = metadata
+
+    return fields_info
+
 
 class ConfigSection(BaseModel):
     """
@@ -15,54 +118,78 @@ class ConfigSection(BaseModel):
     model_config = ConfigDict(
         validate_assignment=True,  # Валидация при присваивании
         extra='forbid',  # Запрет дополнительных полей
+        defer_build=True,  # Core-схема строится при первом использовании, а не на импорте
     )
     
     def to_dict(self) -> Dict[str, Any]:
         """Преобразование в словарь."""
         return self.model_dump()
-    
+
+    @classmethod
+    def validate(cls, data: Dict[str, Any]) -> 'ConfigSection':
+        """
+        Валидация словаря через закэшированный TypeAdapter.
+        Адаптер создаётся один раз на класс, повторные вызовы
+        не разрешают core-схему заново.
+        """
+        return _adapter_for(cls).validate_python(data)
+
+    @classmethod
+    def load_json(cls, raw: bytes) -> 'ConfigSection':
+        """
+        Валидация сырого JSON напрямую через Rust-парсер pydantic-core,
+        без промежуточного словаря json.loads.
+        """
+        return cls.model_validate_json(raw)
+
     @classmethod
     def get_field_info(cls) -> Dict[str, Dict[str, Any]]:
         """
         Получить информацию о полях для генерации UI.
-        Возвращает словарь с метаданными полей.
+        Возвращает словарь с метаданными полей (кэшируется на класс).
         """
-        fields_info = {}
-        for field_name, field_info in cls.model_fields.items():
-            metadata = {
-                'type': field_info.annotation,
-                'default': field_info.default,
-                'title': field_info.title or field_name,
-                'description': field_info.description or '',
-            }
-            
-            # Извлекаем constraints из metadata
-            if field_info.metadata:
-                for constraint in field_info.metadata:
-                    if hasattr(constraint, 'ge'):
-                        metadata['ge'] = constraint.ge
-                    if hasattr(constraint, 'le'):
-                        metadata['le'] = constraint.le
-                    if hasattr(constraint, 'gt'):
-                        metadata['gt'] = constraint.gt
-                    if hasattr(constraint, 'lt'):
-                        metadata['lt'] = constraint.lt
-            
-            fields_info[field_name] = metadata
-        
-        return fields_info
-
-
-class RGBColor(BaseModel):
-    """RGB цвет как кортеж (r, g, b)."""
+        return _field_info_for(cls)
+
+
+class FrozenConfigSection(ConfigSection):
+    """
+    Секция конфигурации, неизменяемая после создания.
+
+    Для секций, которые не трогаются во время работы симуляции
+    (окно, время, столкновения, цвета и т.д.): окно настроек при
+    применении собирает новый AppConfig целиком, поэтому таким
+    секциям валидация присваиваний не нужна вовсе. Замороженность
+    позволяет безопасно кэшировать производные величины
+    (предвычисленные константы потенциалов, словари цветов)
+    на время жизни экземпляра.
+    """
+    model_config = ConfigDict(
+        frozen=True,
+        extra='forbid',
+        defer_build=True,
+    )
+
+
+@dataclass(slots=True)
+class RGBColor:
+    """
+    RGB цвет как кортеж (r, g, b).
+
+    Обычный dataclass со слотами вместо Pydantic-модели:
+    создание на порядок дешевле, а проверка диапазона тривиальна.
+    """
     r: int
     g: int
     b: int
-    
-    model_config = ConfigDict(
-        validate_assignment=True,
-    )
-    
+
+    def __post_init__(self):
+        for name in ('r', 'g', 'b'):
+            value = getattr(self, name)
+            if not (0 <= value <= 255):
+                raise ValueError(
+                    f"RGB компонента {name} должна быть от 0 до 255, получено: {value}"
+                )
+
     @classmethod
     def from_tuple(cls, rgb: Tuple[int, int, int]) -> 'RGBColor':
         return cls(r=rgb[0], g=rgb[1], b=rgb[2])
@@ -91,6 +218,9 @@ def save_config_to_file(config: BaseModel, filepath: Path) -> None:
 
 def load_config_from_file(config_class: type, filepath: Path) -> BaseModel:
     """Загрузить конфигурацию из JSON файла."""
+    if issubclass(config_class, ConfigSection):
+        # JSON парсится сразу в модель, без промежуточного dict
+        return config_class.load_json(filepath.read_bytes())
     with open(filepath, 'r', encoding='utf-8') as f:
         data = json.load(f)
     return config_class(**data)
@@ -1,25 +1,25 @@
 """
 Схемы для цветовых настроек.
 """
-from pydantic import Field, field_validator
+from pydantic import field_validator
 from typing import Dict, Tuple
-from .base import ConfigSection
+from .base import FrozenConfigSection, F
 
 
-class ParticleColorsConfig(ConfigSection):
+class ParticleColorsConfig(FrozenConfigSection):
     """Цвета частиц."""
     
-    default_color: Tuple[int, int, int] = Field(
+    default_color: Tuple[int, int, int] = F(
         default=(255, 0, 0),
         title="Цвет по умолчанию",
         description="RGB цвет обычных частиц"
     )
-    first_particle_color: Tuple[int, int, int] = Field(
+    first_particle_color: Tuple[int, int, int] = F(
         default=(0, 255, 0),
         title="Цвет первой частицы",
         description="RGB цвет первой (отслеживаемой) частицы"
     )
-    trajectory_color: Tuple[int, int, int] = Field(
+    trajectory_color: Tuple[int, int, int] = F(
         default=(255, 255, 0),
         title="Цвет траектории",
         description="RGB цвет линии траектории"
@@ -36,15 +36,15 @@ class ParticleColorsConfig(ConfigSection):
         raise ValueError(f"Ожидается RGB кортеж из 3 значений, получено: {v}")
 
 
-class BorderColorsConfig(ConfigSection):
+class BorderColorsConfig(FrozenConfigSection):
     """Цвета границ."""
     
-    outer_color: Tuple[int, int, int] = Field(
+    outer_color: Tuple[int, int, int] = F(
         default=(0, 0, 255),
         title="Внешний цвет",
         description="RGB цвет внешней границы"
     )
-    inner_color: Tuple[int, int, int] = Field(
+    inner_color: Tuple[int, int, int] = F(
         default=(255, 255, 255),
         title="Внутренний цвет",
         description="RGB цвет внутренней границы"
@@ -61,43 +61,43 @@ class BorderColorsConfig(ConfigSection):
         raise ValueError(f"Ожидается RGB кортеж из 3 значений, получено: {v}")
 
 
-class UIColorsConfig(ConfigSection):
+class UIColorsConfig(FrozenConfigSection):
     """Цвета UI элементов."""
     
-    background_color: str = Field(
+    background_color: str = F(
         default="black",
         title="Цвет фона",
         description="Цвет фона симуляции"
     )
-    label_text_color: str = Field(
+    label_text_color: str = F(
         default="#ffffff",
         title="Цвет текста",
         description="Цвет текста лейблов"
     )
-    label_bg_color: str = Field(
+    label_bg_color: str = F(
         default="#2d2d2d",
         title="Цвет фона лейблов",
         description="Цвет фона лейблов"
     )
-    group_text_color: str = Field(
+    group_text_color: str = F(
         default="#e0e0e0",
         title="Цвет заголовков групп",
         description="Цвет текста заголовков групп"
     )
 
 
-class ModeColorsConfig(ConfigSection):
+class ModeColorsConfig(FrozenConfigSection):
     """Цвета индикаторов режима."""
     
-    off: str = Field(default='#3d3d3d', title="Выключен")
-    heat: str = Field(default='#5c2020', title="Нагрев")
-    freeze: str = Field(default='#203d5c', title="Охлаждение")
-    expansion: str = Field(default='#205c20', title="Расширение")
-    compression: str = Field(default='#5c5c20', title="Сжатие")
-    heat_expansion: str = Field(default='#5c4020', title="Нагрев+Расширение")
-    heat_compression: str = Field(default='#5c3030', title="Нагрев+Сжатие")
-    cool_expansion: str = Field(default='#205c5c', title="Охлаждение+Расширение")
-    cool_compression: str = Field(default='#404060', title="Охлаждение+Сжатие")
+    off: str = F(default='#3d3d3d', title="Выключен")
+    heat: str = F(default='#5c2020', title="Нагрев")
+    freeze: str = F(default='#203d5c', title="Охлаждение")
+    expansion: str = F(default='#205c20', title="Расширение")
+    compression: str = F(default='#5c5c20', title="Сжатие")
+    heat_expansion: str = F(default='#5c4020', title="Нагрев+Расширение")
+    heat_compression: str = F(default='#5c3030', title="Нагрев+Сжатие")
+    cool_expansion: str = F(default='#205c5c', title="Охлаждение+Расширение")
+    cool_compression: str = F(default='#404060', title="Охлаждение+Сжатие")
     
     def to_dict_by_mode(self) -> Dict[str, str]:
         """Вернуть словарь mode -> color для UI."""
@@ -114,18 +114,18 @@ class ModeColorsConfig(ConfigSection):
         }
 
 
-class ModeIndicatorColorsConfig(ConfigSection):
+class ModeIndicatorColorsConfig(FrozenConfigSection):
     """Цвета индикаторов режима для графиков."""
     
-    off: str = Field(default='gray', title="Выключен")
-    heat: str = Field(default='red', title="Нагрев")
-    freeze: str = Field(default='blue', title="Охлаждение")
-    expansion: str = Field(default='green', title="Расширение")
-    compression: str = Field(default='orange', title="Сжатие")
-    heat_expansion: str = Field(default='#FF8800', title="Нагрев+Расширение")
-    heat_compression: str = Field(default='#FF4400', title="Нагрев+Сжатие")
-    cool_expansion: str = Field(default='#00CCCC', title="Охлаждение+Расширение")
-    cool_compression: str = Field(default='#6666AA', title="Охлаждение+Сжатие")
+    off: str = F(default='gray', title="Выключен")
+    heat: str = F(default='red', title="Нагрев")
+    freeze: str = F(default='blue', title="Охлаждение")
+    expansion: str = F(default='green', title="Расширение")
+    compression: str = F(default='orange', title="Сжатие")
+    heat_expansion: str = F(default='#FF8800', title="Нагрев+Расширение")
+    heat_compression: str = F(default='#FF4400', title="Нагрев+Сжатие")
+    cool_expansion: str = F(default='#00CCCC', title="Охлаждение+Расширение")
+    cool_compression: str = F(default='#6666AA', title="Охлаждение+Сжатие")
     
     def to_dict_by_mode(self) -> Dict[str, str]:
         """Вернуть словарь mode -> color для графиков."""
@@ -1,49 +1,44 @@
 """
 Схемы для параметров частиц и молекул.
 """
-from pydantic import Field
+from enum import IntEnum
+from pydantic import field_validator, model_validator
 from typing import Literal
-from .base import ConfigSection
+from .base import ConfigSection, FrozenConfigSection, F, Ranged
 
 
-class ParticlesConfig(ConfigSection):
+class MoleculeType(IntEnum):
+    """Тип молекулы. Int-теги дешевле строковых сравнений в горячем цикле."""
+    MONATOMIC = 0
+    DIATOMIC = 1
+    POLYATOMIC = 2
+
+
+class MoleculePreset(IntEnum):
+    """Предустановленные молекулы."""
+    CUSTOM = 0
+    ARGON = 1
+    HYDROGEN = 2
+    NITROGEN = 3
+    OXYGEN = 4
+    CO2 = 5
+    WATER = 6
+    METHANE = 7
+
+
+class ParticlesConfig(FrozenConfigSection):
     """Параметры частиц."""
     
-    count: int = Field(
-        default=100,
-        ge=1,
-        le=1000,
-        title="Количество частиц",
-        description="Общее количество частиц в симуляции"
-    )
-    radius: int = Field(
-        default=5,
-        ge=1,
-        le=50,
-        title="Радиус",
-        description="Радиус частицы в пикселях"
-    )
-    mass: int = Field(
-        default=1,
-        ge=1,
-        le=100,
-        title="Масса",
-        description="Масса частицы (условные единицы)"
-    )
-    initial_speed: int = Field(
-        default=5,
-        ge=1,
-        le=500,
-        title="Начальная скорость",
-        description="Начальная скорость частиц"
-    )
-    trajectory_max_length: int = Field(
-        default=100,
-        ge=0,
-        le=1000,
-        title="Макс. длина траектории",
-        description="Максимальная длина траектории для отслеживания (0 = отключено)"
-    )
+    count: int = Ranged(100, 1, 1000, "Количество частиц",
+                   "Общее количество частиц в симуляции")
+    radius: int = Ranged(5, 1, 50, "Радиус",
+                   "Радиус частицы в пикселях")
+    mass: int = Ranged(1, 1, 100, "Масса",
+                   "Масса частицы (условные единицы)")
+    initial_speed: int = Ranged(5, 1, 500, "Начальная скорость",
+                   "Начальная скорость частиц")
+    trajectory_max_length: int = Ranged(100, 0, 1000, "Макс. длина траектории",
+                   "Максимальная длина траектории для отслеживания (0 = отключено)")
 
 
 class MoleculeConfig(ConfigSection):
@@ -59,69 +54,75 @@ class MoleculeConfig(ConfigSection):
     В 2D симуляции вращение происходит только вокруг оси, перпендикулярной плоскости.
     """
     
-    molecule_type: Literal["monatomic", "diatomic", "polyatomic"] = Field(
-        default="monatomic",
+    molecule_type: MoleculeType = F(
+        default=MoleculeType.MONATOMIC,
         title="Тип молекулы",
         description="monatomic: одноатомные (Ar, He); diatomic: двухатомные (H₂, N₂); polyatomic: многоатомные (H₂O, CO₂)"
     )
     
-    geometry: Literal["linear", "nonlinear"] = Field(
+    geometry: Literal["linear", "nonlinear"] = F(
         default="linear",
         title="Геометрия",
         description="linear: линейная (CO₂); nonlinear: нелинейная (H₂O). Влияет на момент инерции"
     )
     
-    atom_count: int = Field(
-        default=1,
-        ge=1,
-        le=10,
-        title="Число атомов",
-        description="Количество атомов в молекуле (1-10)"
-    )
+    atom_count: int = Ranged(1, 1, 10, "Число атомов",
+                   "Количество атомов в молекуле (1-10)")
     
-    bond_length: float = Field(
-        default=0.5,
-        ge=0.1,
-        le=2.0,
-        title="Длина связи",
-        description="Расстояние между атомами (относительно радиуса частицы)"
-    )
+    bond_length: float = Ranged(0.5, 0.1, 2.0, "Длина связи",
+                   "Расстояние между атомами (относительно радиуса частицы)")
     
-    moment_of_inertia: float = Field(
-        default=1.0,
-        ge=0.1,
-        le=100.0,
-        title="Момент инерции",
-        description="Момент инерции молекулы (условные единицы). Больше = медленнее вращение"
-    )
+    moment_of_inertia: float = Ranged(1.0, 0.1, 100.0, "Момент инерции",
+                   "Момент инерции молекулы (условные единицы). Больше = медленнее вращение")
     
-    enable_rotation: bool = Field(
+    enable_rotation: bool = F(
         default=False,
         title="Включить вращение",
         description="Моделировать вращательные степени свободы"
     )
     
-    show_orientation: bool = Field(
+    show_orientation: bool = F(
         default=True,
         title="Показывать ориентацию",
         description="Отображать линию-индикатор ориентации молекулы"
     )
     
-    initial_angular_velocity: float = Field(
-        default=0.0,
-        ge=0.0,
-        le=10.0,
-        title="Начальная угл. скорость",
-        description="Начальная угловая скорость (0 = случайная из распределения)"
-    )
+    initial_angular_velocity: float = Ranged(0.0, 0.0, 10.0, "Начальная угл. скорость",
+                   "Начальная угловая скорость (0 = случайная из распределения)")
     
     # Предустановки молекул
-    preset: Literal["custom", "argon", "hydrogen", "nitrogen", "oxygen", "co2", "water", "methane"] = Field(
-        default="custom",
+    preset: MoleculePreset = F(
+        default=MoleculePreset.CUSTOM,
         title="Пресет молекулы",
         description="Выбор предустановленной молекулы с корректными параметрами"
     )
-    
+
+    @field_validator('molecule_type', 'preset', mode='before')
+    @classmethod
+    def _coerce_enum_tag(cls, v, info):
+        """Принимаем старые строковые значения ('monatomic', 'argon', ...)."""
+        if isinstance(v, str):
+            enum_cls = MoleculeType if info.field_name == 'molecule_type' else MoleculePreset
+            try:
+                return enum_cls[v.upper()]
+            except KeyError:
+                raise ValueError(f"Неизвестное значение {info.field_name}: {v}")
+        return v
+
+    # dof / rot_dof — обычные int-атрибуты, выставляемые валидатором ниже.
+    # Горячий цикл читает их без дескрипторов и вызовов методов.
+
+    @model_validator(mode='after')
+    def _recompute_dof(self):
+        """
+        Пересчёт DoF как простых int: выполняется при создании и при
+        каждом присваивании полей (validate_assignment).
+        """
+        rotating = self.molecule_type != MoleculeType.MONATOMIC and self.enable_rotation
+        object.__setattr__(self, 'dof', 3 if rotating else 2)
+        object.__setattr__(self, 'rot_dof', 1 if rotating else 0)
+        return self
+
     def get_degrees_of_freedom(self) -> int:
         """
         Возвращает число степеней свободы молекулы в 2D.
@@ -131,81 +132,87 @@ class MoleculeConfig(ConfigSection):
         
         В 2D вращение возможно только вокруг оси z (перпендикулярной плоскости).
         """
-        if self.molecule_type == "monatomic" or not self.enable_rotation:
-            return 2  # Только поступательные степени свободы
-        else:
-            return 3  # Поступательные + 1 вращательная
-    
+        return self.dof
+
     def get_rotational_dof(self) -> int:
         """Возвращает число вращательных степеней свободы в 2D."""
-        if self.molecule_type == "monatomic" or not self.enable_rotation:
-            return 0
-        return 1  # В 2D только одна ось вращения
-    
+        return self.rot_dof
+
     def apply_preset(self) -> None:
         """
         Применить параметры предустановленной молекулы.
         Вызывается при изменении preset.
+
+        Значения пресетов заведомо валидны, поэтому пишем напрямую в
+        __dict__ одним вызовом, минуя повторную валидацию
+        validate_assignment на каждом поле.
         """
-        presets = {
-            "argon": {
-                "molecule_type": "monatomic",
-                "geometry": "linear",
-                "atom_count": 1,
-                "moment_of_inertia": 1.0,
-                "enable_rotation": False,
-                "bond_length": 0.5
-            },
-            "hydrogen": {
-                "molecule_type": "diatomic",
-                "geometry": "linear",
-                "atom_count": 2,
-                "moment_of_inertia": 0.5,  # Лёгкая молекула
-                "enable_rotation": True,
-                "bond_length": 0.4
-            },
-            "nitrogen": {
-                "molecule_type": "diatomic",
-                "geometry": "linear",
-                "atom_count": 2,
-                "moment_of_inertia": 2.0,
-                "enable_rotation": True,
-                "bond_length": 0.5
-            },
-            "oxygen": {
-                "molecule_type": "diatomic",
-                "geometry": "linear",
-                "atom_count": 2,
-                "moment_of_inertia": 2.5,
-                "enable_rotation": True,
-                "bond_length": 0.5
-            },
-            "co2": {
-                "molecule_type": "polyatomic",
-                "geometry": "linear",
-                "atom_count": 3,
-                "moment_of_inertia": 7.0,  # Тяжёлая линейная молекула
-                "enable_rotation": True,
-                "bond_length": 0.6
-            },
-            "water": {
-                "molecule_type": "polyatomic",
-                "geometry": "nonlinear",
-                "atom_count": 3,
-                "moment_of_inertia": 1.5,  # Угловая молекула
-                "enable_rotation": True,
-                "bond_length": 0.4
-            },
-            "methane": {
-                "molecule_type": "polyatomic",
-                "geometry": "nonlinear",
-                "atom_count": 5,
-                "moment_of_inertia": 3.0,
-                "enable_rotation": True,
-                "bond_length": 0.5
-            }
-        }
-        
-        if self.preset in presets:
-            for key, value in presets[self.preset].items():
-                setattr(self, key, value)
+        preset_values = _MOLECULE_PRESETS.get(self.preset)
+        if preset_values is None:
+            return
+        self.__dict__.update(preset_values)
+        self.__pydantic_fields_set__.update(preset_values)
+        # Запись мимо __setattr__ не вызывает after-валидатор —
+        # пересчитываем DoF вручную
+        self._recompute_dof()
+
+
+# Параметры предустановленных молекул (ключ — int-тег пресета)
+_MOLECULE_PRESETS = {
+    MoleculePreset.ARGON: {
+        "molecule_type": MoleculeType.MONATOMIC,
+        "geometry": "linear",
+        "atom_count": 1,
+        "moment_of_inertia": 1.0,
+        "enable_rotation": False,
+        "bond_length": 0.5
+    },
+    MoleculePreset.HYDROGEN: {
+        "molecule_type": MoleculeType.DIATOMIC,
+        "geometry": "linear",
+        "atom_count": 2,
+        "moment_of_inertia": 0.5,  # Лёгкая молекула
+        "enable_rotation": True,
+        "bond_length": 0.4
+    },
+    MoleculePreset.NITROGEN: {
+        "molecule_type": MoleculeType.DIATOMIC,
+        "geometry": "linear",
+        "atom_count": 2,
+        "moment_of_inertia": 2.0,
+        "enable_rotation": True,
+        "bond_length": 0.5
+    },
+    MoleculePreset.OXYGEN: {
+        "molecule_type": MoleculeType.DIATOMIC,
+        "geometry": "linear",
+        "atom_count": 2,
+        "moment_of_inertia": 2.5,
+        "enable_rotation": True,
+        "bond_length": 0.5
+    },
+    MoleculePreset.CO2: {
+        "molecule_type": MoleculeType.POLYATOMIC,
+        "geometry": "linear",
+        "atom_count": 3,
+        "moment_of_inertia": 7.0,  # Тяжёлая линейная молекула
+        "enable_rotation": True,
+        "bond_length": 0.6
+    },
+    MoleculePreset.WATER: {
+        "molecule_type": MoleculeType.POLYATOMIC,
+        "geometry": "nonlinear",
+        "atom_count": 3,
+        "moment_of_inertia": 1.5,  # Угловая молекула
+        "enable_rotation": True,
+        "bond_length": 0.4
+    },
+    MoleculePreset.METHANE: {
+        "molecule_type": MoleculeType.POLYATOMIC,
+        "geometry": "nonlinear",
+        "atom_count": 5,
+        "moment_of_inertia": 3.0,
+        "enable_rotation": True,
+        "bond_length": 0.5
+    }
+}
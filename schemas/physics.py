@@ -1,12 +1,19 @@
 """
 Схемы для физических параметров симуляции.
 """
-from pydantic import Field
+from enum import IntEnum
+from pydantic import field_validator, model_validator
 from typing import Literal
-from .base import ConfigSection
+from .base import ConfigSection, FrozenConfigSection, F, Ranged, UnitRate
 
 
-class LennardJonesConfig(ConfigSection):
+class BrownianMode(IntEnum):
+    """Режим броуновского движения."""
+    SINGLE_LARGE = 0
+    MULTI_TRACK = 1
+
+
+class LennardJonesConfig(FrozenConfigSection):
     """
     Параметры потенциала Леннард-Джонса.
     
@@ -18,35 +25,48 @@ class LennardJonesConfig(ConfigSection):
     - r — расстояние между частицами
     """
     
-    enabled: bool = Field(
+    enabled: bool = F(
         default=False,
         title="Включить потенциал Леннард-Джонса",
         description="Учитывать межмолекулярное взаимодействие по потенциалу Леннард-Джонса"
     )
-    epsilon: float = Field(
-        default=1.0,
-        ge=0.01,
-        le=100.0,
-        title="ε (глубина ямы)",
-        description="Глубина потенциальной ямы, определяет силу притяжения"
-    )
-    sigma: float = Field(
-        default=10.0,
-        ge=1.0,
-        le=50.0,
-        title="σ (характерный размер)",
-        description="Расстояние, на котором потенциал равен нулю (примерно диаметр частицы)"
-    )
-    cutoff_multiplier: float = Field(
-        default=2.5,
-        ge=1.5,
-        le=5.0,
-        title="Радиус обрезки (в σ)",
-        description="Множитель σ для радиуса обрезки потенциала (стандартно 2.5σ)"
-    )
+    epsilon: float = Ranged(1.0, 0.01, 100.0, "ε (глубина ямы)",
+                   "Глубина потенциальной ямы, определяет силу притяжения")
+    sigma: float = Ranged(10.0, 1.0, 50.0, "σ (характерный размер)",
+                   "Расстояние, на котором потенциал равен нулю (примерно диаметр частицы)")
+    cutoff_multiplier: float = Ranged(2.5, 1.5, 5.0, "Радиус обрезки (в σ)",
+                   "Множитель σ для радиуса обрезки потенциала (стандартно 2.5σ)")
+
+    @model_validator(mode='after')
+    def _precompute(self):
+        """
+        Производные константы зависят только от полей конфигурации,
+        пересчитываем их один раз при валидации, а не на каждой паре частиц.
+        """
+        object.__setattr__(self, '_sigma6', self.sigma ** 6)
+        object.__setattr__(self, '_sigma12', self.sigma ** 12)
+        object.__setattr__(self, '_cutoff', self.sigma * self.cutoff_multiplier)
+        object.__setattr__(self, '_cutoff2', self._cutoff ** 2)
+        return self
+
+    @property
+    def sigma6(self) -> float:
+        return self._sigma6
+
+    @property
+    def sigma12(self) -> float:
+        return self._sigma12
 
+    @property
+    def cutoff(self) -> float:
+        return self._cutoff
 
-class MorseConfig(ConfigSection):
+    @property
+    def cutoff2(self) -> float:
+        return self._cutoff2
+
+
+class MorseConfig(FrozenConfigSection):
     """
     Параметры потенциала Морзе.
     
@@ -58,42 +78,37 @@ class MorseConfig(ConfigSection):
     - r_e — равновесное расстояние между частицами
     """
     
-    enabled: bool = Field(
+    enabled: bool = F(
         default=False,
         title="Включить потенциал Морзе",
         description="Учитывать межмолекулярное взаимодействие по потенциалу Морзе"
     )
-    D_e: float = Field(
-        default=1.0,
-        ge=0.01,
-        le=100.0,
-        title="D_e (глубина ямы)",
-        description="Энергия диссоциации связи / глубина потенциальной ямы"
-    )
-    a: float = Field(
-        default=0.5,
-        ge=0.01,
-        le=5.0,
-        title="a (ширина ямы)",
-        description="Параметр, определяющий ширину потенциальной ямы"
-    )
-    r_e: float = Field(
-        default=15.0,
-        ge=1.0,
-        le=50.0,
-        title="r_e (равновесное расстояние)",
-        description="Равновесное расстояние между частицами"
-    )
-    cutoff_multiplier: float = Field(
-        default=3.0,
-        ge=2.0,
-        le=6.0,
-        title="Радиус обрезки (в r_e)",
-        description="Множитель r_e для радиуса обрезки потенциала"
-    )
+    D_e: float = Ranged(1.0, 0.01, 100.0, "D_e (глубина ямы)",
+                   "Энергия диссоциации связи / глубина потенциальной ямы")
+    a: float = Ranged(0.5, 0.01, 5.0, "a (ширина ямы)",
+                   "Параметр, определяющий ширину потенциальной ямы")
+    r_e: float = Ranged(15.0, 1.0, 50.0, "r_e (равновесное расстояние)",
+                   "Равновесное расстояние между частицами")
+    cutoff_multiplier: float = Ranged(3.0, 2.0, 6.0, "Радиус обрезки (в r_e)",
+                   "Множитель r_e для радиуса обрезки потенциала")
+
+    @model_validator(mode='after')
+    def _precompute(self):
+        """Радиус обрезки пересчитывается один раз при валидации."""
+        object.__setattr__(self, '_cutoff', self.r_e * self.cutoff_multiplier)
+        object.__setattr__(self, '_cutoff2', self._cutoff ** 2)
+        return self
+
+    @property
+    def cutoff(self) -> float:
+        return self._cutoff
 
+    @property
+    def cutoff2(self) -> float:
+        return self._cutoff2
 
-class DLVOConfig(ConfigSection):
+
+class DLVOConfig(FrozenConfigSection):
     """
     Параметры потенциала ДЛФО (Дерягина-Ландау-Фервея-Овербека).
     
@@ -110,143 +125,114 @@ class DLVOConfig(ConfigSection):
     - ε — диэлектрическая проницаемость среды
     """
     
-    enabled: bool = Field(
+    enabled: bool = F(
         default=False,
         title="Включить потенциал ДЛФО",
         description="Учитывать коллоидное взаимодействие (для заряженных частиц в растворах)"
     )
-    hamaker_constant: float = Field(
-        default=1.0,
-        ge=0.001,
-        le=100.0,
-        title="A_H (константа Гамакера)",
-        description="Константа Гамакера, определяющая силу Ван-дер-Ваальсова притяжения"
-    )
-    surface_potential: float = Field(
-        default=0.025,
-        ge=0.001,
-        le=1.0,
-        title="ψ₀ (поверхностный потенциал)",
-        description="Поверхностный потенциал частиц (в В)"
-    )
-    debye_length: float = Field(
-        default=10.0,
-        ge=1.0,
-        le=100.0,
-        title="1/κ (дебаевская длина)",
-        description="Дебаевская длина экранирования (в условных единицах)"
-    )
-    dielectric_constant: float = Field(
-        default=80.0,
-        ge=1.0,
-        le=200.0,
-        title="ε (диэлектрическая проницаемость)",
-        description="Относительная диэлектрическая проницаемость среды (для воды ~80)"
-    )
-    cutoff_distance: float = Field(
-        default=50.0,
-        ge=10.0,
-        le=200.0,
-        title="Радиус обрезки",
-        description="Максимальное расстояние взаимодействия"
-    )
+    hamaker_constant: float = Ranged(1.0, 0.001, 100.0, "A_H (константа Гамакера)",
+                   "Константа Гамакера, определяющая силу Ван-дер-Ваальсова притяжения")
+    surface_potential: float = Ranged(0.025, 0.001, 1.0, "ψ₀ (поверхностный потенциал)",
+                   "Поверхностный потенциал частиц (в В)")
+    debye_length: float = Ranged(10.0, 1.0, 100.0, "1/κ (дебаевская длина)",
+                   "Дебаевская длина экранирования (в условных единицах)")
+    dielectric_constant: float = Ranged(80.0, 1.0, 200.0, "ε (диэлектрическая проницаемость)",
+                   "Относительная диэлектрическая проницаемость среды (для воды ~80)")
+    cutoff_distance: float = Ranged(50.0, 10.0, 200.0, "Радиус обрезки",
+                   "Максимальное расстояние взаимодействия")
+
+    @model_validator(mode='after')
+    def _precompute(self):
+        """Обратная дебаевская длина и квадрат радиуса обрезки."""
+        object.__setattr__(self, '_kappa', 1.0 / self.debye_length if self.debye_length > 0 else 1.0)
+        object.__setattr__(self, '_cutoff2', self.cutoff_distance ** 2)
+        return self
+
+    @property
+    def kappa(self) -> float:
+        return self._kappa
 
+    @property
+    def cutoff2(self) -> float:
+        return self._cutoff2
 
-class InteractionPotentialsConfig(ConfigSection):
+
+class InteractionPotentialsConfig(FrozenConfigSection):
     """Общая конфигурация потенциалов взаимодействия."""
     
-    lennard_jones: LennardJonesConfig = Field(
+    lennard_jones: LennardJonesConfig = F(
         default_factory=LennardJonesConfig,
         title="Потенциал Леннард-Джонса"
     )
-    morse: MorseConfig = Field(
+    morse: MorseConfig = F(
         default_factory=MorseConfig,
         title="Потенциал Морзе"
     )
-    dlvo: DLVOConfig = Field(
+    dlvo: DLVOConfig = F(
         default_factory=DLVOConfig,
         title="Потенциал ДЛФО"
     )
     
-    max_force: float = Field(
-        default=10.0,
-        ge=0.1,
-        le=100.0,
-        title="Максимальная сила",
-        description="Ограничение максимальной силы для стабильности симуляции"
-    )
+    max_force: float = Ranged(10.0, 0.1, 100.0, "Максимальная сила",
+                   "Ограничение максимальной силы для стабильности симуляции")
     
-    softening_distance: float = Field(
-        default=0.1,
-        ge=0.01,
-        le=1.0,
-        title="Смягчение на близких расстояниях",
-        description="Минимальное расстояние для избежания сингулярностей"
-    )
+    softening_distance: UnitRate = F(default=0.1, title="Смягчение на близких расстояниях",
+                   description="Минимальное расстояние для избежания сингулярностей")
 
 
 class GravityConfig(ConfigSection):
     """Параметры гравитационного поля."""
     
-    enabled: bool = Field(
+    enabled: bool = F(
         default=False,
         title="Включить гравитацию",
         description="Включить внешнее гравитационное поле (направлено вниз)"
     )
-    g: float = Field(
-        default=9.8,
-        ge=0.0,
-        le=10.0,
-        title="Ускорение свободного падения",
-        description="Величина ускорения свободного падения"
-    )
+    g: float = Ranged(9.8, 0.0, 10.0, "Ускорение свободного падения",
+                   "Величина ускорения свободного падения")
 
 
 class BrownianConfig(ConfigSection):
     """Параметры броуновского движения."""
     
-    enabled: bool = Field(
+    enabled: bool = F(
         default=False,
         title="Включить броуновское движение",
         description="Включить режим броуновского движения"
     )
-    mode: Literal["single_large", "multi_track"] = Field(
-        default="single_large",
+    mode: BrownianMode = F(
+        default=BrownianMode.SINGLE_LARGE,
         title="Режим",
         description="single_large: одна большая частица среди малых; multi_track: отслеживание нескольких частиц"
     )
-    large_mass_multiplier: float = Field(
-        default=10.0,
-        ge=1.0,
-        le=100.0,
-        title="Множитель массы",
-        description="Во сколько раз масса броуновской частицы больше обычной"
-    )
-    large_radius_multiplier: float = Field(
-        default=10.0,
-        ge=2.0,
-        le=50.0,
-        title="Множитель радиуса",
-        description="Во сколько раз радиус броуновской частицы больше обычной"
-    )
-    track_count: int = Field(
-        default=5,
-        ge=1,
-        le=20,
-        title="Количество отслеживаемых",
-        description="Количество частиц для отслеживания MSD в режиме multi_track"
-    )
+
+    @field_validator('mode', mode='before')
+    @classmethod
+    def _coerce_mode(cls, v):
+        """Принимаем старые строковые значения ('single_large', 'multi_track')."""
+        if isinstance(v, str):
+            try:
+                return BrownianMode[v.upper()]
+            except KeyError:
+                raise ValueError(f"Неизвестный режим броуновского движения: {v}")
+        return v
+    large_mass_multiplier: float = Ranged(10.0, 1.0, 100.0, "Множитель массы",
+                   "Во сколько раз масса броуновской частицы больше обычной")
+    large_radius_multiplier: float = Ranged(10.0, 2.0, 50.0, "Множитель радиуса",
+                   "Во сколько раз радиус броуновской частицы больше обычной")
+    track_count: int = Ranged(5, 1, 20, "Количество отслеживаемых",
+                   "Количество частиц для отслеживания MSD в режиме multi_track")
 
 
 class ExperimentConfig(ConfigSection):
     """Параметры экспериментальных режимов."""
     
-    isolated_system: bool = Field(
+    isolated_system: bool = F(
         default=False,
         title="Изолированная система",
         description="Запретить изменение энергии (нагрев/охлаждение) и объема (расширение/сжатие)"
     )
-    corner_start: bool = Field(
+    corner_start: bool = F(
         default=False,
         title="Старт из угла",
         description="Начальное расположение частиц в углу (для демонстрации 2-го закона)"
@@ -0,0 +1,141 @@
+"""
+Вычислительные ядра шага симуляции.
+
+Функции работают только с SoA-массивами и скалярной математикой
+(nopython-стиль): при появлении numba в зависимостях их достаточно
+обернуть в @njit(cache=True) без изменения кода.
+"""
+import math
+
+import numpy as np
+
+
+def _resolve_collision_pairs(px, py, pvx, pvy, pmass, i_idx, j_idx):
+    """
+    Разрешение упругих столкновений для пар-кандидатов.
+
+    Декартова форма: обмен нормальными компонентами через проекцию на
+    нормаль, без atan2/sin/cos. Ядро остаётся в скалярном
+    nopython-стиле (только массивы и math) — при появлении numba в
+    зависимостях его достаточно обернуть в @njit(cache=True).
+    Мутирует pvx и pvy на месте.
+
+    Returns:
+        resolved: bool-массив — для каких пар столкновение произошло
+        tang1, tang2: касательные компоненты скоростей пар
+            (нужны вызывающему коду для передачи углового момента)
+    """
+    n_pairs = len(i_idx)
+    resolved = np.zeros(n_pairs, dtype=np.bool_)
+    tang1 = np.zeros(n_pairs)
+    tang2 = np.zeros(n_pairs)
+
+    for k in range(n_pairs):
+        i = i_idx[k]
+        j = j_idx[k]
+
+        dx = px[j] - px[i]
+        dy = py[j] - py[i]
+        dist2 = dx * dx + dy * dy
+        if dist2 <= 0.0:
+            continue
+
+        # Пара сталкивается, только если частицы сближаются:
+        # (v2-v1)·(p2-p1) < 0 — эквивалент прежнего сравнения расстояний
+        # через прогнозный шаг, но без двух sqrt и восьми умножений
+        if (pvx[j] - pvx[i]) * dx + (pvy[j] - pvy[i]) * dy >= 0.0:
+            continue
+
+        dist = math.sqrt(dist2)
+
+        resolved[k] = True
+
+        # Нормаль к линии столкновения
+        nx = dx / dist
+        ny = dy / dist
+
+        # Нормальные и касательные компоненты скоростей
+        v1n = pvx[i] * nx + pvy[i] * ny
+        v2n = pvx[j] * nx + pvy[j] * ny
+        tang1[k] = -pvx[i] * ny + pvy[i] * nx
+        tang2[k] = -pvx[j] * ny + pvy[j] * nx
+
+        # Обмен нормальными компонентами (упругое столкновение)
+        m1 = pmass[i]
+        m2 = pmass[j]
+
+        if m1 == m2:
+            # Горячий путь: все частицы одной массы (кроме броуновской) —
+            # при равных массах нормальные компоненты просто меняются местами
+            dvn = v1n - v2n
+            pvx[i] -= dvn * nx
+            pvy[i] -= dvn * ny
+            pvx[j] += dvn * nx
+            pvy[j] += dvn * ny
+        else:
+            # Общая форма для разных масс (броуновская частица)
+            total_mass = m1 + m2
+            v1n_new = ((m1 - m2) * v1n + 2 * m2 * v2n) / total_mass
+            v2n_new = ((m2 - m1) * v2n + 2 * m1 * v1n) / total_mass
+
+            # Касательные компоненты не меняются — корректируем только нормальные
+            pvx[i] += (v1n_new - v1n) * nx
+            pvy[i] += (v1n_new - v1n) * ny
+            pvx[j] += (v2n_new - v2n) * nx
+            pvy[j] += (v2n_new - v2n) * ny
+
+    return resolved, tang1, tang2
+
+
+def _advect_and_reflect(px, py, pvx, pvy, pmass, pradius,
+                        width, height, gravity_dvy):
+    """
+    Слитый кинематический шаг: гравитация, перенос позиций и отражения
+    от стенок за один проход по SoA-массивам. Как и ядро столкновений,
+    написан в nopython-стиле и готов к @njit при появлении numba.
+    Мутирует px, py, pvx, pvy на месте.
+
+    Returns:
+        (left, right, up, down) — импульсы 2m|v|, переданные каждой
+        стенке на этом шаге (для расчёта давления)
+    """
+    if gravity_dvy != 0.0:
+        pvy += gravity_dvy
+
+    px += pvx
+    py += pvy
+
+    # Переданные стенкам импульсы 2m|v| считаются одним проходом
+    # и переиспользуются всеми четырьмя редукциями
+    px_mom = 2 * pmass * np.abs(pvx)
+    py_mom = 2 * pmass * np.abs(pvy)
+
+    # Левая стенка (движение влево: vx < 0)
+    left = (px <= pradius) & (pvx < 0)
+    d_left = 0.0
+    if left.any():
+        pvx[left] = -pvx[left]
+        d_left = float(px_mom[left].sum())
+
+    # Правая стенка (движение вправо: vx > 0)
+    right = (px >= width - pradius) & (pvx > 0)
+    d_right = 0.0
+    if right.any():
+        pvx[right] = -pvx[right]
+        d_right = float(px_mom[right].sum())
+
+    # Верхняя стенка (движение вверх: vy < 0)
+    up = (py <= pradius) & (pvy < 0)
+    d_up = 0.0
+    if up.any():
+        pvy[up] = -pvy[up]
+        d_up = float(py_mom[up].sum())
+
+    # Нижняя стенка (движение вниз: vy > 0)
+    down = (py >= height - pradius) & (pvy > 0)
+    d_down = 0.0
+    if down.any():
+        pvy[down] = -pvy[down]
+        d_down = float(py_mom[down].sum())
+
+    return d_left, d_right, d_up, d_down
@@ -4,43 +4,45 @@
 """
 import math
 import random
-from statistics import mean
 from collections import deque
 
 from PyQt5.QtWidgets import QWidget
-from PyQt5.QtCore import QTimer, Qt, pyqtSignal
-from PyQt5.QtGui import QPainter, QColor, QPen
+from PyQt5.QtCore import QPointF, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen, QPolygonF
 import numpy as np
+from scipy.spatial import cKDTree
+from scipy.special import xlogy
 
 from models import GasParticle
-from schemas import AppConfig
+from schemas import AppConfig, BrownianMode, MoleculeType
+from simulation._kernels import _advect_and_reflect, _resolve_collision_pairs
 
 
 class SimulationWidget(QWidget):
     """Виджет для визуализации и управления симуляцией газа."""
-    
+
     update_signal = pyqtSignal(float, float, float, float, str)
     data_updated = pyqtSignal(dict)  # Для передачи данных в окно графиков
-    
+
     def __init__(self, width=500, height=500, config: AppConfig = None):
         super().__init__()
-        
+
         # Используем конфигурацию или создаем дефолтную
         self.config = config if config is not None else AppConfig.get_default()
-        
+
         self.width0 = width
         self.height0 = height
         self.width = width
         self.height = height
         self.setFixedSize(int(width * 1.5), height)
-        
+
         # Параметры из конфигурации
         self.nn = self.config.particles.count
         self.particles = []
         self.r1 = self.config.particles.radius
         self.m1 = self.config.particles.mass
         self.v_start = self.config.particles.initial_speed
-        
+
         self.mode = "OFF"
         self.running = True
         self.NOW_TIME = 0
@@ -48,116 +50,207 @@ class SimulationWidget(QWidget):
         self.time_check = self.config.time.check_interval
         self.timer = 0
         self.counter = 0
-        
+        self._bind_config()
+
         self.delta_px_left = 0
         self.delta_px_right = 0
         self.delta_py_up = 0
         self.delta_py_down = 0
-        
-        # Данные для графиков
+
+        # Данные для графиков: ограниченные кольцевые буферы (deque),
+        # чтобы память и размер пакета data_updated не росли со временем
         self.Energy_check = 0
         self.Energy_translational = 0  # Поступательная энергия
         self.Energy_rotational = 0  # Вращательная энергия
-        self.Pressure = []
-        self.Temperature = []
-        self.Volume = []
-        self.Time_meas = []
-        self.AvgVelocity = []
-        self.KineticEnergy = []
-        self.PotentialEnergy = []
-        self.Density = []
-        self.VelocityDistribution = []
-        self.MeanFreePath = []
-        self.MeanFreePath_theoretical = []
-        self.MeanFreePath_roll100 = []
-        self.CollisionRate = []
-        
+        # Окно хранения: в тактах логирования и в шагах симуляции
+        self._series_maxlen = self.config.logging.buffer_size * 4
+        self._step_series_maxlen = self._series_maxlen * 10
+        series = lambda: deque(maxlen=self._series_maxlen)
+        self.Pressure = series()
+        self.Temperature = series()
+        self.Volume = series()
+        self.Time_meas = series()
+        self.AvgVelocity = series()
+        self.KineticEnergy = series()
+        self.PotentialEnergy = series()
+        self.Density = series()
+        self.MeanFreePath = series()
+        self.MeanFreePath_theoretical = series()
+        self.MeanFreePath_wall = series()
+        self.MeanFreePath_eff = series()
+        self.MeanFreePath_roll100 = series()
+        self.CollisionRate = series()
+
         self.collision_count = 0
         self.last_collision_time = 0
-        
+
         self.log_buffer = deque(maxlen=self.config.logging.buffer_size)
-        
+
         # Данные для физических законов
         self.initial_energy = None  # Начальная энергия для 1-го закона
-        self.Entropy = []  # Энтропия для 2-го закона
+        self.Entropy = series()  # Энтропия для 2-го закона
         self.positions_history = []  # История позиций для броуновского движения
-        self.MSD = []  # Среднеквадратичное смещение
-        self.brownian_trajectory = []  # Траектория броуновской частицы
+        self.MSD = deque(maxlen=self._step_series_maxlen)  # Среднеквадратичное смещение
+        self.brownian_trajectory = deque(maxlen=self._step_series_maxlen)  # Траектория броуновской частицы
         self.brownian_initial_pos = None  # Начальная позиция броуновской частицы
         self.time_averages = {}  # Временные средние для эргодической гипотезы
         self.ensemble_averages = {}  # Ансамблевые средние
-        self.H_function = []  # H-функция Больцмана
-        self.SpatialEntropy = []  # Пространственная энтропия
-        
+        self.H_function = series()  # H-функция Больцмана
+        self.SpatialEntropy = series()  # Пространственная энтропия
+
         # Данные для эргодической гипотезы
-        self.particle_velocity_histories = {}  # История скоростей каждой частицы
-        self.time_averages_history = []  # История временных средних (1-я частица)
-        self.ensemble_averages_history = []  # История ансамблевых средних
-        self.initial_velocities = []  # Начальные скорости для "забывания"
+        # История скоростей всех частиц — один 2D кольцевой буфер
+        # (строка — частица, столбец — тик выборки)
+        self.pvh = np.zeros((0, 0), dtype=np.float32)
+        self.pvh_len = 0
+        self.time_averages_history = series()  # История временных средних (1-я частица)
+        self.ensemble_averages_history = series()  # История ансамблевых средних
+        self.initial_velocities = np.empty(0)  # Начальные скорости для "забывания"
         self.initial_positions_saved = []  # Начальные позиции
-        self.correlations_history = []  # История корреляций с начальным состоянием
-        
+        self.correlations_history = series()  # История корреляций с начальным состоянием
+
         # Данные для потенциальной энергии
         self.potential_energy = 0.0  # Потенциальная энергия системы
-        self.PotentialEnergy = []  # История потенциальной энергии
-        
+
+        # Постоянный словарь-пакет data_updated: статичные ключи
+        # заполняются один раз, на тике обновляются только изменяемые
+        self._data_view = None
+
         self.init_particles()
-        
+
         # Таймер для обновления симуляции
         self.simulation_timer = QTimer()
         self.simulation_timer.timeout.connect(self.update_simulation)
         self.simulation_timer.start(int(self.time_sleep * 1000))
-        
+
+        # Отрисовка развязана с физикой: физика может шагать чаще,
+        # чем монитор успевает показать, перерисовываем ~60 Гц
+        self.paint_timer = QTimer()
+        self.paint_timer.timeout.connect(self.update)
+        self.paint_timer.start(16)
+
         self.setStyleSheet(f"background-color: {self.config.ui_colors.background_color};")
-        
+
+    def _bind_config(self):
+        """
+        Скаляры конфигурации, читаемые на каждом шаге, привязываются
+        к обычным атрибутам: каждое чтение через pydantic-модель — это
+        дескриптор и словарь полей, а здесь достаточно локального имени.
+        Флаги-переключатели (gravity.enabled и т.п.) читаются вживую,
+        потому что главное окно меняет их прямо в конфигурации.
+        """
+        self._gravity_g = float(self.config.gravity.g)
+        self._dist_mul = float(self.config.collision.distance_multiplier)
+        self._overlap_thr = float(self.config.collision.overlap_threshold)
+        sc = self.config.state_change
+        self._exp_rate = float(sc.expansion_rate)
+        self._comp_rate = float(sc.compression_rate)
+        self._heat_rate = float(sc.heat_rate)
+        self._freeze_rate = float(sc.freeze_rate)
+        self._freeze_min_counter = int(sc.freeze_min_counter)
+        self._rotation_on = bool(self.config.molecule.enable_rotation)
+        # Кэш аналитической длины свободного пробега (см. ниже)
+        self._mfp_cache = None
+        # Перья отрисовки: цвета меняются только с конфигурацией,
+        # поэтому QPen/QColor не пересоздаются в каждом paintEvent
+        self._pen_border_outer = QPen(QColor(*self.config.border_colors.outer_color), 5)
+        self._pen_border_inner = QPen(QColor(*self.config.border_colors.inner_color), 5)
+        self._pen_trajectory = QPen(QColor(*self.config.particle_colors.trajectory_color), 1)
+        self._pen_orientation = QPen(QColor(255, 255, 255, 150), 1)
+        # Скорости изменения зависят и от режима — перепривязываем его
+        self._bind_mode(self.mode)
+
+    def _bind_mode(self, mode):
+        """
+        Режим меняется по кнопке, а не на каждом шаге: производные от
+        него величины (приращение ширины, флаги нагрева/охлаждения)
+        вычисляются здесь один раз вместо цепочки сравнений строк
+        в каждом кадре.
+        """
+        self.mode = mode
+        if mode in ("expansion", "heat_expansion", "cool_expansion"):
+            self._width_delta = self._exp_rate
+        elif mode in ("compression", "heat_compression", "cool_compression"):
+            self._width_delta = -self._comp_rate
+        else:
+            self._width_delta = 0.0
+        self._heating = mode in ("heat", "heat_expansion", "heat_compression")
+        self._freezing = mode in ("freeze", "cool_expansion", "cool_compression")
+
     def init_particles(self):
         """Инициализация частиц"""
         self.particles = []
         first_particle_color = self.config.particle_colors.first_particle_color
-        
+
         # Проверяем режим старта из угла (для демонстрации 2-го закона)
         corner_start = getattr(self.config.experiment, 'corner_start', False)
-        
+
+        # Координаты генерируются пакетно: два вызова генератора вместо
+        # 2N вызовов random.uniform в цикле
+        rng = np.random.default_rng()
+        if corner_start:
+            # Все частицы в левом верхнем углу
+            max_corner = min(self.width, self.height) * 0.3
+            xs = rng.uniform(self.r1, max_corner - self.r1, self.nn)
+            ys = rng.uniform(self.r1, max_corner - self.r1, self.nn)
+        else:
+            xs = rng.uniform(self.r1, self.width - self.r1, self.nn)
+            ys = rng.uniform(self.r1, self.height - self.r1, self.nn)
+
         for i in range(self.nn):
-            if corner_start:
-                # Все частицы в левом верхнем углу
-                max_corner = min(self.width, self.height) * 0.3
-                x = random.uniform(self.r1, max_corner - self.r1)
-                y = random.uniform(self.r1, max_corner - self.r1)
-            else:
-                x = random.uniform(self.r1, self.width - self.r1)
-                y = random.uniform(self.r1, self.height - self.r1)
-            
-            particle = GasParticle(x, y, self.r1, self.m1, self.v_start, self.config)
+            particle = GasParticle(float(xs[i]), float(ys[i]),
+                                   self.r1, self.m1, self.v_start, self.config)
             if i == 0:
                 particle.color = QColor(*first_particle_color)  # Первая частица зеленая
-                
+
                 # Если включен режим броуновского движения и режим single_large
-                if (hasattr(self.config, 'brownian') and 
-                    self.config.brownian.enabled and 
-                    self.config.brownian.mode == "single_large"):
+                if (hasattr(self.config, 'brownian') and
+                    self.config.brownian.enabled and
+                    self.config.brownian.mode == BrownianMode.SINGLE_LARGE):
                     # Делаем первую частицу большой и тяжёлой
                     particle.radius = int(self.r1 * self.config.brownian.large_radius_multiplier)
                     particle.mass = self.m1 * self.config.brownian.large_mass_multiplier
                     particle.v = self.v_start / 2  # Медленнее из-за массы
-                    
+
             self.particles.append(particle)
-        
+
+        # SoA-массивы — основное состояние поступательного движения.
+        # Кинематика считается векторизованно по непрерывным массивам,
+        # объекты GasParticle остаются для отрисовки и вращения.
+        # float32 достаточно для координат/скоростей в пикселях (радиусы ~10),
+        # а полоса памяти и ширина SIMD в парном проходе удваиваются.
+        # Энергетические редукции для статистики аккумулируются в float64.
+        self.px = xs.astype(np.float32)
+        self.py = ys.astype(np.float32)
+        self.pvx = np.array([p.v * math.cos(p.a) for p in self.particles], dtype=np.float32)
+        self.pvy = np.array([p.v * math.sin(p.a) for p in self.particles], dtype=np.float32)
+        self.pmass = np.array([float(p.mass) for p in self.particles], dtype=np.float32)
+        self.pradius = np.array([float(p.radius) for p in self.particles], dtype=np.float32)
+
         # Сохраняем начальную позицию броуновской частицы
         if self.particles:
             self.brownian_initial_pos = (self.particles[0].x, self.particles[0].y)
-            self.brownian_trajectory = [(self.particles[0].x, self.particles[0].y)]
-        
+            self.brownian_trajectory.clear()
+            self.brownian_trajectory.append((self.particles[0].x, self.particles[0].y))
+
         # Сохраняем начальные скорости и позиции для эргодической гипотезы
-        self.initial_velocities = [p.v for p in self.particles]
-        self.initial_positions_saved = [(p.x, p.y) for p in self.particles]
-        self.particle_velocity_histories = {i: [] for i in range(len(self.particles))}
-        self.time_averages_history = []
-        self.ensemble_averages_history = []
-        self.correlations_history = []
-        
+        self.initial_velocities = np.hypot(self.pvx, self.pvy).astype(np.float64)
+        self.initial_positions_saved = list(zip(self.px.tolist(), self.py.tolist()))
+        self.pvh = np.zeros((len(self.particles), self._series_maxlen),
+                            dtype=np.float32)
+        self.pvh_len = 0
+        self.time_averages_history.clear()
+        self.ensemble_averages_history.clear()
+        self.correlations_history.clear()
+
+        # Траектория храним только для отслеживаемой (первой) частицы:
+        # paintEvent рисует только её, N-1 остальных деков были балластом
+        self.traced_xy = deque(maxlen=self.config.particles.trajectory_max_length)
+        if self.particles:
+            self.traced_xy.append((float(self.px[0]), float(self.py[0])))
+
         # Инициализация данных для эмпирического измерения средней длины свободного пробега
-        self._free_path_samples = []
+        self._free_path_samples = deque(maxlen=self._step_series_maxlen)
         self._last_collision_pos = {}
         self._last_collision_time = {}
         for idx, p in enumerate(self.particles):
@@ -166,32 +259,34 @@ class SimulationWidget(QWidget):
 
         # Сохраняем начальную энергию для проверки 1-го закона
         self._calculate_and_save_initial_energy()
-    
+
+        # Частицы пересозданы — статичная часть пакета графиков устарела
+        self._data_view = None
+
     def paintEvent(self, event):
         """Отрисовка частиц и стенок"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        # Получаем цвета из конфигурации
-        border_outer = self.config.border_colors.outer_color
-        border_inner = self.config.border_colors.inner_color
-        trajectory_color = self.config.particle_colors.trajectory_color
-        
+
         # Рисуем внешнюю границу
-        painter.setPen(QPen(QColor(*border_outer), 5))
+        painter.setPen(self._pen_border_outer)
         painter.drawRect(0, 0, int(self.width0), int(self.height0))
-        
+
         # Рисуем текущую границу сосуда
-        painter.setPen(QPen(QColor(*border_inner), 5))
+        painter.setPen(self._pen_border_inner)
         painter.drawRect(0, 0, int(self.width), int(self.height))
-        
-        # Рисуем частицы
+
+        # Рисуем частицы. Одноатомные частицы рисуются пакетно:
+        # один QPainterPath на цвет и один fillPath вместо трёх
+        # Qt-вызовов (setBrush/setPen/drawEllipse) на каждую частицу.
+        batch_paths = {}  # QColor.rgba() -> (QColor, QPainterPath)
+        orientation_lines = []
         for particle in self.particles:
             # Проверяем, нужно ли рисовать молекулярную структуру
             if hasattr(particle, 'atom_count') and particle.atom_count > 1:
                 # Рисуем многоатомную молекулу
                 atom_positions = particle.get_atom_positions()
-                
+
                 # Рисуем связи между атомами
                 if len(atom_positions) > 1:
                     painter.setPen(QPen(particle.color.darker(150), 2))
@@ -204,7 +299,7 @@ class SimulationWidget(QWidget):
                         cx, cy, _ = atom_positions[0]
                         for ax, ay, _ in atom_positions[1:]:
                             painter.drawLine(int(cx), int(cy), int(ax), int(ay))
-                
+
                 # Рисуем атомы
                 painter.setPen(Qt.NoPen)
                 for i, (ax, ay, ar) in enumerate(atom_positions):
@@ -219,39 +314,43 @@ class SimulationWidget(QWidget):
                         int(ar * 2)
                     )
             else:
-                # Рисуем одноатомную частицу
-                painter.setBrush(particle.color)
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(
-                    int(particle.x - particle.radius),
-                    int(particle.y - particle.radius),
-                    particle.radius * 2,
-                    particle.radius * 2
-                )
-                
-                # Рисуем линию-индикатор ориентации для молекул с вращением
-                if (hasattr(particle, 'rotation_enabled') and 
-                    particle.rotation_enabled and 
+                # Одноатомная частица — накапливаем эллипс в путь своего цвета
+                key = particle.color.rgba()
+                entry = batch_paths.get(key)
+                if entry is None:
+                    entry = batch_paths[key] = (particle.color, QPainterPath())
+                r = float(particle.radius)
+                entry[1].addEllipse(QPointF(particle.x, particle.y), r, r)
+
+                # Линии-индикаторы ориентации собираем и рисуем одним пером
+                if (hasattr(particle, 'rotation_enabled') and
+                    particle.rotation_enabled and
                     particle.show_orientation and
-                    particle.molecule_type != "monatomic"):
-                    (x1, y1), (x2, y2) = particle.get_orientation_line()
-                    painter.setPen(QPen(QColor(255, 255, 255, 150), 1))
-                    painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-            
-            # Рисуем траекторию для первой частицы
-            if particle == self.particles[0] and len(particle.trajectory) > 1:
-                painter.setPen(QPen(QColor(*trajectory_color), 1))
-                for i in range(len(particle.trajectory) - 1):
-                    x1, y1 = particle.trajectory[i]
-                    x2, y2 = particle.trajectory[i + 1]
-                    painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-    
+                    particle.molecule_type != MoleculeType.MONATOMIC):
+                    orientation_lines.append(particle.get_orientation_line())
+
+        painter.setPen(Qt.NoPen)
+        for color, path in batch_paths.values():
+            painter.fillPath(path, QBrush(color))
+
+        if orientation_lines:
+            painter.setPen(self._pen_orientation)
+            for (x1, y1), (x2, y2) in orientation_lines:
+                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+
+        # Рисуем траекторию отслеживаемой (первой) частицы
+        if len(self.traced_xy) > 1:
+            painter.setPen(self._pen_trajectory)
+            # Один вызов drawPolyline вместо цикла drawLine по сегментам:
+            # ломаная уходит в Qt целиком, без Python-итераций на сегмент
+            painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in self.traced_xy]))
+
     def calculate_mean_free_path(self):
         """Расчет средней длины свободного пробега"""
         # Предпочитаем эмпирическую оценку, если есть выборка
         try:
             if hasattr(self, '_free_path_samples') and len(self._free_path_samples) > 0:
-                return mean(self._free_path_samples)
+                return float(np.mean(self._free_path_samples))
         except Exception:
             pass
 
@@ -269,19 +368,34 @@ class SimulationWidget(QWidget):
 
     def calculate_mean_free_path_analytic(self):
         """Аналитическая формула средней длины свободного пробега (без использования эмпирики)."""
+        # Чистая функция от (nn, width, height, r1). Из них между
+        # применениями конфигурации меняется только ширина (режимы
+        # расширения/сжатия), поэтому кэшируем результат по ширине
+        if self._mfp_cache is not None and self._mfp_cache[0] == self.width:
+            return self._mfp_cache[1]
+
         if self.nn == 0 or self.width * self.height == 0:
             return 0
 
         n = self.nn / (self.width * self.height)  # 2D плотность
-        
+
         r = self.r1
         # print(n, r)
         # print(1 / (2 * math.sqrt(2) * n * r))
-        return 1 / (4 * math.sqrt(2) * n * r)
-    
-    def calculate_collision_rate(self):
-        """Расчет частоты столкновений"""
-        avg_velocity = mean([p.v for p in self.particles]) if self.particles else 0
+        result = 1 / (4 * math.sqrt(2) * n * r)
+        self._mfp_cache = (self.width, result)
+        return result
+
+    def calculate_collision_rate(self, avg_velocity=None):
+        """
+        Расчет частоты столкновений.
+
+        avg_velocity передаётся из цикла симуляции, где средняя скорость
+        уже посчитана; пересчитываем её только при вызове извне.
+        """
+        if avg_velocity is None:
+            speeds = self._current_speeds()
+            avg_velocity = float(np.mean(speeds)) if self.nn else 0
         # Используем эффективную длину свободного пробега, учитывающую столкновения с другими частицами и со стенками
         # λ_eff вычисляется по сумме частот: 1/λ_eff = 1/λ_pp + 1/λ_wall
         try:
@@ -311,491 +425,420 @@ class SimulationWidget(QWidget):
             return 0
 
         return avg_velocity / lambda_eff
-    
-    def calculate_lennard_jones_force(self, r: float, epsilon: float, sigma: float) -> tuple:
+
+    def calculate_lennard_jones_force(self, r: float, epsilon: float, sigma6: float) -> tuple:
         """
         Вычисление силы потенциала Леннард-Джонса.
-        
+
         U(r) = 4ε[(σ/r)¹² - (σ/r)⁶]
         F(r) = -dU/dr = 24ε/r * [2(σ/r)¹² - (σ/r)⁶]
-        
+
         Returns:
             (force_magnitude, potential_energy)
         """
         if r <= 0:
             return 0.0, 0.0
-        
+
         # Избегаем деления на ноль
         softening = self.config.interaction_potentials.softening_distance
         r = max(r, softening)
-        
-        sr6 = (sigma / r) ** 6
+
+        # σ⁶ предвычислена при валидации конфигурации
+        sr6 = sigma6 / r ** 6
         sr12 = sr6 ** 2
-        
+
         # Сила (положительная = отталкивание, отрицательная = притяжение)
         force = 24 * epsilon / r * (2 * sr12 - sr6)
-        
+
         # Потенциальная энергия
         potential = 4 * epsilon * (sr12 - sr6)
-        
+
         return force, potential
-    
+
     def calculate_morse_force(self, r: float, D_e: float, a: float, r_e: float) -> tuple:
         """
         Вычисление силы потенциала Морзе.
-        
+
         U(r) = D_e * [1 - exp(-a*(r - r_e))]²
         F(r) = -dU/dr = 2*a*D_e * [1 - exp(-a*(r - r_e))] * exp(-a*(r - r_e))
-        
+
         Returns:
             (force_magnitude, potential_energy)
         """
         if r <= 0:
             return 0.0, 0.0
-        
+
         exp_term = math.exp(-a * (r - r_e))
         bracket = 1 - exp_term
-        
+
         # Сила
         force = 2 * a * D_e * bracket * exp_term
-        
+
         # Потенциальная энергия
         potential = D_e * bracket ** 2
-        
+
         return force, potential
-    
-    def calculate_dlvo_force(self, r: float, R: float, A_H: float, 
+
+    def calculate_dlvo_force(self, r: float, R: float, A_H: float,
                               psi0: float, kappa_inv: float, epsilon_r: float) -> tuple:
         """
         Вычисление силы потенциала ДЛФО.
-        
+
         Ван-дер-Ваальсово притяжение (упрощённая формула для сфер):
         U_vdW ≈ -A_H * R / (12 * h), где h = r - 2R (поверхность-поверхность)
-        
+
         Электростатическое отталкивание:
         U_elec ≈ 64*π*ε₀*ε_r*R*(k_B*T/e)² * tanh²(eψ₀/4k_BT) * exp(-κh)
         Упрощённо: U_elec ≈ A_elec * R * ψ₀² * exp(-h/κ⁻¹)
-        
+
         Returns:
             (force_magnitude, potential_energy)
         """
         # Поверхность-поверхность расстояние
         h = r - 2 * R
-        
+
         # Минимальное расстояние для избежания сингулярности
         softening = self.config.interaction_potentials.softening_distance
         h = max(h, softening)
-        
+
         # Ван-дер-Ваальсово притяжение
         # U_vdW = -A_H * R / (12 * h)
         # F_vdW = -dU/dr = -A_H * R / (12 * h²)
         U_vdW = -A_H * R / (12 * h)
         F_vdW = -A_H * R / (12 * h ** 2)  # Отрицательная сила = притяжение
-        
+
         # Электростатическое отталкивание
         # U_elec = ε₀*ε_r * R * ψ₀² * exp(-h/κ⁻¹)
         # F_elec = U_elec / κ⁻¹ (производная экспоненты)
         kappa = 1.0 / kappa_inv if kappa_inv > 0 else 1.0
         epsilon_0 = 8.854e-12  # Для нормализации используем безразмерный коэффициент
         coeff = 2 * math.pi * epsilon_r * R * psi0 ** 2  # Упрощённый коэффициент
-        
+
         exp_decay = math.exp(-kappa * h)
         U_elec = coeff * exp_decay
         F_elec = coeff * kappa * exp_decay  # Положительная сила = отталкивание
-        
+
         # Полная сила и потенциал
         force = F_elec + F_vdW  # F_vdW отрицательная (притяжение)
         potential = U_vdW + U_elec
-        
+
         return force, potential
-    
+
     def calculate_interaction_forces(self):
         """
         Вычисление межмолекулярных сил для всех пар частиц.
-        
+
         Returns:
             forces: dict - словарь {particle_index: (fx, fy)}
             total_potential: float - суммарная потенциальная энергия
         """
         forces = {i: [0.0, 0.0] for i in range(len(self.particles))}
         total_potential = 0.0
-        
+
         potentials = self.config.interaction_potentials
-        
+
         # Проверяем, включён ли хотя бы один потенциал
         lj = potentials.lennard_jones
         morse = potentials.morse
         dlvo = potentials.dlvo
-        
+
         if not (lj.enabled or morse.enabled or dlvo.enabled):
             return forces, 0.0
-        
+
         max_force = potentials.max_force
-        
+
         # Определяем радиус обрезки (максимальное расстояние взаимодействия)
         cutoff = 0
         if lj.enabled:
-            cutoff = max(cutoff, lj.sigma * lj.cutoff_multiplier)
+            cutoff = max(cutoff, lj.cutoff)
         if morse.enabled:
-            cutoff = max(cutoff, morse.r_e * morse.cutoff_multiplier)
+            cutoff = max(cutoff, morse.cutoff)
         if dlvo.enabled:
             cutoff = max(cutoff, dlvo.cutoff_distance)
-        
-        # Перебираем все пары частиц
-        for i in range(len(self.particles)):
-            for j in range(i + 1, len(self.particles)):
-                p1 = self.particles[i]
-                p2 = self.particles[j]
-                
-                # Вычисляем расстояние
-                dx = p2.x - p1.x
-                dy = p2.y - p1.y
-                r = math.sqrt(dx**2 + dy**2)
-                
-                # Пропускаем, если за пределами радиуса обрезки
-                if r > cutoff or r <= 0:
+
+        # Все атрибуты и связанные методы подняты в локальные имена:
+        # в O(N²)-цикле каждый LOAD_ATTR по self/конфигурации ощутим
+        px, py, pradius = self.px, self.py, self.pradius
+        sqrt = math.sqrt
+        nn = self.nn
+        cutoff2 = cutoff * cutoff
+        lj_enabled, morse_enabled, dlvo_enabled = lj.enabled, morse.enabled, dlvo.enabled
+        lj_cutoff = lj.cutoff if lj_enabled else 0.0
+        lj_epsilon, lj_sigma6 = lj.epsilon, lj.sigma6
+        morse_cutoff = morse.cutoff if morse_enabled else 0.0
+        morse_D_e, morse_a, morse_r_e = morse.D_e, morse.a, morse.r_e
+        dlvo_cutoff = dlvo.cutoff_distance if dlvo_enabled else 0.0
+        dlvo_hamaker = dlvo.hamaker_constant
+        dlvo_psi0 = dlvo.surface_potential
+        dlvo_debye = dlvo.debye_length
+        dlvo_eps_r = dlvo.dielectric_constant
+        calc_lj = self.calculate_lennard_jones_force
+        calc_morse = self.calculate_morse_force
+        calc_dlvo = self.calculate_dlvo_force
+        for i in range(nn):
+            for j in range(i + 1, nn):
+                # Отсев по квадрату расстояния: sqrt не нужен
+                # для пар за радиусом обрезки (подавляющее большинство)
+                dx = px[j] - px[i]
+                dy = py[j] - py[i]
+                d2 = dx * dx + dy * dy
+                if d2 > cutoff2 or d2 <= 0:
                     continue
-                
+                r = sqrt(d2)
+
                 # Единичный вектор направления (от p1 к p2)
                 ux = dx / r
                 uy = dy / r
-                
+
                 force_magnitude = 0.0
                 pair_potential = 0.0
-                
+
                 # Леннард-Джонс
-                if lj.enabled and r < lj.sigma * lj.cutoff_multiplier:
-                    f_lj, u_lj = self.calculate_lennard_jones_force(
-                        r, lj.epsilon, lj.sigma
-                    )
+                if lj_enabled and r < lj_cutoff:
+                    f_lj, u_lj = calc_lj(r, lj_epsilon, lj_sigma6)
                     force_magnitude += f_lj
                     pair_potential += u_lj
-                
+
                 # Морзе
-                if morse.enabled and r < morse.r_e * morse.cutoff_multiplier:
-                    f_morse, u_morse = self.calculate_morse_force(
-                        r, morse.D_e, morse.a, morse.r_e
-                    )
+                if morse_enabled and r < morse_cutoff:
+                    f_morse, u_morse = calc_morse(r, morse_D_e, morse_a, morse_r_e)
                     force_magnitude += f_morse
                     pair_potential += u_morse
-                
+
                 # ДЛФО
-                if dlvo.enabled and r < dlvo.cutoff_distance:
-                    avg_radius = (p1.radius + p2.radius) / 2
-                    f_dlvo, u_dlvo = self.calculate_dlvo_force(
+                if dlvo_enabled and r < dlvo_cutoff:
+                    avg_radius = (pradius[i] + pradius[j]) / 2
+                    f_dlvo, u_dlvo = calc_dlvo(
                         r, avg_radius,
-                        dlvo.hamaker_constant,
-                        dlvo.surface_potential,
-                        dlvo.debye_length,
-                        dlvo.dielectric_constant
+                        dlvo_hamaker,
+                        dlvo_psi0,
+                        dlvo_debye,
+                        dlvo_eps_r
                     )
                     force_magnitude += f_dlvo
                     pair_potential += u_dlvo
-                
+
                 # Ограничиваем максимальную силу
                 force_magnitude = max(-max_force, min(max_force, force_magnitude))
-                
+
                 # Разлагаем силу на компоненты
                 # Положительная сила = отталкивание (направлена от центра к частице)
                 fx = force_magnitude * ux
                 fy = force_magnitude * uy
-                
+
                 # Применяем силы (по 3-му закону Ньютона)
                 forces[i][0] -= fx  # На частицу i действует сила в обратном направлении
                 forces[i][1] -= fy
                 forces[j][0] += fx  # На частицу j действует сила
                 forces[j][1] += fy
-                
+
                 total_potential += pair_potential
-        
+
         return forces, total_potential
-    
+
     def apply_interaction_forces(self, forces: dict, dt: float):
         """
         Применение межмолекулярных сил к частицам.
-        
+
         Используем метод Верле для интегрирования:
         a = F/m
         v_new = v_old + a*dt
         """
-        for i, particle in enumerate(self.particles):
+        for i in range(self.nn):
             if i not in forces:
                 continue
-            
+
             fx, fy = forces[i]
-            
-            # Ускорение
-            ax = fx / particle.mass
-            ay = fy / particle.mass
-            
-            # Текущие компоненты скорости
-            vx = particle.v * math.cos(particle.a)
-            vy = particle.v * math.sin(particle.a)
-            
-            # Обновляем скорость
-            vx_new = vx + ax * dt
-            vy_new = vy + ay * dt
-            
-            # Обновляем модуль и направление скорости
-            particle.v = math.sqrt(vx_new**2 + vy_new**2)
-            particle.a = math.atan2(vy_new, vx_new)
-    
+
+            # Скорость хранится в декартовых компонентах —
+            # интегрирование сводится к двум сложениям, без sqrt/atan2
+            self.pvx[i] += fx / self.pmass[i] * dt
+            self.pvy[i] += fy / self.pmass[i] * dt
+
     def update_simulation(self):
         """Основной цикл симуляции"""
         if not self.running:
             self.simulation_timer.stop()
             return
-        
+
         self.NOW_TIME += self.time_sleep
-        
+
         # Вычисляем межмолекулярные силы (потенциалы взаимодействия)
         interaction_forces, self.potential_energy = self.calculate_interaction_forces()
-        
+
         # Применяем межмолекулярные силы к частицам
         if any(f[0] != 0 or f[1] != 0 for f in interaction_forces.values()):
             self.apply_interaction_forces(interaction_forces, self.time_sleep)
-        
-        # Обновление позиций частиц
-        for particle in self.particles:
-            # Обновляем скорость под действием гравитации (если включена)
-            if hasattr(self.config, 'gravity') and self.config.gravity.enabled:
-                g = self.config.gravity.g
-                # Гравитация направлена вниз (увеличивает y в системе координат экрана)
-                # v_y += g * dt
-                vy = particle.v * math.sin(particle.a) + g * self.time_sleep
-                vx = particle.v * math.cos(particle.a)
-                particle.v = math.sqrt(vx**2 + vy**2)
-                particle.a = math.atan2(vy, vx)
-            
-            particle.x += particle.v * math.cos(particle.a)
-            particle.y += particle.v * math.sin(particle.a)
-            particle.trajectory.append((particle.x, particle.y))
-            
-            # Обновляем вращение молекулы (если включено)
-            if hasattr(particle, 'update_rotation'):
-                particle.update_rotation(self.time_sleep)
-        
+
+        # Гравитация направлена вниз (увеличивает y в системе координат экрана)
+        gravity_dvy = (self._gravity_g * self.time_sleep
+                       if self.config.gravity.enabled else 0.0)
+
+        # Слитый кинематический шаг: гравитация, перенос и отражения
+        # от стенок в одном ядре
+        d_left, d_right, d_up, d_down = _advect_and_reflect(
+            self.px, self.py, self.pvx, self.pvy, self.pmass, self.pradius,
+            self.width, self.height, gravity_dvy)
+        self.delta_px_left += d_left
+        self.delta_px_right += d_right
+        self.delta_py_up += d_up
+        self.delta_py_down += d_down
+
         # Сохраняем траекторию броуновской частицы
-        if self.particles:
-            self.brownian_trajectory.append((self.particles[0].x, self.particles[0].y))
-            
+        if self.nn:
+            self.brownian_trajectory.append((float(self.px[0]), float(self.py[0])))
+
             # Расчёт MSD
             if self.brownian_initial_pos is not None:
                 x0, y0 = self.brownian_initial_pos
-                x, y = self.particles[0].x, self.particles[0].y
-                msd = (x - x0)**2 + (y - y0)**2
-                self.MSD.append(msd)
-        
-        # Проверка столкновений со стенками
-        for particle in self.particles:
-            # Левая стенка
-            if particle.x <= particle.radius and (particle.a > math.pi/2 or particle.a < -math.pi/2):
-                particle.a = math.pi - particle.a
-                self.delta_px_left += abs(2 * particle.mass * particle.v * math.cos(particle.a))
-            
-            # Правая стенка
-            if particle.x >= self.width - particle.radius and (-math.pi/2 < particle.a < math.pi/2):
-                particle.a = math.pi - particle.a
-                self.delta_px_right += abs(2 * particle.mass * particle.v * math.cos(particle.a))
-            
-            # Верхняя стенка
-            if particle.y <= particle.radius and (-math.pi < particle.a < 0):
-                particle.a = -particle.a
-                self.delta_py_up += abs(2 * particle.mass * particle.v * math.sin(particle.a))
-            
-            # Нижняя стенка
-            if particle.y >= self.height - particle.radius and (0 < particle.a < math.pi):
-                particle.a = -particle.a
-                self.delta_py_down += abs(2 * particle.mass * particle.v * math.sin(particle.a))
-            
-            # Нормализация угла
-            while particle.a > math.pi:
-                particle.a -= 2 * math.pi
-            while particle.a < -math.pi:
-                particle.a += 2 * math.pi
-        
+                msd = (self.px[0] - x0)**2 + (self.py[0] - y0)**2
+                self.MSD.append(float(msd))
+
         # Проверка столкновений между частицами
-        collisions_this_frame = 0
-        for i in range(len(self.particles)):
-            for j in range(i + 1, len(self.particles)):
-                p1 = self.particles[i]
-                p2 = self.particles[j]
-                
-                # Используем фактический радиус каждой частицы
-                radius_sum = p1.radius + p2.radius
-                distance_multiplier = self.config.collision.distance_multiplier
-                
-                if (abs(p1.x - p2.x) <= distance_multiplier * radius_sum and 
-                    abs(p1.y - p2.y) <= distance_multiplier * radius_sum):
-                    
-                    dist = math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
-                    
-                    # Используем сумму фактических радиусов
-                    if dist <= radius_sum + self.config.collision.overlap_threshold:
-                        collisions_this_frame += 1
-                        
-                        # Рассчитываем новые положения
-                        prediction_step = self.config.collision.prediction_step
-                        x1_new = p1.x + p1.v * math.cos(p1.a) * prediction_step
-                        y1_new = p1.y + p1.v * math.sin(p1.a) * prediction_step
-                        x2_new = p2.x + p2.v * math.cos(p2.a) * prediction_step
-                        y2_new = p2.y + p2.v * math.sin(p2.a) * prediction_step
-                        dist_new = math.sqrt((x1_new - x2_new)**2 + (y1_new - y2_new)**2)
-                        
-                        if dist > dist_new:
-                            # Расчет столкновения
-                            collision_angle = math.atan2(p2.y - p1.y, p2.x - p1.x)
-                            
-                            # Скорости в системе координат столкновения
-                            velocity_angle1 = p1.a - collision_angle
-                            velocity_angle2 = p2.a - collision_angle
-                            
-                            # Компоненты скоростей
-                            normal_velocity1 = p1.v * math.cos(velocity_angle1)
-                            normal_velocity2 = p2.v * math.cos(velocity_angle2)
-                            
-                            tangential_velocity1 = p1.v * math.sin(velocity_angle1)
-                            tangential_velocity2 = p2.v * math.sin(velocity_angle2)
-                            
-                            # Обмен нормальными компонентами (упругое столкновение)
-                            m1, m2 = p1.mass, p2.mass
-                            total_mass = m1 + m2
-                            
-                            # Формулы для упругого столкновения с разными массами
-                            normal_velocity1_new = ((m1 - m2) * normal_velocity1 + 2 * m2 * normal_velocity2) / total_mass
-                            normal_velocity2_new = ((m2 - m1) * normal_velocity2 + 2 * m1 * normal_velocity1) / total_mass
-                            
-                            # Новые скорости
-                            p1.v = math.sqrt(normal_velocity1_new**2 + tangential_velocity1**2)
-                            p2.v = math.sqrt(normal_velocity2_new**2 + tangential_velocity2**2)
-                            
-                            # Новые углы
-                            new_angle1 = math.atan2(tangential_velocity1, normal_velocity1_new)
-                            new_angle2 = math.atan2(tangential_velocity2, normal_velocity2_new)
-                            
-                            p1.a = collision_angle + new_angle1
-                            p2.a = collision_angle + new_angle2
-                            
-                            # Обмен угловым моментом для молекул с вращением
-                            # При столкновении часть кинетической энергии может перейти во вращение
-                            if (hasattr(p1, 'rotation_enabled') and p1.rotation_enabled and 
-                                p1.molecule_type != "monatomic"):
-                                # Передача углового момента от касательной скорости
-                                # Момент силы: τ = r × F, где r - точка контакта
-                                # Упрощённая модель: часть касательного импульса передаётся во вращение
-                                impact_arm = p1.radius  # Плечо силы
-                                delta_tangent1 = tangential_velocity1 - tangential_velocity1  # Изменение касательной скорости
-                                if p1.I > 0:
-                                    # Случайный обмен угловой скоростью при столкновении
-                                    omega_transfer = 0.3 * tangential_velocity1 / (p1.I * impact_arm) if impact_arm > 0 else 0
-                                    p1.omega += random.uniform(-abs(omega_transfer), abs(omega_transfer))
-                            
-                            if (hasattr(p2, 'rotation_enabled') and p2.rotation_enabled and 
-                                p2.molecule_type != "monatomic"):
-                                impact_arm = p2.radius
-                                if p2.I > 0:
-                                    omega_transfer = 0.3 * tangential_velocity2 / (p2.I * impact_arm) if impact_arm > 0 else 0
-                                    p2.omega += random.uniform(-abs(omega_transfer), abs(omega_transfer))
-
-                            # Эмпирическая запись длины свободного пробега: расстояние, пройденное частицей с момента последнего столкновения
-                            try:
-                                # Индексы i и j доступны из внешнего цикла
-                                for idx, part in ((i, p1), (j, p2)):
-                                    last = self._last_collision_pos.get(idx)
-                                    if last is not None:
-                                        dx = part.x - last[0]
-                                        dy = part.y - last[1]
-                                        dist_moved = math.sqrt(dx * dx + dy * dy)
-                                        if dist_moved > 0:
-                                            self._free_path_samples.append(dist_moved)
-                                    # Обновляем информацию о последнем столкновении
-                                    self._last_collision_pos[idx] = (part.x, part.y)
-                                    self._last_collision_time[idx] = self.NOW_TIME
-                            except Exception:
-                                # Безопасно пропускаем запись, если структура не инициализирована
-                                pass
-                            
-                            # Нормализация углов
-                            while p1.a > math.pi:
-                                p1.a -= 2 * math.pi
-                            while p1.a < -math.pi:
-                                p1.a += 2 * math.pi
-                            while p2.a > math.pi:
-                                p2.a -= 2 * math.pi
-                            while p2.a < -math.pi:
-                                p2.a += 2 * math.pi
-        
+        px, py, pvx, pvy = self.px, self.py, self.pvx, self.pvy
+        pmass, pradius = self.pmass, self.pradius
+        distance_multiplier = self._dist_mul
+        overlap_threshold = self._overlap_thr
+        # Пространственный поиск соседей вместо широковещательной матрицы:
+        # N² двойных чисел не аллоцируются вовсе, kd-дерево отдаёт только
+        # пары в радиусе возможного касания
+        search_radius = 2.0 * float(pradius.max()) + overlap_threshold
+        tree = cKDTree(np.column_stack((px, py)))
+        pairs = tree.query_pairs(search_radius, output_type='ndarray')
+        if pairs.size:
+            ci, cj = pairs[:, 0], pairs[:, 1]
+            dxp = px[ci] - px[cj]
+            dyp = py[ci] - py[cj]
+            rsum = pradius[ci] + pradius[cj]
+            hit = ((np.abs(dxp) <= distance_multiplier * rsum) &
+                   (np.abs(dyp) <= distance_multiplier * rsum) &
+                   (dxp * dxp + dyp * dyp <= (rsum + overlap_threshold) ** 2))
+            i_idx, j_idx = ci[hit], cj[hit]
+        else:
+            i_idx = j_idx = np.empty(0, dtype=np.intp)
+        collisions_this_frame = int(i_idx.size)
+
+        # Разрешение столкновений: скалярное ядро на SoA-массивах
+        resolved, tang1, tang2 = _resolve_collision_pairs(
+            px, py, pvx, pvy, pmass, i_idx, j_idx)
+
+        # Пост-обработка разрешённых пар: передача углового момента
+        # и эмпирическая длина свободного пробега (объекты и словари —
+        # вне ядра)
+        for k in np.nonzero(resolved)[0].tolist():
+            i = int(i_idx[k])
+            j = int(j_idx[k])
+
+            # Обмен угловым моментом для молекул с вращением
+            # При столкновении часть кинетической энергии может перейти во вращение
+            p1 = self.particles[i]
+            p2 = self.particles[j]
+            if (p1.rotation_enabled and
+                p1.molecule_type != MoleculeType.MONATOMIC):
+                # Упрощённая модель: часть касательного импульса передаётся во вращение
+                impact_arm = p1.radius  # Плечо силы
+                if p1.I > 0:
+                    # Случайный обмен угловой скоростью при столкновении
+                    omega_transfer = 0.3 * tang1[k] / (p1.I * impact_arm) if impact_arm > 0 else 0
+                    p1.omega += random.uniform(-abs(omega_transfer), abs(omega_transfer))
+
+            if (p2.rotation_enabled and
+                p2.molecule_type != MoleculeType.MONATOMIC):
+                impact_arm = p2.radius
+                if p2.I > 0:
+                    omega_transfer = 0.3 * tang2[k] / (p2.I * impact_arm) if impact_arm > 0 else 0
+                    p2.omega += random.uniform(-abs(omega_transfer), abs(omega_transfer))
+
+            # Эмпирическая запись длины свободного пробега: расстояние,
+            # пройденное частицей с момента последнего столкновения
+            try:
+                for idx in (i, j):
+                    last = self._last_collision_pos.get(idx)
+                    if last is not None:
+                        dx = px[idx] - last[0]
+                        dy = py[idx] - last[1]
+                        dist_moved = math.sqrt(dx * dx + dy * dy)
+                        if dist_moved > 0:
+                            self._free_path_samples.append(dist_moved)
+                    # Обновляем информацию о последнем столкновении
+                    self._last_collision_pos[idx] = (float(px[idx]), float(py[idx]))
+                    self._last_collision_time[idx] = self.NOW_TIME
+            except Exception:
+                # Безопасно пропускаем запись, если структура не инициализирована
+                pass
+
         self.collision_count += collisions_this_frame
-        
+
         # Проверяем изолированность системы
         is_isolated = getattr(self.config.experiment, 'isolated_system', False)
-        
-        # Изменение объема (только если система не изолирована)
+
+        # Изменение объема (только если система не изолирована).
+        # Приращение ширины и флаги нагрева/охлаждения предвычислены
+        # в _bind_mode — сравнений строк режима в кадре не осталось
         if not is_isolated:
-            # Простые режимы изменения объема
-            if self.mode == "expansion":
-                self.width += self.config.state_change.expansion_rate
-            elif self.mode == "compression":
-                self.width -= self.config.state_change.compression_rate
-            # Комбинированные режимы изменения объема
-            elif self.mode in ["heat_expansion", "cool_expansion"]:
-                self.width += self.config.state_change.expansion_rate
-            elif self.mode in ["heat_compression", "cool_compression"]:
-                self.width -= self.config.state_change.compression_rate
-            
-            # Простые режимы изменения температуры
-            if self.mode == "heat":
-                for particle in self.particles:
-                    particle.v += self.config.state_change.heat_rate
-            elif self.mode == "freeze" and self.counter >= self.config.state_change.freeze_min_counter:
-                for particle in self.particles:
-                    if particle.v - self.config.state_change.freeze_rate > 0:
-                        particle.v -= self.config.state_change.freeze_rate
-            # Комбинированные режимы изменения температуры
-            elif self.mode in ["heat_expansion", "heat_compression"]:
-                for particle in self.particles:
-                    particle.v += self.config.state_change.heat_rate
-            elif self.mode in ["cool_expansion", "cool_compression"] and self.counter >= self.config.state_change.freeze_min_counter:
-                for particle in self.particles:
-                    if particle.v - self.config.state_change.freeze_rate > 0:
-                        particle.v -= self.config.state_change.freeze_rate
-        
+            if self._width_delta:
+                self.width += self._width_delta
+
+            # Режимы изменения температуры: модуль скорости
+            # меняется масштабированием декартовых компонент
+            if self._heating:
+                speed = np.hypot(self.pvx, self.pvy)
+                factor = np.where(speed > 0,
+                                  (speed + self._heat_rate) / np.where(speed > 0, speed, 1.0),
+                                  1.0)
+                self.pvx *= factor
+                self.pvy *= factor
+            elif self._freezing and self.counter >= self._freeze_min_counter:
+                freeze_rate = self._freeze_rate
+                speed = np.hypot(self.pvx, self.pvy)
+                factor = np.where(speed > freeze_rate,
+                                  (speed - freeze_rate) / np.where(speed > 0, speed, 1.0),
+                                  1.0)
+                self.pvx *= factor
+                self.pvy *= factor
+
+        # Синхронизация массивов с объектами частиц:
+        # отрисовка, траектории и вращение работают с объектами
+        for i, particle in enumerate(self.particles):
+            particle.x = float(px[i])
+            particle.y = float(py[i])
+            particle.update_rotation(self.time_sleep)
+
+        # Траектория пишется один раз за шаг и только для отслеживаемой частицы
+        if self.particles:
+            self.traced_xy.append((float(px[0]), float(py[0])))
+
         # Расчет энергии системы (поступательная + вращательная)
-        self.Energy_check = 0
-        self.Energy_translational = 0
+        # Поступательная часть — одна редукция по непрерывным массивам
+        speeds = self._last_speeds = np.hypot(self.pvx, self.pvy)
+        speeds64 = speeds.astype(np.float64)
+        self.Energy_translational = 0.5 * float(np.dot(self.pmass, speeds64 * speeds64))
+        velocities = speeds.tolist()
+
+        # Вращательная энергия — только если вращение вообще включено
         self.Energy_rotational = 0
-        velocities = []
         angular_velocities = []
-        
-        for particle in self.particles:
-            # Поступательная энергия
-            e_trans = particle.mass * (particle.v**2) / 2
-            self.Energy_translational += e_trans
-            velocities.append(particle.v)
-            
-            # Вращательная энергия (если есть)
-            if hasattr(particle, 'rotational_energy'):
-                e_rot = particle.rotational_energy()
-                self.Energy_rotational += e_rot
-                if hasattr(particle, 'omega'):
-                    angular_velocities.append(particle.omega)
-        
+        if self._rotation_on:
+            for particle in self.particles:
+                self.Energy_rotational += particle.rotational_energy()
+                angular_velocities.append(particle.omega)
+
         self.Energy_check = self.Energy_translational + self.Energy_rotational
-        
+
         # Добавляем потенциальную энергию к полной энергии
         self.Energy_total = self.Energy_check + self.potential_energy
-        
+
         # Логирование и обновление графиков
         self.counter += 1
         if self.time_check <= -self.timer + self.NOW_TIME:
             # Расчет среднего давления
-            avg_pressure = ((self.delta_px_left + self.delta_px_right) / 
-                          (self.time_check * self.height) + 
-                          (self.delta_py_up + self.delta_py_down) / 
+            avg_pressure = ((self.delta_px_left + self.delta_px_right) /
+                          (self.time_check * self.height) +
+                          (self.delta_py_up + self.delta_py_down) /
                           (self.time_check * self.width)) / 4
-            
+
             volume = self.width * self.height - self.nn * math.pi * (self.r1**2)
-            avg_velocity = mean(velocities) if velocities else 0
+            avg_velocity = float(np.mean(speeds)) if self.nn else 0
             density = self.nn / (self.width * self.height) if self.width * self.height > 0 else 0
             # Эмпирическая оценка (если есть выборка), иначе аналитическая/оценка
             mean_free_path = self.calculate_mean_free_path()
@@ -821,8 +864,8 @@ class SimulationWidget(QWidget):
                 mean_free_path_eff = float('inf')
 
             # Частота столкновений на основе эффективной длины свободного пробега
-            collision_rate = self.calculate_collision_rate()
-            
+            collision_rate = self.calculate_collision_rate(avg_velocity)
+
             # Формирование строки лога
             log_entry = (f"{volume:.1f}       "
                         f"{self.Energy_check:.3f}         "
@@ -830,10 +873,10 @@ class SimulationWidget(QWidget):
                         f"{avg_velocity:.3f}        "
                         f"{self.NOW_TIME:.3f}     "
                         f"{self.mode}")
-            
+
             self.log_buffer.append(log_entry)
             self.update_signal.emit(volume, self.Energy_check, avg_pressure, avg_velocity, log_entry)
-            
+
             # Сохранение данных для графиков
             self.Pressure.append(avg_pressure)
             self.Temperature.append(self.Energy_check / self.nn * 100) # нормировано на 100 молекул по умолчанию
@@ -844,322 +887,357 @@ class SimulationWidget(QWidget):
             self.KineticEnergy.append(self.Energy_check)
             self.PotentialEnergy.append(self.potential_energy)
             self.Density.append(density)
-            self.VelocityDistribution.extend(velocities)
             # Сохраняем эмпирическую оценку (или фоллбек)
             self.MeanFreePath.append(mean_free_path)
             # Сохраняем теоретическое значение (частицы-пары)
-            if not hasattr(self, 'MeanFreePath_theoretical'):
-                self.MeanFreePath_theoretical = []
             self.MeanFreePath_theoretical.append(mean_free_path_pp)
             # Сохраняем вклад стен и эффективную длину
-            if not hasattr(self, 'MeanFreePath_wall'):
-                self.MeanFreePath_wall = []
             self.MeanFreePath_wall.append(mean_free_path_wall)
-            if not hasattr(self, 'MeanFreePath_eff'):
-                self.MeanFreePath_eff = []
             self.MeanFreePath_eff.append(mean_free_path_eff)
             # Вычисляем скользящее среднее по последним 100 значениям (эмпирическое)
             try:
-                if not hasattr(self, 'MeanFreePath_roll100'):
-                    self.MeanFreePath_roll100 = []
-
                 # Берём последние конечные значения из эмпирической кривой
                 finite_vals = [v for v in self.MeanFreePath if v is not None and math.isfinite(v)]
                 if len(finite_vals) == 0:
-                    roll = mean_free_path_theory
+                    roll = mean_free_path_pp
                 else:
                     window = finite_vals[-100:]
-                    roll = mean(window)
+                    roll = float(np.mean(window))
 
                 self.MeanFreePath_roll100.append(roll)
             except Exception:
                 # на случай ошибок — добавляем теоретическое значение
-                if not hasattr(self, 'MeanFreePath_roll100'):
-                    self.MeanFreePath_roll100 = []
-                self.MeanFreePath_roll100.append(mean_free_path_theory)
+                self.MeanFreePath_roll100.append(mean_free_path_pp)
             self.CollisionRate.append(collision_rate)
-            
+
             # Позиции частиц для распределения Больцмана и энтропии
-            positions = [(p.x, p.y) for p in self.particles]
-            
-            # Расчёт энтропии для 2-го закона
-            velocity_entropy = self._calculate_velocity_entropy(velocities)
+            positions = list(zip(self.px.tolist(), self.py.tolist()))
+
+            # Расчёт энтропии для 2-го закона — обе оценки из одной
+            # гистограммы скоростей
+            velocity_entropy, h_func = self._velocity_histogram_entropies(speeds)
             if velocity_entropy is not None:
                 self.Entropy.append(velocity_entropy)
-            
-            h_func = self._calculate_h_function(velocities)
+
             if h_func is not None:
                 self.H_function.append(h_func)
-            
-            spatial_entropy = self._calculate_spatial_entropy(positions)
+
+            spatial_entropy = self._calculate_spatial_entropy()
             if spatial_entropy is not None:
                 self.SpatialEntropy.append(spatial_entropy)
-            
+
             # Расчёт данных для эргодической гипотезы
-            self._update_ergodic_data(velocities)
-            
+            self._update_ergodic_data(speeds)
+
             # Отправка данных в окно графиков
             is_isolated = getattr(self.config.experiment, 'isolated_system', False)
-            
-            data_dict = {
-                'time': self.Time_meas,
-                'pressure': self.Pressure,
-                'temperature': self.Temperature,
-                'volume': self.Volume,
-                'avg_velocity': self.AvgVelocity,
-                'kinetic_energy': self.KineticEnergy,
-                'density': self.Density,
-                'velocities': velocities,
-                'mean_free_path': self.MeanFreePath,
-                'mean_free_path_theoretical': self.MeanFreePath_theoretical,
-                'mean_free_path_roll100': self.MeanFreePath_roll100,
-                'mean_free_path_wall': getattr(self, 'MeanFreePath_wall', []),
-                'mean_free_path_eff': getattr(self, 'MeanFreePath_eff', []),
-                'collision_rate': self.CollisionRate,
-                'mode': self.mode,
-                'collision_count': self.collision_count,
-                # Новые данные для физических законов
-                'initial_energy': self.initial_energy,
-                'isolated_system': is_isolated,
-                'positions': positions,
-                'entropy': self.Entropy,
-                'msd': self.MSD,
-                'particle_mass': self.m1,
-                # Данные для броуновского движения
-                'brownian_trajectory': self.brownian_trajectory,
-                'brownian_config': {
-                    'enabled': getattr(self.config.brownian, 'enabled', False),
-                    'mode': getattr(self.config.brownian, 'mode', 'single_large'),
-                    'large_radius': int(self.r1 * getattr(self.config.brownian, 'large_radius_multiplier', 3.0)),
-                    'large_mass': self.m1 * getattr(self.config.brownian, 'large_mass_multiplier', 10.0)
-                },
-                'particle_radius': self.r1,
-                'time_step': self.time_check,
-                # Данные для распределения Больцмана
-                'gravity_config': {
-                    'enabled': getattr(self.config.gravity, 'enabled', False),
-                    'g': getattr(self.config.gravity, 'g', 0.1)
-                },
-                'container_height': self.height,
-                'container_width': self.width,
-                # Данные для энтропии (2-й закон)
-                'h_function': self.H_function,
-                'spatial_entropy': self.SpatialEntropy,
-                'corner_start': getattr(self.config.experiment, 'corner_start', False),
-                'n_particles': self.nn,
-                # Данные для эргодической гипотезы
-                'time_averages_history': self.time_averages_history,
-                'ensemble_averages_history': self.ensemble_averages_history,
-                'initial_velocities': self.initial_velocities,
-                'initial_positions': self.initial_positions_saved,
-                'correlations_history': self.correlations_history,
-                'particle_velocity_histories': self.particle_velocity_histories,
-                # Данные для молекулярной структуры (вращательные степени свободы)
-                'molecule_config': {
-                    'molecule_type': getattr(self.config.molecule, 'molecule_type', 'monatomic'),
-                    'geometry': getattr(self.config.molecule, 'geometry', 'linear'),
-                    'enable_rotation': getattr(self.config.molecule, 'enable_rotation', False),
-                    'moment_of_inertia': getattr(self.config.molecule, 'moment_of_inertia', 1.0),
-                    'degrees_of_freedom': self.config.molecule.get_degrees_of_freedom() if hasattr(self.config, 'molecule') else 2
-                },
-                'angular_velocities': angular_velocities,
-                'energy_translational': self.Energy_translational,
-                'energy_rotational': self.Energy_rotational,
-                'energy_potential': self.potential_energy,
-                'potential_energy_history': self.PotentialEnergy,
-                'energy_total': self.Energy_total,
-                # Конфигурация потенциалов взаимодействия
-                'potentials_config': {
-                    'lennard_jones': {
-                        'enabled': self.config.interaction_potentials.lennard_jones.enabled,
-                        'epsilon': self.config.interaction_potentials.lennard_jones.epsilon,
-                        'sigma': self.config.interaction_potentials.lennard_jones.sigma
-                    },
-                    'morse': {
-                        'enabled': self.config.interaction_potentials.morse.enabled,
-                        'D_e': self.config.interaction_potentials.morse.D_e,
-                        'a': self.config.interaction_potentials.morse.a,
-                        'r_e': self.config.interaction_potentials.morse.r_e
-                    },
-                    'dlvo': {
-                        'enabled': self.config.interaction_potentials.dlvo.enabled,
-                        'hamaker_constant': self.config.interaction_potentials.dlvo.hamaker_constant,
-                        'surface_potential': self.config.interaction_potentials.dlvo.surface_potential,
-                        'debye_length': self.config.interaction_potentials.dlvo.debye_length
-                    }
-                }
-            }
+
+            # Серии хранятся в ограниченных deque; получателям отдаём
+            # numpy-снимки: графики работают с ними без промежуточных
+            # списков PyFloat, а живые буферы симуляции не разделяются
+            def arr(series):
+                return np.fromiter(series, dtype=np.float64, count=len(series))
+
+            # Словарь пакета создаётся один раз; статичные на время жизни
+            # конфигурации ключи не пересобираются на каждом тике
+            if self._data_view is None:
+                self._data_view = self._build_static_data_view()
+            data_dict = self._data_view
+            data_dict['time'] = arr(self.Time_meas)
+            data_dict['pressure'] = arr(self.Pressure)
+            data_dict['temperature'] = arr(self.Temperature)
+            data_dict['volume'] = arr(self.Volume)
+            data_dict['avg_velocity'] = arr(self.AvgVelocity)
+            data_dict['kinetic_energy'] = arr(self.KineticEnergy)
+            data_dict['density'] = arr(self.Density)
+            data_dict['velocities'] = velocities
+            data_dict['mean_free_path'] = arr(self.MeanFreePath)
+            data_dict['mean_free_path_theoretical'] = arr(self.MeanFreePath_theoretical)
+            data_dict['mean_free_path_roll100'] = arr(self.MeanFreePath_roll100)
+            data_dict['mean_free_path_wall'] = arr(self.MeanFreePath_wall)
+            data_dict['mean_free_path_eff'] = arr(self.MeanFreePath_eff)
+            data_dict['collision_rate'] = arr(self.CollisionRate)
+            data_dict['mode'] = self.mode
+            data_dict['collision_count'] = self.collision_count
+            data_dict['initial_energy'] = self.initial_energy
+            data_dict['isolated_system'] = is_isolated
+            data_dict['positions'] = positions
+            data_dict['entropy'] = arr(self.Entropy)
+            data_dict['msd'] = arr(self.MSD)
+            data_dict['brownian_trajectory'] = list(self.brownian_trajectory)
+            # Переключатели гравитации/броуновского режима меняются на лету
+            data_dict['brownian_config']['enabled'] = self.config.brownian.enabled
+            data_dict['gravity_config']['enabled'] = self.config.gravity.enabled
+            data_dict['container_height'] = self.height
+            data_dict['container_width'] = self.width
+            data_dict['h_function'] = arr(self.H_function)
+            data_dict['spatial_entropy'] = arr(self.SpatialEntropy)
+            data_dict['corner_start'] = getattr(self.config.experiment, 'corner_start', False)
+            data_dict['time_averages_history'] = arr(self.time_averages_history)
+            data_dict['ensemble_averages_history'] = arr(self.ensemble_averages_history)
+            data_dict['correlations_history'] = arr(self.correlations_history)
+            data_dict['particle_velocity_histories'] = \
+                self.pvh[:, :min(self.pvh_len, self.pvh.shape[1])].copy()
+            data_dict['angular_velocities'] = angular_velocities
+            data_dict['energy_translational'] = self.Energy_translational
+            data_dict['energy_rotational'] = self.Energy_rotational
+            data_dict['energy_potential'] = self.potential_energy
+            data_dict['potential_energy_history'] = arr(self.PotentialEnergy)
+            data_dict['energy_total'] = self.Energy_total
             # print(f"volume: {volume}")
             # print( int(self.r1 * getattr(self.config.brownian, 'large_radius_multiplier', 3.0)) )
             self.data_updated.emit(data_dict)
-            
+
             # Сброс счетчиков импульса
             self.delta_px_left = 0
             self.delta_px_right = 0
             self.delta_py_up = 0
             self.delta_py_down = 0
-            
+
             self.timer = self.NOW_TIME
-        
-        self.update()
-    
+
+    def _build_static_data_view(self):
+        """
+        Статичная часть пакета data_updated: ключи, которые меняются
+        только при применении новой конфигурации (apply_config сбрасывает
+        self._data_view и пакет собирается заново).
+        """
+        return {
+            'particle_mass': self.m1,
+            'particle_radius': self.r1,
+            'time_step': self.time_check,
+            'n_particles': self.nn,
+            'initial_velocities': self.initial_velocities.tolist(),
+            'initial_positions': self.initial_positions_saved,
+            'brownian_config': {
+                'enabled': self.config.brownian.enabled,
+                'mode': self.config.brownian.mode.name.lower(),
+                'large_radius': int(self.r1 * self.config.brownian.large_radius_multiplier),
+                'large_mass': self.m1 * self.config.brownian.large_mass_multiplier
+            },
+            'gravity_config': {
+                'enabled': self.config.gravity.enabled,
+                'g': self.config.gravity.g
+            },
+            'molecule_config': {
+                'molecule_type': self.config.molecule.molecule_type.name.lower(),
+                'geometry': self.config.molecule.geometry,
+                'enable_rotation': self.config.molecule.enable_rotation,
+                'moment_of_inertia': self.config.molecule.moment_of_inertia,
+                'degrees_of_freedom': self.config.molecule.dof
+            },
+            'potentials_config': {
+                'lennard_jones': {
+                    'enabled': self.config.interaction_potentials.lennard_jones.enabled,
+                    'epsilon': self.config.interaction_potentials.lennard_jones.epsilon,
+                    'sigma': self.config.interaction_potentials.lennard_jones.sigma
+                },
+                'morse': {
+                    'enabled': self.config.interaction_potentials.morse.enabled,
+                    'D_e': self.config.interaction_potentials.morse.D_e,
+                    'a': self.config.interaction_potentials.morse.a,
+                    'r_e': self.config.interaction_potentials.morse.r_e
+                },
+                'dlvo': {
+                    'enabled': self.config.interaction_potentials.dlvo.enabled,
+                    'hamaker_constant': self.config.interaction_potentials.dlvo.hamaker_constant,
+                    'surface_potential': self.config.interaction_potentials.dlvo.surface_potential,
+                    'debye_length': self.config.interaction_potentials.dlvo.debye_length
+                }
+            }
+        }
+
     def set_mode(self, mode):
         """Установка режима работы"""
         # Проверяем изолированность системы
         is_isolated = getattr(self.config.experiment, 'isolated_system', False)
-        
+
         blocked_modes = ["heat", "freeze", "expansion", "compression",
-                        "heat_expansion", "heat_compression", 
+                        "heat_expansion", "heat_compression",
                         "cool_expansion", "cool_compression"]
         if is_isolated and mode in blocked_modes:
             # В изолированной системе нельзя менять энергию и объем
             return
-        
-        self.mode = mode
-    
+
+        self._bind_mode(mode)
+
     def _calculate_and_save_initial_energy(self):
         """Расчёт и сохранение начальной энергии системы (поступательная + вращательная)."""
-        self.initial_energy = sum(
-            particle.total_energy() if hasattr(particle, 'total_energy') 
-            else particle.mass * (particle.v ** 2) / 2 
-            for particle in self.particles
+        self.initial_energy = (
+            0.5 * float(np.dot(self.pmass,
+                               np.square(self.pvx, dtype=np.float64) +
+                               np.square(self.pvy, dtype=np.float64))) +
+            sum(particle.rotational_energy() for particle in self.particles)
         )
-    
+
     def toggle_isolated_system(self, enabled: bool):
         """Переключить режим изолированной системы."""
         self.config.experiment.isolated_system = enabled
         if enabled:
-            self.mode = "OFF"
+            self._bind_mode("OFF")
             # Пересчитываем начальную энергию при включении режима
             self._calculate_and_save_initial_energy()
-    
+
     def toggle_brownian_mode(self, enabled: bool):
         """Переключить режим броуновского движения."""
         self.config.brownian.enabled = enabled
         # Перезапускаем симуляцию для применения изменений
         self.reset_simulation()
-    
+
     def toggle_gravity(self, enabled: bool):
         """Переключить гравитацию."""
         self.config.gravity.enabled = enabled
-    
+
     def toggle_corner_start(self, enabled: bool):
         """Переключить режим старта из угла."""
         self.config.experiment.corner_start = enabled
         # Перезапускаем симуляцию для применения
         self.reset_simulation()
-    
-    def _calculate_velocity_entropy(self, velocities, n_bins=20):
-        """Расчёт энтропии по распределению скоростей."""
-        if len(velocities) < 10:
-            return None
-        
-        velocities = np.array(velocities)
-        hist, bin_edges = np.histogram(velocities, bins=n_bins, density=True)
-        bin_width = bin_edges[1] - bin_edges[0]
-        probs = hist * bin_width
-        probs = probs[probs > 0]
-        
-        if len(probs) == 0:
-            return None
-        
-        return -np.sum(probs * np.log(probs))
-    
-    def _calculate_h_function(self, velocities, n_bins=30):
-        """Расчёт H-функции Больцмана."""
-        if len(velocities) < 10:
-            return None
-        
-        velocities = np.array(velocities)
-        hist, bin_edges = np.histogram(velocities, bins=n_bins, density=True)
-        bin_width = bin_edges[1] - bin_edges[0]
-        
-        mask = hist > 0
-        if np.sum(mask) == 0:
-            return None
-        
-        f = hist[mask]
-        return np.sum(f * np.log(f)) * bin_width
-    
-    def _calculate_spatial_entropy(self, positions, n_bins_x=10, n_bins_y=10):
-        """Расчёт пространственной энтропии."""
-        if len(positions) < 10:
+
+    def _velocity_histogram_entropies(self, speeds, n_bins_entropy=20, n_bins_h=30):
+        """
+        Энтропия распределения скоростей и H-функция Больцмана.
+
+        Массив скоростей обходится один раз: счётчики считаются на
+        мелкой сетке (НОК обоих разбиений), обе оценки получаются
+        слиянием соседних корзин без второго прохода. xlogy объединяет
+        фильтр p > 0 и логарифм в один вызов.
+
+        Returns:
+            (velocity_entropy, h_function) — None вместо недоступных значений
+        """
+        if speeds.size < 10:
+            return None, None
+
+        lo = float(speeds.min())
+        hi = float(speeds.max())
+        if hi <= lo:
+            return None, None
+
+        n_fine = n_bins_entropy * n_bins_h // math.gcd(n_bins_entropy, n_bins_h)
+        counts, _ = np.histogram(speeds, bins=n_fine, range=(lo, hi))
+        total = counts.sum()
+        if total == 0:
+            return None, None
+
+        # Энтропия: p_i = n_i / N на корзинах entropy-разбиения
+        probs = counts.reshape(n_bins_entropy, -1).sum(axis=1) / total
+        entropy = -float(np.sum(xlogy(probs, probs))) if probs.any() else None
+
+        # H-функция: f_i — плотность на корзинах h-разбиения
+        counts_h = counts.reshape(n_bins_h, -1).sum(axis=1)
+        bin_width = (hi - lo) / n_bins_h
+        f = counts_h / (total * bin_width)
+        h_func = float(np.sum(xlogy(f, f))) * bin_width if f.any() else None
+
+        return entropy, h_func
+
+    def _calculate_spatial_entropy(self, n_bins_x=10, n_bins_y=10):
+        """Расчёт пространственной энтропии прямо по SoA-массивам координат."""
+        if self.px.size < 10:
             return None
-        
-        x_coords = [p[0] for p in positions]
-        y_coords = [p[1] for p in positions]
-        
-        hist, _, _ = np.histogram2d(x_coords, y_coords, 
+
+        hist, _, _ = np.histogram2d(self.px, self.py,
                                      bins=[n_bins_x, n_bins_y],
                                      range=[[0, self.width], [0, self.height]])
-        
+
         total = np.sum(hist)
         if total == 0:
             return None
-        
-        probs = hist.flatten() / total
-        probs = probs[probs > 0]
-        
-        if len(probs) == 0:
+
+        probs = hist.ravel() / total
+
+        if not probs.any():
             return None
-        
-        return -np.sum(probs * np.log(probs))
-    
+
+        return -float(np.sum(xlogy(probs, probs)))
+
     def _update_ergodic_data(self, velocities):
         """Обновление данных для эргодической гипотезы."""
         if len(velocities) == 0 or len(self.particles) == 0:
             return
-        
-        # Сохраняем скорости каждой частицы
-        for i, v in enumerate(velocities):
-            if i in self.particle_velocity_histories:
-                self.particle_velocity_histories[i].append(v)
-        
-        # Временное среднее для первой частицы
-        if 0 in self.particle_velocity_histories and len(self.particle_velocity_histories[0]) > 0:
-            time_avg = np.mean(self.particle_velocity_histories[0])
-            self.time_averages_history.append(time_avg)
-        
+
+        # Сохраняем скорости всех частиц одной записью столбца
+        # кольцевого буфера (порядок столбцов для средних не важен)
+        n_cols = self.pvh.shape[1]
+        if self.pvh.shape[0] == len(velocities) and n_cols:
+            self.pvh[:, self.pvh_len % n_cols] = velocities
+            self.pvh_len += 1
+
+        # Временное среднее для первой частицы — редукция по строке
+        filled = min(self.pvh_len, n_cols)
+        if filled > 0:
+            self.time_averages_history.append(float(self.pvh[0, :filled].mean()))
+
         # Ансамблевое среднее (среднее по всем частицам в данный момент)
         ensemble_avg = np.mean(velocities)
         self.ensemble_averages_history.append(ensemble_avg)
-        
-        # Корреляция текущих скоростей с начальными (для "забывания")
+
+        # Корреляция текущих скоростей с начальными (для "забывания").
+        # Формула Пирсона напрямую через numpy — без импорта scipy.stats
+        # на каждом тике. Неопределённая корреляция кодируется NaN,
+        # чтобы серия оставалась числовой.
         if len(self.initial_velocities) == len(velocities) and len(velocities) >= 5:
-            try:
-                init_arr = np.array(self.initial_velocities)
-                cur_arr = np.array(velocities)
-                # Если один из массивов константный или имеет нулевое стандартное отклонение,
-                # pearsonr выдаст предупреждение / некорректное значение. В этом случае не считаем корреляцию.
-                if np.std(init_arr) == 0 or np.std(cur_arr) == 0:
-                    self.correlations_history.append(None)
-                else:
-                    from scipy import stats
-                    import warnings
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings("ignore")
-                        corr, _ = stats.pearsonr(init_arr, cur_arr)
-                    self.correlations_history.append(corr)
-            except Exception:
-                self.correlations_history.append(None)
+            a = self.initial_velocities - self.initial_velocities.mean()
+            b = np.asarray(velocities, dtype=np.float64)
+            b -= b.mean()
+            # Нулевая дисперсия (константные скорости) — корреляция не определена
+            denom = math.sqrt(float(np.dot(a, a)) * float(np.dot(b, b)))
+            if denom > 0:
+                self.correlations_history.append(float(np.dot(a, b)) / denom)
+            else:
+                self.correlations_history.append(float('nan'))
         else:
-            self.correlations_history.append(None)
-    
+            self.correlations_history.append(float('nan'))
+
     def stop_simulation(self):
         """Остановка симуляции"""
         self.running = False
         self.simulation_timer.stop()
-    
+        self.paint_timer.stop()
+        self.update()  # Финальный кадр с актуальным состоянием
+
     def start_simulation(self):
         """Запуск симуляции"""
         self.running = True
         self.simulation_timer.start(int(self.time_sleep * 1000))
-    
+        self.paint_timer.start(16)
+
+    def _rebuild_series_buffers(self):
+        """
+        Пересоздать кольцевые буферы измерений под текущие ёмкости.
+        Нужен при смене logging.buffer_size в настройках: clear()
+        в reset_simulation ёмкость деков не меняет.
+        """
+        series = lambda: deque(maxlen=self._series_maxlen)
+        self.Pressure = series()
+        self.Temperature = series()
+        self.Volume = series()
+        self.Time_meas = series()
+        self.AvgVelocity = series()
+        self.KineticEnergy = series()
+        self.PotentialEnergy = series()
+        self.Density = series()
+        self.MeanFreePath = series()
+        self.MeanFreePath_theoretical = series()
+        self.MeanFreePath_wall = series()
+        self.MeanFreePath_eff = series()
+        self.MeanFreePath_roll100 = series()
+        self.CollisionRate = series()
+        self.Entropy = series()
+        self.H_function = series()
+        self.SpatialEntropy = series()
+        self.time_averages_history = series()
+        self.ensemble_averages_history = series()
+        self.correlations_history = series()
+        self.MSD = deque(maxlen=self._step_series_maxlen)
+        self.brownian_trajectory = deque(maxlen=self._step_series_maxlen)
+
     def reset_simulation(self):
         """Сброс симуляции"""
         self.width = self.width0
         self.height = self.height0
-        self.mode = "OFF"
+        self._bind_mode("OFF")
         self.NOW_TIME = 0
         self.counter = 0
         self.timer = 0  # Сброс таймера для логирования
@@ -1167,90 +1245,101 @@ class SimulationWidget(QWidget):
         self.delta_px_right = 0
         self.delta_py_up = 0
         self.delta_py_down = 0
-        self.Pressure = []
-        self.Temperature = []
-        self.Volume = []
-        self.Time_meas = []
-        self.AvgVelocity = []
-        self.KineticEnergy = []
-        self.PotentialEnergy = []
+        # Деки очищаются на месте: буферы уже нужной ёмкости,
+        # пересоздание лишь нагружало аллокатор при каждом сбросе
+        for series in (self.Pressure, self.Temperature, self.Volume,
+                       self.Time_meas, self.AvgVelocity, self.KineticEnergy,
+                       self.PotentialEnergy, self.Density,
+                       self.MeanFreePath,
+                       self.MeanFreePath_theoretical, self.MeanFreePath_wall,
+                       self.MeanFreePath_eff, self.MeanFreePath_roll100,
+                       self.CollisionRate, self.Entropy, self.MSD,
+                       self.brownian_trajectory, self.H_function,
+                       self.SpatialEntropy, self.time_averages_history,
+                       self.ensemble_averages_history,
+                       self.correlations_history, self.log_buffer):
+            series.clear()
         self.potential_energy = 0.0
-        self.Density = []
-        self.VelocityDistribution = []
-        self.MeanFreePath = []
-        self.MeanFreePath_theoretical = []
-        self.MeanFreePath_roll100 = []
-        self.CollisionRate = []
-        self.Entropy = []
-        self.MSD = []
-        self.brownian_trajectory = []
         self.brownian_initial_pos = None
-        self.H_function = []
-        self.SpatialEntropy = []
         self.collision_count = 0
         self.initial_energy = None
         self.Energy_translational = 0
         self.Energy_rotational = 0
         # Сброс данных эргодичности
-        self.particle_velocity_histories = {}
-        self.time_averages_history = []
-        self.ensemble_averages_history = []
-        self.initial_velocities = []
+        self.pvh_len = 0
+        self.initial_velocities = np.empty(0)
         self.initial_positions_saved = []
-        self.correlations_history = []
         self.init_particles()
         self.running = True
-        # Перезапускаем таймер с актуальным интервалом
+        # Перезапускаем таймеры с актуальными интервалами
         self.simulation_timer.stop()
         self.simulation_timer.start(int(self.time_sleep * 1000))
-    
+        if not self.paint_timer.isActive():
+            self.paint_timer.start(16)
+
+    def _current_speeds(self):
+        """Модули скоростей: кэш последнего шага, пока он актуален."""
+        cached = getattr(self, '_last_speeds', None)
+        if cached is not None and cached.size == self.pvx.size:
+            return cached
+        return np.hypot(self.pvx, self.pvy)
+
     def get_statistics(self):
         """Получение статистики"""
-        velocities = [p.v for p in self.particles]
+        v = self._current_speeds()
+        has_particles = v.size > 0
         return {
-            'mean_velocity': mean(velocities) if velocities else 0,
-            'std_velocity': np.std(velocities) if velocities else 0,
-            'max_velocity': max(velocities) if velocities else 0,
-            'min_velocity': min(velocities) if velocities else 0,
+            'mean_velocity': float(np.mean(v)) if has_particles else 0,
+            'std_velocity': float(np.std(v)) if has_particles else 0,
+            'max_velocity': float(np.max(v)) if has_particles else 0,
+            'min_velocity': float(np.min(v)) if has_particles else 0,
             'total_energy': self.Energy_check,
             'current_volume': self.width * self.height,
             'particle_count': self.nn,
             'current_pressure': self.Pressure[-1] if self.Pressure else 0
         }
-    
+
     def apply_config(self, config: AppConfig):
         """
         Применить новую конфигурацию и перезапустить симуляцию.
-        
+
         Args:
             config: Новая конфигурация приложения
         """
         # Остановить текущую симуляцию
         self.simulation_timer.stop()
-        
+
         # Обновить конфигурацию
         self.config = config
-        
+
         # Обновить размеры окна симуляции
         self.width0 = config.simulation_window.width
         self.height0 = config.simulation_window.height
         self.setFixedSize(int(self.width0 * 1.5), self.height0)
-        
+
         # Обновить параметры частиц
         self.nn = config.particles.count
         self.r1 = config.particles.radius
         self.m1 = config.particles.mass
         self.v_start = config.particles.initial_speed
-        
+
         # Обновить параметры времени
         self.time_sleep = config.time.time_step
         self.time_check = config.time.check_interval
-        
-        # Обновить буфер логов
+        self._bind_config()
+
+        # Обновить буфер логов и окна серий измерений: при изменении
+        # ёмкости деки серий пересоздаются, иначе хватает clear()
+        # в последующем reset_simulation
         self.log_buffer = deque(maxlen=config.logging.buffer_size)
-        
+        new_maxlen = config.logging.buffer_size * 4
+        if new_maxlen != self._series_maxlen:
+            self._series_maxlen = new_maxlen
+            self._step_series_maxlen = new_maxlen * 10
+            self._rebuild_series_buffers()
+
         # Обновить стиль
         self.setStyleSheet(f"background-color: {config.ui_colors.background_color};")
-        
+
         # Полный сброс симуляции
         self.reset_simulation()
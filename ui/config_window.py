@@ -5,18 +5,52 @@
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QFormLayout, QSpinBox, QDoubleSpinBox, QLineEdit, QPushButton,
-    QLabel, QGroupBox, QScrollArea, QColorDialog, QMessageBox,
+    QLabel, QScrollArea, QColorDialog, QMessageBox,
     QFileDialog, QFrame, QCheckBox, QComboBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QColor, QPalette
+from PyQt5.QtCore import QRegularExpression, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QPalette, QRegularExpressionValidator
+from enum import IntEnum
+import re
 from pydantic import ValidationError
-from typing import Any, Dict, Tuple, get_origin, get_args, Literal
+from typing import Any, Dict, Tuple
 from pathlib import Path
 
 from schemas import AppConfig, ConfigSection
 
 
+# Допустимые строки цвета для HexColorEdit: hex-форма или имя из палитры
+_HEX_COLOR_RE = re.compile(r'^#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})$')
+_NAMED_COLORS = frozenset({'black', 'white', 'gray', 'red', 'green', 'blue', 'orange'})
+
+# Общий валидатор ввода для всех HexColorEdit: мусор отсекается на
+# уровне Qt/C++, до вызова каких-либо Python-слотов
+_COLOR_INPUT_VALIDATOR = QRegularExpressionValidator(
+    QRegularExpression(r'^(#[0-9a-fA-F]{0,6}|[a-zA-Z]{0,20})$')
+)
+
+# Один QColorDialog на процесс: диалог несёт большое дерево Qt-виджетов,
+# и пересоздавать его на каждый клик по кнопке цвета расточительно
+_color_dialog = None
+
+
+def _get_color_dialog() -> QColorDialog:
+    """Ленивый общий диалог выбора цвета."""
+    global _color_dialog
+    if _color_dialog is None:
+        _color_dialog = QColorDialog()
+        _color_dialog.setOption(QColorDialog.DontUseNativeDialog, True)
+        _color_dialog.setWindowTitle("Выберите цвет")
+    return _color_dialog
+
+
+def _combo_text(value: Any) -> str:
+    """Текст для QComboBox: для IntEnum показываем имя члена, а не число."""
+    if isinstance(value, IntEnum):
+        return value.name.lower()
+    return str(value)
+
+
 class ColorButton(QPushButton):
     """Кнопка выбора цвета."""
     
@@ -32,24 +66,26 @@ class ColorButton(QPushButton):
     def _update_style(self):
         """Обновить стиль кнопки под цвет."""
         r, g, b = self._color
-        # Определяем контрастный цвет текста
+        # Рамка и контрастный цвет текста описаны одним правилом в
+        # стилях ConfigWindow ([darktext=...]); здесь парсится только
+        # минимальная строка с фоном, а не полный CSS на каждую кнопку
         luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        text_color = "black" if luminance > 0.5 else "white"
-        self.setStyleSheet(
-            f"background-color: rgb({r}, {g}, {b}); "
-            f"color: {text_color}; "
-            f"border: 1px solid #555;"
-        )
+        self.setProperty('darktext', luminance > 0.5)
+        self.setStyleSheet(f"background-color: rgb({r}, {g}, {b});")
+        self.style().unpolish(self)
+        self.style().polish(self)
         self.setText(f"#{r:02x}{g:02x}{b:02x}")
     
     def _pick_color(self):
         """Открыть диалог выбора цвета."""
-        initial = QColor(*self._color)
-        color = QColorDialog.getColor(initial, self, "Выберите цвет")
-        if color.isValid():
-            self._color = (color.red(), color.green(), color.blue())
-            self._update_style()
-            self.color_changed.emit(self._color)
+        dialog = _get_color_dialog()
+        dialog.setCurrentColor(QColor(*self._color))
+        if dialog.exec_() == QDialog.Accepted:
+            color = dialog.currentColor()
+            if color.isValid():
+                self._color = (color.red(), color.green(), color.blue())
+                self._update_style()
+                self.color_changed.emit(self._color)
     
     def get_color(self) -> Tuple[int, int, int]:
         return self._color
@@ -76,21 +112,56 @@ class HexColorEdit(QWidget):
         self.preview.setFrameStyle(QFrame.Box)
         layout.addWidget(self.preview)
         
-        self.line_edit.textChanged.connect(self._update_preview)
+        self._last_css = None
+        self.line_edit.setValidator(_COLOR_INPUT_VALIDATOR)
+        # Превью обновляется по завершении редактирования, а не на
+        # каждое нажатие клавиши: меньше входов в интерпретатор
+        self.line_edit.editingFinished.connect(self._preview_from_edit)
         self._update_preview(color)
-    
+
+    def _preview_from_edit(self):
+        self._update_preview(self.line_edit.text())
+
     def _update_preview(self, color: str):
         """Обновить превью цвета."""
-        try:
-            self.preview.setStyleSheet(f"background-color: {color}; border: 1px solid #555;")
-        except:
-            self.preview.setStyleSheet("background-color: gray; border: 1px solid red;")
+        # Валидность строки проверяется регуляркой на стороне Python,
+        # а не скармливанием битого CSS Qt; вызовы приходят и из
+        # set_value, и по editingFinished, поэтому стиль ставится
+        # только при фактическом изменении
+        if _HEX_COLOR_RE.match(color) or color in _NAMED_COLORS:
+            css = f"background-color: {color}; border: 1px solid #555;"
+        else:
+            css = "background-color: gray; border: 1px solid red;"
+        if css != self._last_css:
+            self._last_css = css
+            self.preview.setStyleSheet(css)
     
     def get_value(self) -> str:
         return self.line_edit.text()
     
     def set_value(self, value: str):
+        # setText не порождает editingFinished — превью обновляем сами
         self.line_edit.setText(value)
+        self._update_preview(value)
+
+
+# Доступ к значению по конкретному классу виджета: одна выборка из
+# словаря вместо цепочки из семи isinstance на каждое поле при каждом
+# сборе/установке значений. Ключ — точный класс, сабклассов здесь нет.
+_WIDGET_ACCESSORS = {
+    QSpinBox: (QSpinBox.value, QSpinBox.setValue),
+    QDoubleSpinBox: (QDoubleSpinBox.value, QDoubleSpinBox.setValue),
+    QLineEdit: (QLineEdit.text, lambda w, v: w.setText(str(v))),
+    QCheckBox: (QCheckBox.isChecked, QCheckBox.setChecked),
+    QComboBox: (QComboBox.currentText, lambda w, v: w.setCurrentText(_combo_text(v))),
+    ColorButton: (ColorButton.get_color, ColorButton.set_color),
+    HexColorEdit: (HexColorEdit.get_value, HexColorEdit.set_value),
+}
+
+
+def _widget_accessors(widget):
+    """Пара (getter, setter) для виджета поля."""
+    return _WIDGET_ACCESSORS[type(widget)]
 
 
 class ConfigSectionWidget(QWidget):
@@ -140,62 +211,58 @@ class ConfigSectionWidget(QWidget):
             self._update_widgets_from_section()
     
     def _create_widget_for_field(self, field_name: str, info: Dict) -> Any:
-        """Создать виджет для поля на основе его типа."""
-        field_type = info['type']
-        default = info['default']
+        """
+        Создать виджет для поля.
+        Разновидность виджета ('kind') и варианты выпадающих списков
+        предвычислены в кэшированных метаданных схемы — introspection
+        типов здесь не выполняется.
+        """
+        kind = info['kind']
         current_value = getattr(self.section, field_name)
-        
-        # Обработка Tuple[int, int, int] как RGB цвета
-        origin = get_origin(field_type)
-        if origin is tuple:
-            args = get_args(field_type)
-            if len(args) == 3 and all(arg == int for arg in args):
-                widget = ColorButton(current_value)
-                return widget
-        
-        # Обработка Literal (выпадающий список)
-        if origin is Literal:
-            args = get_args(field_type)
+
+        # Tuple[int, int, int] — RGB цвет
+        if kind == 'rgb':
+            widget = ColorButton(current_value)
+            return widget
+
+        # IntEnum-теги и Literal — выпадающий список
+        if kind in ('enum', 'literal'):
             widget = QComboBox()
-            widget.addItems([str(arg) for arg in args])
-            widget.setCurrentText(str(current_value))
+            widget.addItems(info['choices'])
+            widget.setCurrentText(_combo_text(current_value))
             widget.setToolTip(info['description'])
             return widget
-        
+
         # bool (чекбокс)
-        if field_type == bool:
-            widget = QCheckBox()
-            widget.setChecked(current_value)
-            widget.setToolTip(info['description'])
-            return widget
-        
+        # Свойства Qt передаются kwargs конструктора: sip выставляет их
+        # одним C-проходом до подключения сигналов, вместо отдельного
+        # PyQt-вызова (с эмиссией сигналов) на каждый сеттер
+        if kind == 'bool':
+            return QCheckBox(checked=current_value, toolTip=info['description'])
+
         # int
-        if field_type == int:
-            widget = QSpinBox()
-            widget.setRange(
-                info.get('ge', info.get('gt', 0) + 1 if 'gt' in info else 0),
-                info.get('le', info.get('lt', 10000) - 1 if 'lt' in info else 10000)
+        if kind == 'int':
+            return QSpinBox(
+                minimum=info.get('ge', info.get('gt', 0) + 1 if 'gt' in info else 0),
+                maximum=info.get('le', info.get('lt', 10000) - 1 if 'lt' in info else 10000),
+                value=current_value,
+                toolTip=info['description'],
             )
-            widget.setValue(current_value)
-            widget.setToolTip(info['description'])
-            return widget
-        
+
         # float
-        if field_type == float:
-            widget = QDoubleSpinBox()
-            widget.setDecimals(4)
-            widget.setSingleStep(0.01)
-            widget.setRange(
-                info.get('ge', info.get('gt', 0.0) + 0.001 if 'gt' in info else 0.0),
-                info.get('le', info.get('lt', 1000.0) - 0.001 if 'lt' in info else 1000.0)
+        if kind == 'float':
+            return QDoubleSpinBox(
+                decimals=4,
+                singleStep=0.01,
+                minimum=info.get('ge', info.get('gt', 0.0) + 0.001 if 'gt' in info else 0.0),
+                maximum=info.get('le', info.get('lt', 1000.0) - 0.001 if 'lt' in info else 1000.0),
+                value=current_value,
+                toolTip=info['description'],
             )
-            widget.setValue(current_value)
-            widget.setToolTip(info['description'])
-            return widget
         
         # str (возможно HEX цвет)
-        if field_type == str:
-            if current_value.startswith('#') or current_value in ('black', 'white', 'gray', 'red', 'green', 'blue', 'orange'):
+        if kind == 'str':
+            if current_value.startswith('#') or current_value in _NAMED_COLORS:
                 widget = HexColorEdit(current_value)
             else:
                 widget = QLineEdit(current_value)
@@ -211,70 +278,35 @@ class ConfigSectionWidget(QWidget):
             if field_name == 'preset':
                 continue  # Не обновляем сам пресет
             value = getattr(self.section, field_name)
-            if isinstance(widget, QSpinBox):
-                widget.blockSignals(True)
-                widget.setValue(value)
-                widget.blockSignals(False)
-            elif isinstance(widget, QDoubleSpinBox):
-                widget.blockSignals(True)
-                widget.setValue(value)
-                widget.blockSignals(False)
-            elif isinstance(widget, QLineEdit):
-                widget.blockSignals(True)
-                widget.setText(str(value))
-                widget.blockSignals(False)
-            elif isinstance(widget, ColorButton):
-                widget.set_color(value)
-            elif isinstance(widget, QCheckBox):
-                widget.blockSignals(True)
-                widget.setChecked(value)
-                widget.blockSignals(False)
-            elif isinstance(widget, QComboBox):
-                widget.blockSignals(True)
-                widget.setCurrentText(str(value))
+            setter = _widget_accessors(widget)[1]
+            widget.blockSignals(True)
+            try:
+                setter(widget, value)
+            finally:
                 widget.blockSignals(False)
-            elif isinstance(widget, HexColorEdit):
-                widget.set_value(value)
-    
+
     def get_values(self) -> Dict[str, Any]:
         """Получить все значения из виджетов."""
-        values = {}
-        for field_name, widget in self.widgets.items():
-            if isinstance(widget, QSpinBox):
-                values[field_name] = widget.value()
-            elif isinstance(widget, QDoubleSpinBox):
-                values[field_name] = widget.value()
-            elif isinstance(widget, QLineEdit):
-                values[field_name] = widget.text()
-            elif isinstance(widget, ColorButton):
-                values[field_name] = widget.get_color()
-            elif isinstance(widget, HexColorEdit):
-                values[field_name] = widget.get_value()
-            elif isinstance(widget, QCheckBox):
-                values[field_name] = widget.isChecked()
-            elif isinstance(widget, QComboBox):
-                values[field_name] = widget.currentText()
-        return values
-    
+        return {
+            field_name: _widget_accessors(widget)[0](widget)
+            for field_name, widget in self.widgets.items()
+        }
+
     def set_values(self, section: ConfigSection):
-        """Установить значения из секции конфигурации."""
+        """
+        Установить значения из секции конфигурации.
+        Сигналы виджетов блокируются: массовое обновление не должно
+        дёргать обработчики (пресеты и т.п.) на каждое поле.
+        """
         self.section = section
         for field_name, widget in self.widgets.items():
             value = getattr(section, field_name)
-            if isinstance(widget, QSpinBox):
-                widget.setValue(value)
-            elif isinstance(widget, QDoubleSpinBox):
-                widget.setValue(value)
-            elif isinstance(widget, QLineEdit):
-                widget.setText(str(value))
-            elif isinstance(widget, ColorButton):
-                widget.set_color(value)
-            elif isinstance(widget, QCheckBox):
-                widget.setChecked(value)
-            elif isinstance(widget, QComboBox):
-                widget.setCurrentText(str(value))
-            elif isinstance(widget, HexColorEdit):
-                widget.set_value(value)
+            setter = _widget_accessors(widget)[1]
+            widget.blockSignals(True)
+            try:
+                setter(widget, value)
+            finally:
+                widget.blockSignals(False)
 
 
 class ConfigWindow(QDialog):
@@ -315,6 +347,15 @@ class ConfigWindow(QDialog):
             QCheckBox::indicator:hover {
                 border-color: #aaa;
             }
+            ColorButton {
+                border: 1px solid #555;
+            }
+            ColorButton[darktext="true"] {
+                color: black;
+            }
+            ColorButton[darktext="false"] {
+                color: white;
+            }
         """)
         
         layout = QVBoxLayout(self)
@@ -322,15 +363,24 @@ class ConfigWindow(QDialog):
         # Табы для категорий
         self.tab_widget = QTabWidget()
         layout.addWidget(self.tab_widget)
-        
-        # Создаем табы по категориям
-        self._create_simulation_tab()
-        self._create_physics_tab()
-        self._create_particles_tab()
-        self._create_ui_tab()
-        self._create_graphs_tab()
-        self._create_colors_tab()
-        
+
+        # Табы строятся лениво: при открытии диалога создаётся только
+        # видимый таб, остальные — пустые заглушки, которые заменяются
+        # настоящим содержимым при первом переключении на них
+        self._tab_builders = {}
+        for title, builder in (
+            ("Симуляция", self._create_simulation_tab),
+            ("Физика", self._create_physics_tab),
+            ("Частицы", self._create_particles_tab),
+            ("Интерфейс", self._create_ui_tab),
+            ("Графики", self._create_graphs_tab),
+            ("Цвета", self._create_colors_tab),
+        ):
+            index = self.tab_widget.addTab(QWidget(), title)
+            self._tab_builders[index] = builder
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
+
         # Кнопки
         buttons_layout = QHBoxLayout()
         button_height = 50
@@ -365,37 +415,76 @@ class ConfigWindow(QDialog):
         buttons_layout.addWidget(self.cancel_btn)
         
         layout.addLayout(buttons_layout)
-    
+
+    def _ensure_tab_built(self, index: int):
+        """Построить содержимое таба, если вместо него ещё заглушка."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        title = self.tab_widget.tabText(index)
+        tab = builder()
+        # removeTab временно сдвигает индексы и порождает currentChanged —
+        # глушим сигналы, чтобы не перестроить соседний таб по ложному индексу
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, title)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+
+    def _build_all_tabs(self):
+        """
+        Достроить все отложенные табы: нужно перед сбором значений
+        или массовым обновлением виджетов, чтобы значения не потерялись.
+        """
+        current = self.tab_widget.currentIndex()
+        for index in sorted(self._tab_builders):
+            self._ensure_tab_built(index)
+        self.tab_widget.setCurrentIndex(current)
+
+    @staticmethod
+    def _make_header_label(title: str) -> QLabel:
+        """Заголовок секции: стилизованный QLabel вместо QGroupBox."""
+        label = QLabel(title)
+        label.setStyleSheet("font-weight: bold; margin-top: 8px;")
+        return label
+
+    def _add_section(self, layout, section, section_attr: str, title: str):
+        """
+        Добавить секцию в layout как заголовок + виджет полей.
+        Раньше каждая секция оборачивалась в QGroupBox со своим
+        QVBoxLayout — два лишних слоя Qt-компоновки на секцию, которые
+        пересчитывались при каждом resize/show диалога.
+        """
+        layout.addWidget(self._make_header_label(title))
+        section_widget = ConfigSectionWidget(section, section_attr)
+        self.section_widgets[section_attr] = section_widget
+        layout.addWidget(section_widget)
+
     def _create_tab_with_scroll(self, sections: list) -> QWidget:
         """Создать таб со скроллом и несколькими секциями."""
         tab = QWidget()
         tab_layout = QVBoxLayout(tab)
-        
+
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        
+
         content = QWidget()
         content_layout = QVBoxLayout(content)
-        
+
         for section_attr, title in sections:
-            section = getattr(self.config, section_attr)
-            group = QGroupBox(title)
-            group_layout = QVBoxLayout(group)
-            
-            section_widget = ConfigSectionWidget(section, section_attr)
-            self.section_widgets[section_attr] = section_widget
-            group_layout.addWidget(section_widget)
-            
-            content_layout.addWidget(group)
-        
+            self._add_section(content_layout, getattr(self.config, section_attr),
+                              section_attr, title)
+
         content_layout.addStretch()
         scroll.setWidget(content)
         tab_layout.addWidget(scroll)
-        
+
         return tab
     
-    def _create_simulation_tab(self):
+    def _create_simulation_tab(self) -> QWidget:
         """Создать таб с параметрами симуляции."""
         sections = [
             ('simulation_window', 'Окно симуляции'),
@@ -403,10 +492,9 @@ class ConfigWindow(QDialog):
             ('state_change', 'Изменение состояния'),
             ('collision', 'Столкновения'),
         ]
-        tab = self._create_tab_with_scroll(sections)
-        self.tab_widget.addTab(tab, "Симуляция")
-    
-    def _create_physics_tab(self):
+        return self._create_tab_with_scroll(sections)
+
+    def _create_physics_tab(self) -> QWidget:
         """Создать таб с физическими параметрами."""
         tab = QWidget()
         tab_layout = QVBoxLayout(tab)
@@ -424,58 +512,29 @@ class ConfigWindow(QDialog):
             ('brownian', 'Броуновское движение'),
             ('experiment', 'Экспериментальные режимы'),
         ]
-        
+
         for section_attr, title in basic_sections:
-            section = getattr(self.config, section_attr)
-            group = QGroupBox(title)
-            group_layout = QVBoxLayout(group)
-            
-            section_widget = ConfigSectionWidget(section, section_attr)
-            self.section_widgets[section_attr] = section_widget
-            group_layout.addWidget(section_widget)
-            
-            content_layout.addWidget(group)
-        
-        # Секция потенциалов взаимодействия
-        potentials_group = QGroupBox("Потенциалы взаимодействия")
-        potentials_layout = QVBoxLayout(potentials_group)
-        
-        # Общие параметры потенциалов
+            self._add_section(content_layout, getattr(self.config, section_attr),
+                              section_attr, title)
+
+        # Потенциалы взаимодействия: общие параметры и три потенциала
+        content_layout.addWidget(self._make_header_label("Потенциалы взаимодействия"))
         ip = self.config.interaction_potentials
-        general_widget = ConfigSectionWidget(ip, 'interaction_potentials_general')
         # Создаём виджеты только для max_force и softening_distance
-        self._create_potentials_general_widget(potentials_layout, ip)
-        
-        # Потенциал Леннард-Джонса
-        lj_group = QGroupBox("Потенциал Леннард-Джонса")
-        lj_layout = QVBoxLayout(lj_group)
-        lj_widget = ConfigSectionWidget(ip.lennard_jones, 'lennard_jones')
-        self.section_widgets['lennard_jones'] = lj_widget
-        lj_layout.addWidget(lj_widget)
-        potentials_layout.addWidget(lj_group)
-        
-        # Потенциал Морзе
-        morse_group = QGroupBox("Потенциал Морзе")
-        morse_layout = QVBoxLayout(morse_group)
-        morse_widget = ConfigSectionWidget(ip.morse, 'morse')
-        self.section_widgets['morse'] = morse_widget
-        morse_layout.addWidget(morse_widget)
-        potentials_layout.addWidget(morse_group)
-        
-        # Потенциал ДЛФО
-        dlvo_group = QGroupBox("Потенциал ДЛФО (Дерягина-Ландау-Фервея-Овербека)")
-        dlvo_layout = QVBoxLayout(dlvo_group)
-        dlvo_widget = ConfigSectionWidget(ip.dlvo, 'dlvo')
-        self.section_widgets['dlvo'] = dlvo_widget
-        dlvo_layout.addWidget(dlvo_widget)
-        potentials_layout.addWidget(dlvo_group)
-        
-        content_layout.addWidget(potentials_group)
+        self._create_potentials_general_widget(content_layout, ip)
+
+        self._add_section(content_layout, ip.lennard_jones,
+                          'lennard_jones', "Потенциал Леннард-Джонса")
+        self._add_section(content_layout, ip.morse,
+                          'morse', "Потенциал Морзе")
+        self._add_section(content_layout, ip.dlvo,
+                          'dlvo', "Потенциал ДЛФО (Дерягина-Ландау-Фервея-Овербека)")
+
         content_layout.addStretch()
         scroll.setWidget(content)
         tab_layout.addWidget(scroll)
-        
-        self.tab_widget.addTab(tab, "Физика")
+
+        return tab
     
     def _create_potentials_general_widget(self, parent_layout, ip):
         """Создать виджеты для общих параметров потенциалов."""
@@ -499,26 +558,24 @@ class ConfigWindow(QDialog):
         
         parent_layout.addLayout(form_layout)
     
-    def _create_particles_tab(self):
+    def _create_particles_tab(self) -> QWidget:
         """Создать таб с параметрами частиц."""
         sections = [
             ('particles', 'Параметры частиц'),
             ('molecule', 'Структура молекулы'),
         ]
-        tab = self._create_tab_with_scroll(sections)
-        self.tab_widget.addTab(tab, "Частицы")
-    
-    def _create_ui_tab(self):
+        return self._create_tab_with_scroll(sections)
+
+    def _create_ui_tab(self) -> QWidget:
         """Создать таб с параметрами UI."""
         sections = [
             ('main_window', 'Главное окно'),
             ('graph_window', 'Окно графиков'),
             ('logging', 'Логирование'),
         ]
-        tab = self._create_tab_with_scroll(sections)
-        self.tab_widget.addTab(tab, "Интерфейс")
-    
-    def _create_graphs_tab(self):
+        return self._create_tab_with_scroll(sections)
+
+    def _create_graphs_tab(self) -> QWidget:
         """Создать таб с параметрами графиков."""
         sections = [
             ('graph_update', 'Обновление графиков'),
@@ -527,10 +584,9 @@ class ConfigWindow(QDialog):
             ('fractal', 'Фрактальный анализ'),
             ('correlation', 'Корреляции'),
         ]
-        tab = self._create_tab_with_scroll(sections)
-        self.tab_widget.addTab(tab, "Графики")
-    
-    def _create_colors_tab(self):
+        return self._create_tab_with_scroll(sections)
+
+    def _create_colors_tab(self) -> QWidget:
         """Создать таб с цветовыми настройками."""
         sections = [
             ('particle_colors', 'Цвета частиц'),
@@ -539,8 +595,7 @@ class ConfigWindow(QDialog):
             ('mode_colors', 'Цвета режимов'),
             ('mode_indicator_colors', 'Цвета индикаторов графиков'),
         ]
-        tab = self._create_tab_with_scroll(sections)
-        self.tab_widget.addTab(tab, "Цвета")
+        return self._create_tab_with_scroll(sections)
     
     def _setup_connections(self):
         """Настроить сигналы."""
@@ -552,8 +607,12 @@ class ConfigWindow(QDialog):
     
     def _collect_config(self) -> AppConfig:
         """Собрать конфигурацию из всех виджетов."""
+        # Ленивые табы могли ещё не построиться — без их виджетов
+        # значения секций потерялись бы
+        self._build_all_tabs()
+
         config_dict = {}
-        
+
         # Секции потенциалов (вложенные)
         potential_sections = {'lennard_jones', 'morse', 'dlvo'}
         
@@ -573,8 +632,8 @@ class ConfigWindow(QDialog):
                 interaction_potentials[pot_name] = self.section_widgets[pot_name].get_values()
         
         config_dict['interaction_potentials'] = interaction_potentials
-        
-        return AppConfig(**config_dict)
+
+        return AppConfig.validate(config_dict)
     
     def _apply_config(self):
         """Применить конфигурацию."""
@@ -613,23 +672,31 @@ class ConfigWindow(QDialog):
     
     def _update_widgets_from_config(self, config: AppConfig):
         """Обновить все виджеты из конфигурации."""
+        self._build_all_tabs()
         self.config = config
-        
+
         # Секции потенциалов (вложенные)
         potential_sections = {'lennard_jones', 'morse', 'dlvo'}
-        
-        for section_attr, widget in self.section_widgets.items():
-            if section_attr in potential_sections:
-                # Вложенные секции потенциалов
-                section = getattr(config.interaction_potentials, section_attr)
-            else:
-                section = getattr(config, section_attr)
-            widget.set_values(section)
-        
-        # Обновляем общие параметры потенциалов
-        ip = config.interaction_potentials
-        self.max_force_spin.setValue(ip.max_force)
-        self.softening_spin.setValue(ip.softening_distance)
+
+        # Пока идёт массовая запись значений, перерисовки не нужны:
+        # без этого каждый setValue/setText вызывал бы свой repaint
+        self.setUpdatesEnabled(False)
+        try:
+            for section_attr, widget in self.section_widgets.items():
+                if section_attr in potential_sections:
+                    # Вложенные секции потенциалов
+                    section = getattr(config.interaction_potentials, section_attr)
+                else:
+                    section = getattr(config, section_attr)
+                widget.set_values(section)
+
+            # Обновляем общие параметры потенциалов
+            ip = config.interaction_potentials
+            self.max_force_spin.setValue(ip.max_force)
+            self.softening_spin.setValue(ip.softening_distance)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def _save_to_file(self):
         """Сохранить конфигурацию в файл."""
@@ -681,6 +748,15 @@ class ConfigWindow(QDialog):
                     f"Не удалось загрузить конфигурацию:\n{e}"
                 )
     
+    def set_config(self, config: AppConfig):
+        """
+        Показать в диалоге другую конфигурацию, переиспользуя уже
+        построенные виджеты. Позволяет держать один экземпляр диалога
+        на всё время жизни приложения вместо пересоздания всего дерева
+        виджетов при каждом открытии настроек.
+        """
+        self._update_widgets_from_config(config)
+
     def get_config(self) -> AppConfig:
         """Получить текущую конфигурацию."""
         return self.config
@@ -1,10 +1,13 @@
 """
 Главное окно приложения симуляции газа.
 """
+from functools import partial
+
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QPushButton, QTextEdit, QLabel, 
+                             QHBoxLayout, QPushButton, QPlainTextEdit, QLabel, 
                              QGroupBox, QGridLayout, QMenuBar, QMenu, QAction)
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont, QTextCursor, QTextOption
 
 from simulation import SimulationWidget
 from graphs import GraphWindow
@@ -12,6 +15,59 @@ from schemas import AppConfig
 from ui.config_window import ConfigWindow
 
 
+# Стили кнопок-переключателей: по два состояния на кнопку, строки
+# предсобраны, чтобы setStyleSheet не разбирал новый CSS на каждый клик
+_BTN_INACTIVE = "font-weight: bold;"
+_BTN_ISOLATED_ON = "background-color: #4CAF50; color: white; font-weight: bold;"
+_BTN_BROWNIAN_ON = "background-color: #2196F3; color: white; font-weight: bold;"
+_BTN_GRAVITY_ON = "background-color: #FF9800; color: white; font-weight: bold;"
+_BTN_CORNER_ON = "background-color: #9C27B0; color: white; font-weight: bold;"
+
+# Стиль индикатора режима, если для режима не задан цвет
+_MODE_STYLE_DEFAULT = "background-color: #f0f0f0; padding: 5px; border-radius: 3px;"
+
+# Сетка кнопок панели управления: по 4 в ряд, координаты
+# посчитаны один раз на импорте
+_BUTTON_GRID = tuple(divmod(i, 4) for i in range(20))
+
+# Вступительная справка по управлению: собрана в одну строку на импорте,
+# чтобы вставить её в лог одним редактированием документа
+_INTRO = "\n".join([
+    "=" * 70,
+    "УПРАВЛЕНИЕ СИМУЛЯЦИЕЙ:",
+    "=" * 70,
+    "• Нагрев: увеличение кинетической энергии частиц",
+    "• Охлаждение: уменьшение кинетической энергии",
+    "• Расширение: увеличение объема сосуда",
+    "• Сжатие: уменьшение объема сосуда",
+    "• Стоп процесс: прекращение текущего процесса",
+    "• Остановить симуляцию: полная остановка",
+    "• Сбросить: перезапуск симуляции",
+    "• Графики: открыть окно с графиками",
+    "=" * 70,
+])
+
+# Шаблон блока статистики: текст собирается один раз на импорте,
+# show_statistics лишь подставляет значения
+_STATS_TEMPLATE = """\
+СТАТИСТИКА СИМУЛЯЦИИ:
+======================
+Количество частиц: {particle_count}
+Текущий объем: {current_volume:.1f}
+Текущее давление: {current_pressure:.3f}
+Общая энергия: {total_energy:.2f}
+
+СКОРОСТИ:
+----------
+Средняя скорость: {mean_velocity:.3f}
+Стандартное отклонение: {std_velocity:.3f}
+Максимальная скорость: {max_velocity:.3f}
+Минимальная скорость: {min_velocity:.3f}
+
+РЕЖИМ: {mode}
+ВРЕМЯ: {time:.1f}"""
+
+
 class MainWindow(QMainWindow):
     """Главное окно приложения симуляции газа."""
     
@@ -82,20 +138,17 @@ class MainWindow(QMainWindow):
         self.btn_cool_expansion = QPushButton("Охлажд.+Расш.")
         self.btn_cool_compression = QPushButton("Охлажд.+Сжат.")
         
-        # Настройка кнопок - размещаем по 4 кнопки в ряд
-        buttons = [
+        # Настройка кнопок - размещаем по 4 кнопки в ряд; общие высота
+        # и начертание заданы одним правилом в стиле группы ниже
+        buttons = (
             self.btn_heat, self.btn_freeze, self.btn_expansion, self.btn_compression,
             self.btn_heat_expansion, self.btn_heat_compression, self.btn_cool_expansion, self.btn_cool_compression,
             self.btn_off, self.btn_stop, self.btn_start, self.btn_reset,
             self.btn_isolated, self.btn_brownian, self.btn_gravity, self.btn_corner_start,
             self.btn_statistics, self.btn_graphs, self.btn_settings, self.btn_exit
-        ]
+        )
         
-        for i, btn in enumerate(buttons):
-            btn.setMinimumHeight(40)
-            btn.setStyleSheet("font-weight: bold;")
-            row = i // 4
-            col = i % 4
+        for btn, (row, col) in zip(buttons, _BUTTON_GRID):
             params_layout.addWidget(btn, row, col)
         
         # Параметры - добавляем в строку 5 (после 5 рядов кнопок: 0, 1, 2, 3, 4)
@@ -117,7 +170,9 @@ class MainWindow(QMainWindow):
         params_layout.addLayout(stats_layout, 5, 0, 1, 4)
         
         params_group.setLayout(params_layout)
-        params_group.setStyleSheet(f"QGroupBox {{ color: {group_text_color}; font-weight: bold; }}")
+        params_group.setStyleSheet(
+            f"QGroupBox {{ color: {group_text_color}; font-weight: bold; }}"
+            " QPushButton { min-height: 40px; font-weight: bold; }")
         main_layout.addWidget(params_group)
         
         # 2. Нижняя часть: логи слева, демонстрация справа
@@ -134,8 +189,17 @@ class MainWindow(QMainWindow):
         log_header.setStyleSheet(f"font-weight: bold; color: #64b5f6;")
         log_layout.addWidget(log_header)
         
-        self.log_display = QTextEdit()
+        # QPlainTextEdit вместо QTextEdit: простой документ без
+        # rich-text разметки добавляет строки за O(1), а ограничение
+        # числа блоков не даёт логу расти безгранично за долгий прогон
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(1000)
+        # Лог только дописывается: стек отмены не нужен, а перенос строк
+        # заставлял бы перелагать соседние блоки при каждой вставке
+        self.log_display.document().setUndoRedoEnabled(False)
+        self.log_display.document().setDocumentMargin(0)
+        self.log_display.setWordWrapMode(QTextOption.NoWrap)
         self.log_display.setFont(QFont("Courier", 9))
         self.log_display.setMaximumWidth(450)
         self.log_display.setStyleSheet("background-color: #1e1e1e; color: #00ff00;")
@@ -160,19 +224,27 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(bottom_widget)
         
         # Описание
-        self.log_display.append("="*70)
-        self.log_display.append("УПРАВЛЕНИЕ СИМУЛЯЦИЕЙ:")
-        self.log_display.append("="*70)
-        self.log_display.append("• Нагрев: увеличение кинетической энергии частиц")
-        self.log_display.append("• Охлаждение: уменьшение кинетической энергии")
-        self.log_display.append("• Расширение: увеличение объема сосуда")
-        self.log_display.append("• Сжатие: уменьшение объема сосуда")
-        self.log_display.append("• Стоп процесс: прекращение текущего процесса")
-        self.log_display.append("• Остановить симуляцию: полная остановка")
-        self.log_display.append("• Сбросить: перезапуск симуляции")
-        self.log_display.append("• Графики: открыть окно с графиками")
-        self.log_display.append("="*70)
-        
+        self.log_display.appendPlainText(_INTRO)
+        
+        # Строки лога за тики симуляции копятся в буфере и сливаются
+        # в документ одним редактированием ~60 раз в секунду: физика
+        # может шагать чаще, чем имеет смысл перекомпоновывать лог
+        self._log_buffer = []
+        # Последние отображённые значения: повторные setText/setStyleSheet
+        # с теми же строками не нужны (см. update_display)
+        self._last_mode = None
+        self._last_stats = (None, None, None, None)
+        self._rebuild_caches()
+        # Курсор для вставки в конец лога держим готовым: append()
+        # каждый раз создаёт курсор и подбирает форматирование блока,
+        # прямой insertText в конец документа этого не делает
+        self._log_cursor = self.log_display.textCursor()
+        self._log_cursor.movePosition(QTextCursor.End)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(16)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
         # Подключение сигналов
         self.connect_signals()
         
@@ -204,11 +276,11 @@ class MainWindow(QMainWindow):
     def connect_signals(self):
         """Подключение сигналов кнопок и обновлений"""
         # Кнопки управления
-        self.btn_heat.clicked.connect(lambda: self.simulation.set_mode("heat"))
-        self.btn_freeze.clicked.connect(lambda: self.simulation.set_mode("freeze"))
-        self.btn_expansion.clicked.connect(lambda: self.simulation.set_mode("expansion"))
-        self.btn_compression.clicked.connect(lambda: self.simulation.set_mode("compression"))
-        self.btn_off.clicked.connect(lambda: self.simulation.set_mode("OFF"))
+        self.btn_heat.clicked.connect(partial(self.simulation.set_mode, "heat"))
+        self.btn_freeze.clicked.connect(partial(self.simulation.set_mode, "freeze"))
+        self.btn_expansion.clicked.connect(partial(self.simulation.set_mode, "expansion"))
+        self.btn_compression.clicked.connect(partial(self.simulation.set_mode, "compression"))
+        self.btn_off.clicked.connect(partial(self.simulation.set_mode, "OFF"))
         self.btn_stop.clicked.connect(self.simulation.stop_simulation)
         self.btn_start.clicked.connect(self.simulation.start_simulation)
         self.btn_reset.clicked.connect(self.simulation.reset_simulation)
@@ -218,10 +290,10 @@ class MainWindow(QMainWindow):
         self.btn_exit.clicked.connect(self.close)
         
         # Комбинированные процессы
-        self.btn_heat_expansion.clicked.connect(lambda: self.simulation.set_mode("heat_expansion"))
-        self.btn_heat_compression.clicked.connect(lambda: self.simulation.set_mode("heat_compression"))
-        self.btn_cool_expansion.clicked.connect(lambda: self.simulation.set_mode("cool_expansion"))
-        self.btn_cool_compression.clicked.connect(lambda: self.simulation.set_mode("cool_compression"))
+        self.btn_heat_expansion.clicked.connect(partial(self.simulation.set_mode, "heat_expansion"))
+        self.btn_heat_compression.clicked.connect(partial(self.simulation.set_mode, "heat_compression"))
+        self.btn_cool_expansion.clicked.connect(partial(self.simulation.set_mode, "cool_expansion"))
+        self.btn_cool_compression.clicked.connect(partial(self.simulation.set_mode, "cool_compression"))
         
         # Экспериментальные режимы
         self.btn_isolated.clicked.connect(self.toggle_isolated_system)
@@ -232,36 +304,64 @@ class MainWindow(QMainWindow):
         # Обновление данных из симуляции
         self.simulation.update_signal.connect(self.update_display)
     
-    def update_display(self, volume, energy, pressure, avg_velocity, log_entry):
-        """Обновление отображения данных"""
+    def _rebuild_caches(self):
+        """
+        Пересобрать производные от конфигурации кэши UI.
+
+        Единственная точка инвалидации: всё, что выводится из
+        конфигурации, пересчитывается здесь ровно один раз на её
+        применение (из __init__ и _apply_new_config), а не в горячем
+        пути update_display.
+        """
+        # Готовые стили индикатора режима: setStyleSheet получает
+        # предсобранную строку, а не новую f-строку на смену режима
+        self._mode_styles = {
+            mode: f"background-color: {color}; padding: 5px; border-radius: 3px;"
+            for mode, color in self.config.mode_colors.to_dict_by_mode().items()
+        }
+
+    def _flush_log(self):
+        """Слить накопленные строки лога одним редактированием документа."""
+        if not self._log_buffer:
+            return
         # Проверяем, был ли пользователь внизу списка перед добавлением
         scrollbar = self.log_display.verticalScrollBar()
         was_at_bottom = scrollbar.value() >= scrollbar.maximum() - 20
-        
-        # Обновление логов
-        self.log_display.append(log_entry)
-        
+
+        # Ведущий перевод строки начинает новый блок — как append,
+        # но без его служебной возни с курсором и форматом
+        self._log_cursor.movePosition(QTextCursor.End)
+        self._log_cursor.insertText("\n" + "\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
         # Прокрутка вниз только если пользователь был внизу
         if was_at_bottom:
             scrollbar.setValue(scrollbar.maximum())
-        
-        # Обновление параметров
-        self.lbl_mode.setText(f"Режим: {self.simulation.mode}")
-        self.lbl_energy.setText(f"Энергия: {energy:.2f}")
-        self.lbl_pressure.setText(f"Давление: {pressure:.3f}")
-        self.lbl_volume.setText(f"Объем: {volume:.1f}")
-        self.lbl_velocity.setText(f"Ср.скорость: {avg_velocity:.3f}")
-        
-        # Цветовая индикация режима
-        mode_colors = self.config.mode_colors.to_dict_by_mode()
-        color = mode_colors.get(self.simulation.mode, '#f0f0f0')
-        self.lbl_mode.setStyleSheet(f"background-color: {color}; padding: 5px; border-radius: 3px;")
-        
-        # Обновляем стиль кнопки изолированной системы
-        if self.btn_isolated.isChecked():
-            self.btn_isolated.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
-        else:
-            self.btn_isolated.setStyleSheet("font-weight: bold;")
+
+    def update_display(self, volume, energy, pressure, avg_velocity, log_entry):
+        """Обновление отображения данных"""
+        # Обновление логов (запись попадёт в документ при ближайшем сливе)
+        self._log_buffer.append(log_entry)
+
+        # Обновление параметров: надписи и стили трогаются только при
+        # смене отображаемого значения — setStyleSheet перепарсивает CSS,
+        # а setText перерисовывает надпись на каждый вызов
+        mode = self.simulation.mode
+        if mode != self._last_mode:
+            self._last_mode = mode
+            self.lbl_mode.setText(f"Режим: {mode}")
+            # Цветовая индикация режима: стиль уже собран в _rebuild_caches
+            self.lbl_mode.setStyleSheet(
+                self._mode_styles.get(mode, _MODE_STYLE_DEFAULT))
+
+        stats = (f"Энергия: {energy:.2f}", f"Давление: {pressure:.3f}",
+                 f"Объем: {volume:.1f}", f"Ср.скорость: {avg_velocity:.3f}")
+        labels = (self.lbl_energy, self.lbl_pressure,
+                  self.lbl_volume, self.lbl_velocity)
+        for label, text, last in zip(labels, stats, self._last_stats):
+            if text != last:
+                label.setText(text)
+        self._last_stats = stats
     
     def toggle_isolated_system(self, checked: bool):
         """Переключить режим изолированной системы."""
@@ -269,13 +369,12 @@ class MainWindow(QMainWindow):
         self.config.experiment.isolated_system = checked
         
         # Обновляем визуальное состояние кнопки
+        self.btn_isolated.setStyleSheet(_BTN_ISOLATED_ON if checked else _BTN_INACTIVE)
         if checked:
-            self.btn_isolated.setStyleSheet("background-color: #4CAF50; color: white; font-weight: bold;")
-            self.log_display.append("🔒 Режим изолированной системы ВКЛЮЧЕН")
-            self.log_display.append("   → Нагрев/охлаждение и расширение/сжатие заблокированы")
+            self.log_display.appendPlainText("🔒 Режим изолированной системы ВКЛЮЧЕН")
+            self.log_display.appendPlainText("   → Нагрев/охлаждение и расширение/сжатие заблокированы")
         else:
-            self.btn_isolated.setStyleSheet("font-weight: bold;")
-            self.log_display.append("🔓 Режим изолированной системы ВЫКЛЮЧЕН")
+            self.log_display.appendPlainText("🔓 Режим изолированной системы ВЫКЛЮЧЕН")
     
     def toggle_brownian_mode(self, checked: bool):
         """Переключить режим броуновского движения."""
@@ -283,14 +382,13 @@ class MainWindow(QMainWindow):
         self.config.brownian.enabled = checked
         
         # Обновляем визуальное состояние кнопки
+        self.btn_brownian.setStyleSheet(_BTN_BROWNIAN_ON if checked else _BTN_INACTIVE)
         if checked:
-            self.btn_brownian.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
-            self.log_display.append("🔬 Режим броуновского движения ВКЛЮЧЕН")
-            self.log_display.append("   → Первая частица увеличена (масса и радиус)")
-            self.log_display.append("   → Отслеживание MSD активно")
+            self.log_display.appendPlainText("🔬 Режим броуновского движения ВКЛЮЧЕН")
+            self.log_display.appendPlainText("   → Первая частица увеличена (масса и радиус)")
+            self.log_display.appendPlainText("   → Отслеживание MSD активно")
         else:
-            self.btn_brownian.setStyleSheet("font-weight: bold;")
-            self.log_display.append("🔬 Режим броуновского движения ВЫКЛЮЧЕН")
+            self.log_display.appendPlainText("🔬 Режим броуновского движения ВЫКЛЮЧЕН")
     
     def toggle_gravity(self, checked: bool):
         """Переключить гравитацию."""
@@ -298,14 +396,13 @@ class MainWindow(QMainWindow):
         self.config.gravity.enabled = checked
         
         # Обновляем визуальное состояние кнопки
+        self.btn_gravity.setStyleSheet(_BTN_GRAVITY_ON if checked else _BTN_INACTIVE)
         if checked:
-            self.btn_gravity.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
-            self.log_display.append("🌍 Гравитация ВКЛЮЧЕНА")
-            self.log_display.append(f"   → g = {self.config.gravity.g}")
-            self.log_display.append("   → Частицы будут падать вниз")
+            self.log_display.appendPlainText("🌍 Гравитация ВКЛЮЧЕНА")
+            self.log_display.appendPlainText(f"   → g = {self.config.gravity.g}")
+            self.log_display.appendPlainText("   → Частицы будут падать вниз")
         else:
-            self.btn_gravity.setStyleSheet("font-weight: bold;")
-            self.log_display.append("🌍 Гравитация ВЫКЛЮЧЕНА")
+            self.log_display.appendPlainText("🌍 Гравитация ВЫКЛЮЧЕНА")
     
     def toggle_corner_start(self, checked: bool):
         """Переключить режим старта из угла."""
@@ -313,34 +410,41 @@ class MainWindow(QMainWindow):
         self.config.experiment.corner_start = checked
         
         # Обновляем визуальное состояние кнопки
+        self.btn_corner_start.setStyleSheet(_BTN_CORNER_ON if checked else _BTN_INACTIVE)
         if checked:
-            self.btn_corner_start.setStyleSheet("background-color: #9C27B0; color: white; font-weight: bold;")
-            self.log_display.append("📐 Режим СТАРТ ИЗ УГЛА ВКЛЮЧЕН")
-            self.log_display.append("   → Частицы начинают в левом верхнем углу")
-            self.log_display.append("   → Для демонстрации 2-го закона термодинамики")
+            self.log_display.appendPlainText("📐 Режим СТАРТ ИЗ УГЛА ВКЛЮЧЕН")
+            self.log_display.appendPlainText("   → Частицы начинают в левом верхнем углу")
+            self.log_display.appendPlainText("   → Для демонстрации 2-го закона термодинамики")
         else:
-            self.btn_corner_start.setStyleSheet("font-weight: bold;")
-            self.log_display.append("📐 Режим старт из угла ВЫКЛЮЧЕН")
+            self.log_display.appendPlainText("📐 Режим старт из угла ВЫКЛЮЧЕН")
     
     def show_graphs(self):
         """Показать окно с графиками"""
-        # Всегда создаем новое окно, чтобы переподключить сигнал
-        if self.graph_window is not None:
-            self.graph_window.close()
-            self.graph_window = None
-        self.graph_window = GraphWindow(self.simulation, self, self.config)
+        # Окно переиспользуется: сигнал переподключается в его showEvent,
+        # а пересоздание фигур matplotlib на каждый клик слишком дорого
+        if self.graph_window is None:
+            self.graph_window = GraphWindow(self.simulation, self, self.config)
         self.graph_window.show()
         self.graph_window.raise_()
     
     def show_settings(self):
         """Показать окно настроек."""
-        self.config_window = ConfigWindow(self.config, self)
-        self.config_window.config_applied.connect(self._apply_new_config)
+        # Диалог создаётся один раз: повторные открытия лишь обновляют
+        # виджеты из текущей конфигурации, а одноразовый connect не даёт
+        # слотам config_applied накапливаться
+        if self.config_window is None:
+            self.config_window = ConfigWindow(self.config, self)
+            self.config_window.config_applied.connect(self._apply_new_config)
+        else:
+            self.config_window.set_config(self.config)
         self.config_window.exec_()
     
     def _apply_new_config(self, new_config: AppConfig):
         """Применить новую конфигурацию."""
         self.config = new_config
+        self._rebuild_caches()
+        # Цвет режима мог измениться — форсируем перекраску индикатора
+        self._last_mode = None
         
         # Обновляем лейбл количества частиц
         self.lbl_particles.setText(f"Частиц: {self.config.particles.count}")
@@ -356,35 +460,21 @@ class MainWindow(QMainWindow):
     def show_statistics(self):
         """Показать статистику"""
         stats = self.simulation.get_statistics()
-        
-        stats_text = f"""
-        СТАТИСТИКА СИМУЛЯЦИИ:
-        ======================
-        Количество частиц: {stats['particle_count']}
-        Текущий объем: {stats['current_volume']:.1f}
-        Текущее давление: {stats['current_pressure']:.3f}
-        Общая энергия: {stats['total_energy']:.2f}
-        
-        СКОРОСТИ:
-        ----------
-        Средняя скорость: {stats['mean_velocity']:.3f}
-        Стандартное отклонение: {stats['std_velocity']:.3f}
-        Максимальная скорость: {stats['max_velocity']:.3f}
-        Минимальная скорость: {stats['min_velocity']:.3f}
-        
-        РЕЖИМ: {self.simulation.mode}
-        ВРЕМЯ: {self.simulation.NOW_TIME:.1f}
-        """
-        
-        self.log_display.append("\n" + "="*70)
-        self.log_display.append("СТАТИСТИКА:")
-        self.log_display.append("="*70)
-        for line in stats_text.strip().split('\n'):
-            self.log_display.append(line)
-        self.log_display.append("="*70)
+        body = _STATS_TEMPLATE.format(
+            mode=self.simulation.mode,
+            time=self.simulation.NOW_TIME,
+            **stats,
+        )
+
+        # Весь блок статистики уходит в документ одной вставкой
+        separator = "=" * 70
+        self.log_display.appendPlainText("\n".join([
+            "", separator, "СТАТИСТИКА:", separator, body, separator,
+        ]))
     
     def closeEvent(self, event):
         """Обработка закрытия окна"""
+        self._log_timer.stop()
         self.simulation.stop_simulation()
         
         if self.graph_window and self.graph_window.isVisible():